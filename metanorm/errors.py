@@ -2,9 +2,39 @@
 
 class MetadataNormalizationError(Exception):
     """Exception raised by normalizers when they cannot normalize
-    some metadata
+    some metadata.
+    It can be created with a message like other exceptions, or with
+    the raw metadata and the name of the getter which failed to
+    process it. In the latter case, the message is only built when the
+    exception is converted to a string, since the representation of
+    large records is costly and is not needed when the error is caught.
+    The representation of the raw metadata is truncated to
+    `max_metadata_length` characters, unless it is None.
     """
 
+    max_metadata_length = None
+
+    def __init__(self, message=None, raw_metadata=None, getter_name=None,
+                 max_metadata_length=None):
+        super().__init__(*(() if message is None else (message,)))
+        self.message = message
+        self.raw_metadata = raw_metadata
+        self.getter_name = getter_name
+        if max_metadata_length is not None:
+            self.max_metadata_length = max_metadata_length
+
+    def __str__(self):
+        if self.message is not None or self.getter_name is None:
+            return super().__str__()
+        metadata = repr(self.raw_metadata)
+        if self.max_metadata_length is not None and len(metadata) > self.max_metadata_length:
+            metadata = f"{metadata[:self.max_metadata_length]}..."
+        return f"{self.getter_name} was unable to process the following metadata: {metadata}"
+
+    def __reduce__(self):
+        return (self.__class__,
+                (self.message, self.raw_metadata, self.getter_name, self.max_metadata_length))
+
 
 class NoNormalizerFound(Exception):
     """Exception raised by a handler when it was not able to find a
@@ -1,23 +1,100 @@
 """This module contains handler classes which control how normalizers
 are used
 """
+import asyncio
+import collections
+import concurrent.futures
+import importlib
+import itertools
 import logging
+import os
+import sys
+import threading
 
+import metanorm.manifest as manifest
 import metanorm.normalizers as normalizers
 import metanorm.utils as utils
-from .errors import NoNormalizerFound
+from .errors import MetadataNormalizationError, NoNormalizerFound
 
 logger = logging.getLogger(__name__)
 
 
+class LazyNormalizer():
+    """Stands for a normalizer whose module has not been imported yet.
+    The module is imported and the normalizer is instantiated the first
+    time the normalizer is used
+    """
+
+    def __init__(self, manifest_entry):
+        self.manifest_entry = manifest_entry
+        self.url_prefixes = manifest_entry['url_prefixes']
+        self._normalizer = None
+
+    def __repr__(self):
+        return f"<lazy {manifest.get_entry_key(self.manifest_entry)}>"
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.normalizer, name)
+
+    @property
+    def normalizer(self):
+        """The actual normalizer"""
+        if self._normalizer is None:
+            module = importlib.import_module(self.manifest_entry['module'])
+            self._normalizer = getattr(module, self.manifest_entry['name'])()
+        return self._normalizer
+
+    def check(self, raw_metadata):
+        return self.normalizer.check(raw_metadata)
+
+    def probe(self, raw_metadata):
+        return self.normalizer.probe(raw_metadata)
+
+    def normalize(self, raw_metadata, *args, **kwargs):
+        return self.normalizer.normalize(raw_metadata, *args, **kwargs)
+
+
+def get_normalizer_key(normalizer):
+    """Returns the fully qualified name of the class of a normalizer,
+    which identifies it in the dispatch state of the handlers
+    """
+    if isinstance(normalizer, LazyNormalizer):
+        return manifest.get_entry_key(normalizer.manifest_entry)
+    return manifest.get_class_key(normalizer.__class__)
+
+
 class MetadataHandler():
     """Handler which builds a list of of subclasses of a base
     normalizer class
     """
 
+    # number of normalizer lookups between two reorderings of the
+    # normalizers which are not indexed by URL prefix
+    reorder_interval = 1000
+    # maximum number of record signatures for which the matching
+    # normalizer is remembered
+    dispatch_memo_size = 256
+    # number of URL path segments included in the record signatures
+    signature_path_segments = 2
+
     def __init__(self, base_class=None):
         """Builds a list of normalizers, instantiating one per subclass
-        of `base_class`
+        of `base_class`. The subclasses whose module has not been
+        imported yet are found in the manifest and represented by
+        LazyNormalizer objects, so that their module is only imported
+        if they are candidates for some raw metadata.
+        Normalizers which declare URL prefixes are indexed by prefix,
+        the others are kept in a list which is always tried after
+        the indexed normalizers. This list is initially sorted by class
+        name, then every `reorder_interval` lookups by decreasing
+        number of hits (see `reorder()`).
+        The normalizer found for a record is remembered for records
+        with the same signature (see `get_record_signature()`).
+        The handler can be shared between threads: the counters are
+        updated under a lock, and reordering replaces the list of
+        normalizers instead of sorting it in place.
         """
         if base_class is None:
             base_class = normalizers.MetadataNormalizer
@@ -26,13 +103,399 @@ class MetadataHandler():
             normalizer_class()
             for normalizer_class in utils.get_all_subclasses(base_class)
         ]
+        self.normalizers.extend(
+            LazyNormalizer(entry)
+            for entry in manifest.get_subclass_entries(base_class)
+            if entry['module'] not in sys.modules
+        )
+        self.normalizers.sort(key=get_normalizer_key)
+        self._hits = collections.Counter()
+        self._lookups = 0
+        self._dispatch_lock = threading.Lock()
+        self._dispatch_memo = utils.LRUCache(maxsize=self.dispatch_memo_size)
 
-    def get_parameters(self, raw_metadata):
-        """Loop through normalizers and uses the first one whose
-        `check()` method returns true to normalize the raw metadata
-        """
+        self._url_index = utils.PrefixTable()
+        self._unindexed_normalizers = []
         for normalizer in self.normalizers:
-            if normalizer.check(raw_metadata):
+            if normalizer.url_prefixes:
+                for prefix in normalizer.url_prefixes:
+                    self._url_index.add(prefix, normalizer)
+            else:
+                self._unindexed_normalizers.append(normalizer)
+
+    def _get_candidates(self, raw_metadata):
+        """Returns an iterator over the normalizers which might be able
+        to deal with the raw metadata: first the ones with a URL prefix
+        matching the 'url' attribute, then the ones which do not
+        declare any prefix
+        """
+        url = raw_metadata.get('url')
+        indexed_normalizers = self._url_index.find_all(url) if isinstance(url, str) else ()
+        return itertools.chain(indexed_normalizers, self._unindexed_normalizers)
+
+    def get_record_signature(self, raw_metadata):
+        """Returns a value shared by records which probably come from
+        the same source: the scheme, host and first
+        `signature_path_segments` directories of the 'url' attribute if
+        there is one, the set of attributes otherwise
+        """
+        url = raw_metadata.get('url')
+        if isinstance(url, str):
+            directory = url.rsplit('/', 1)[0]
+            return tuple(directory.split('/', 3 + self.signature_path_segments)[
+                :3 + self.signature_path_segments])
+        return frozenset(raw_metadata)
+
+    def _find_normalizer(self, raw_metadata):
+        """Returns the first candidate normalizer whose `probe()`
+        method returns a match for the raw metadata, and counts a hit
+        for it. The normalizer found for the last records with the same
+        signature is probed first, the candidates are only scanned if it
+        does not match
+        """
+        with self._dispatch_lock:
+            self._lookups += 1
+            reorder_due = self._lookups % self.reorder_interval == 0
+        if reorder_due:
+            self.reorder()
+
+        signature = self.get_record_signature(raw_metadata)
+        found, normalizer = self._dispatch_memo.get(signature)
+        if found and normalizer.probe(raw_metadata) is not None:
+            self._count_hit(normalizer)
+            return normalizer
+
+        for normalizer in self._get_candidates(raw_metadata):
+            if normalizer.probe(raw_metadata) is not None:
+                self._count_hit(normalizer)
+                if isinstance(normalizer, LazyNormalizer):
+                    normalizer = normalizer.normalizer
                 logger.debug("%s will be used", normalizer.__class__.__name__)
-                return normalizer.normalize(raw_metadata)
+                self._dispatch_memo.set(signature, normalizer)
+                return normalizer
         raise NoNormalizerFound(f"No matching normalizer was found in {self.normalizers}")
+
+    def _count_hit(self, normalizer):
+        """Counts a hit for `normalizer`"""
+        with self._dispatch_lock:
+            self._hits[get_normalizer_key(normalizer)] += 1
+
+    def reorder(self):
+        """Sorts the normalizers which are not indexed by URL prefix by
+        decreasing number of hits, then by name, so that the most
+        frequently used ones are tried first. The sorted list replaces
+        the current one, which other threads might be going through
+        """
+        with self._dispatch_lock:
+            hits = self._hits.copy()
+        self._unindexed_normalizers = sorted(
+            self._unindexed_normalizers,
+            key=lambda normalizer: (
+                -hits[get_normalizer_key(normalizer)], get_normalizer_key(normalizer)))
+
+    def get_dispatch_state(self):
+        """Returns the hit counters and the order of the normalizers
+        which are not indexed by URL prefix, as a JSON serializable
+        dictionary. It can be restored with `set_dispatch_state()` to
+        reproduce the dispatch order of a previous run.
+        """
+        with self._dispatch_lock:
+            return {
+                'lookups': self._lookups,
+                'hits': dict(self._hits),
+                'order': [
+                    get_normalizer_key(normalizer) for normalizer in self._unindexed_normalizers
+                ],
+            }
+
+    def set_dispatch_state(self, state):
+        """Restores a state returned by `get_dispatch_state()`. The
+        normalizers which are not in the state are placed at the end,
+        sorted by name
+        """
+        with self._dispatch_lock:
+            self._lookups = state['lookups']
+            self._hits = collections.Counter(state['hits'])
+        positions = {key: position for position, key in enumerate(state['order'])}
+        self._unindexed_normalizers = sorted(
+            self._unindexed_normalizers,
+            key=lambda normalizer: (
+                positions.get(get_normalizer_key(normalizer), len(positions)),
+                get_normalizer_key(normalizer)))
+
+    @staticmethod
+    def _normalize(normalizer, raw_metadata, fields):
+        """Normalizes the raw metadata, only passing `fields` to the
+        normalizer if a projection is requested
+        """
+        if fields is None:
+            return normalizer.normalize(raw_metadata)
+        return normalizer.normalize(raw_metadata, fields=fields)
+
+    def get_parameters(self, raw_metadata, fields=None):
+        """Loop through the candidate normalizers and uses the first
+        one whose `probe()` method returns a match to normalize the raw
+        metadata.
+        If `fields` is given, only these fields are normalized. The
+        normalizer must support it (see
+        `GeoSPaaSMetadataNormalizer.normalize()`).
+        The summaries of the aggregated warnings (see
+        `utils.WarningCollector`) which are due are logged afterwards.
+        """
+        try:
+            with utils.record_context():
+                return self._normalize(self._find_normalizer(raw_metadata), raw_metadata, fields)
+        finally:
+            utils.flush_warning_collectors(due_only=True)
+
+    def get_parameters_many(self, raw_metadata_iterable, return_exceptions=True, fields=None):
+        """Generator which normalizes each raw metadata dictionary
+        from `raw_metadata_iterable` and yields the results in the same
+        order. The iterable is consumed lazily, so it can be a
+        generator over a large harvest.
+        If `return_exceptions` is True, the MetadataNormalizationError
+        or NoNormalizerFound exception raised for a record is yielded
+        in place of its normalized metadata, otherwise it is raised.
+        Records from the same source usually come in sequence, so the
+        normalizer used for the previous record is checked first.
+        `fields` works like in `get_parameters()`.
+        The summaries of the aggregated warnings (see
+        `utils.WarningCollector`) are logged at the end of the batch.
+        """
+        previous_normalizer = None
+        try:
+            for raw_metadata in raw_metadata_iterable:
+                try:
+                    with utils.record_context():
+                        if (previous_normalizer is not None
+                                and previous_normalizer.probe(raw_metadata) is not None):
+                            normalizer = previous_normalizer
+                        else:
+                            normalizer = self._find_normalizer(raw_metadata)
+                            previous_normalizer = normalizer
+                        result = self._normalize(normalizer, raw_metadata, fields)
+                except (MetadataNormalizationError, NoNormalizerFound) as error:
+                    if not return_exceptions:
+                        raise
+                    result = error
+                yield result
+        finally:
+            utils.flush_warning_collectors()
+
+
+# handler used in the worker processes of a ParallelMetadataHandler
+_worker_handler = None
+
+
+def _init_worker(base_class, vocabulary_snapshot=None):
+    """Builds the handler of a worker process. This is done once per
+    process, so the normalizers are instantiated and the vocabularies
+    are loaded only once. If a vocabulary snapshot path is given, the
+    vocabulary indexes are loaded from it instead of being rebuilt
+    """
+    global _worker_handler  # pylint: disable=global-statement
+    if vocabulary_snapshot is not None:
+        utils.load_vocabulary_snapshot(vocabulary_snapshot)
+    _worker_handler = MetadataHandler(base_class)
+
+
+def _normalize_chunk(raw_metadata_chunk, fields=None):
+    """Normalizes a list of raw metadata in a worker process. Errors
+    are returned instead of raised, so that one invalid record does
+    not make the whole chunk fail
+    """
+    return list(_worker_handler.get_parameters_many(
+        raw_metadata_chunk, return_exceptions=True, fields=fields))
+
+
+class ParallelMetadataHandler():
+    """Handler which spreads the normalization over a pool of worker
+    processes. Each worker process builds its own MetadataHandler.
+    Since it is sent to the workers, `base_class` must be importable
+    from a module.
+    The raw metadata is sent to the workers in chunks of `chunksize`
+    records, and at most two chunks per worker are processed or
+    waiting to be processed at any time.
+    If `vocabulary_snapshot` is the path of a vocabulary snapshot file,
+    it is built if needed when the pool is created, and the workers
+    load their vocabulary indexes from it.
+    """
+
+    def __init__(self, base_class=None, workers=None, chunksize=100, vocabulary_snapshot=None):
+        self.base_class = base_class
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.vocabulary_snapshot = vocabulary_snapshot
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _get_executor(self):
+        """Returns the process pool, which is created on first use"""
+        if self._executor is None:
+            if self.vocabulary_snapshot is not None:
+                utils.ensure_vocabulary_snapshot(self.vocabulary_snapshot)
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.base_class, self.vocabulary_snapshot))
+        return self._executor
+
+    def close(self):
+        """Shuts the worker processes down"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def get_parameters(self, raw_metadata, fields=None):
+        """Normalizes one raw metadata dictionary in a worker process.
+        See `MetadataHandler.get_parameters()`
+        """
+        result = self._get_executor().submit(_normalize_chunk, [raw_metadata], fields).result()[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def get_parameters_many(self, raw_metadata_iterable, return_exceptions=True, fields=None):
+        """Generator which normalizes the raw metadata from
+        `raw_metadata_iterable` in the worker processes and yields the
+        results in the same order. See
+        `MetadataHandler.get_parameters_many()`.
+        If the generator is not consumed to the end, the chunks which
+        have not started yet are cancelled.
+        """
+        executor = self._get_executor()
+        raw_metadata_iterator = iter(raw_metadata_iterable)
+        chunks = iter(lambda: list(itertools.islice(raw_metadata_iterator, self.chunksize)), [])
+        pending = collections.deque()
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(_normalize_chunk, chunk, fields))
+                if len(pending) >= 2 * self.workers:
+                    yield from self._unpack_results(pending.popleft().result(), return_exceptions)
+            while pending:
+                yield from self._unpack_results(pending.popleft().result(), return_exceptions)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def _unpack_results(results, return_exceptions):
+        """Yields the results of a chunk, raising the errors if
+        `return_exceptions` is False
+        """
+        for result in results:
+            if isinstance(result, Exception) and not return_exceptions:
+                raise result
+            yield result
+
+
+async def _iterate(iterable):
+    """Iterates asynchronously over a synchronous or asynchronous
+    iterable
+    """
+    if hasattr(iterable, '__aiter__'):
+        async for item in iterable:
+            yield item
+    else:
+        for item in iterable:
+            yield item
+
+
+class AsyncMetadataHandler():
+    """Handler meant to be used in asyncio event loops. The
+    normalization runs in an executor to avoid blocking the loop.
+    At most `max_concurrency` records are normalized at the same time.
+    By default, a thread pool with `max_concurrency` threads is used,
+    another executor can be provided using the `executor` argument.
+    """
+
+    def __init__(self, base_class=None, max_concurrency=4, executor=None):
+        self.handler = MetadataHandler(base_class)
+        self.max_concurrency = max_concurrency
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _get_executor(self):
+        """Returns the executor, which is created on first use if none
+        was provided
+        """
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_concurrency)
+        return self._executor
+
+    def _get_semaphore(self):
+        """Returns the semaphore which limits the number of concurrent
+        calls to get_parameters(). It is created on first use so that
+        it belongs to the running event loop
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def close(self):
+        """Shuts the executor down if it was created by the handler"""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _run_in_executor(self, raw_metadata, fields=None):
+        """Schedules the normalization of the raw metadata in the
+        executor and returns the corresponding future
+        """
+        return asyncio.get_running_loop().run_in_executor(
+            self._get_executor(), self.handler.get_parameters, raw_metadata, fields)
+
+    async def get_parameters(self, raw_metadata, fields=None):
+        """Normalizes the raw metadata without blocking the event loop.
+        See `MetadataHandler.get_parameters()`
+        """
+        async with self._get_semaphore():
+            return await self._run_in_executor(raw_metadata, fields)
+
+    async def get_parameters_many(self, raw_metadata_iterable, return_exceptions=True,
+                                  fields=None):
+        """Asynchronous generator which normalizes the raw metadata
+        from `raw_metadata_iterable`, which can be a synchronous or
+        asynchronous iterable, and yields the results in the same
+        order. See `MetadataHandler.get_parameters_many()`.
+        The next record is only taken from the iterable when less than
+        `max_concurrency` records are being normalized, so that a fast
+        producer does not pile up records in memory.
+        """
+        pending = collections.deque()
+        try:
+            async for raw_metadata in _iterate(raw_metadata_iterable):
+                pending.append(self._run_in_executor(raw_metadata, fields))
+                if len(pending) >= self.max_concurrency:
+                    yield await self._get_result(pending.popleft(), return_exceptions)
+            while pending:
+                yield await self._get_result(pending.popleft(), return_exceptions)
+        finally:
+            for future in pending:
+                future.cancel()
+            utils.flush_warning_collectors()
+
+    @staticmethod
+    async def _get_result(future, return_exceptions):
+        """Waits for the result of `future`. Normalization errors are
+        returned if `return_exceptions` is True
+        """
+        try:
+            return await future
+        except (MetadataNormalizationError, NoNormalizerFound) as error:
+            if not return_exceptions:
+                raise
+            return error
@@ -0,0 +1,175 @@
+"""Manifest of the normalizer classes. It makes it possible to know
+which normalizers exist, what they inherit from and which URL prefixes
+they declare without importing the normalizer modules.
+The manifest is stored in `metanorm/normalizers/_manifest.py`. It must
+be regenerated after adding or modifying a normalizer class by running:
+
+    python -m metanorm.manifest
+"""
+import importlib
+import os.path
+import pkgutil
+import sys
+
+PACKAGE_NAME = 'metanorm.normalizers'
+MANIFEST_MODULE_NAME = f"{PACKAGE_NAME}._manifest"
+
+
+def get_class_key(cls):
+    """Returns the fully qualified name of a class, as used in the
+    manifest
+    """
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def get_entry_key(entry):
+    """Returns the fully qualified name of the class described by a
+    manifest entry
+    """
+    return f"{entry['module']}.{entry['name']}"
+
+
+def generate_manifest(package_name=PACKAGE_NAME):
+    """Imports all the modules of the package and returns a tuple of
+    manifest entries for the normalizer classes defined in them.
+    Each entry is a dictionary with the following keys:
+      - module: the name of the module in which the class is defined
+      - name: the name of the class
+      - bases: the fully qualified names of the normalizer base
+        classes of the class
+      - url_prefixes: the URL prefixes declared by the normalizer
+    """
+    from .normalizers.base import MetadataNormalizer
+
+    package = importlib.import_module(package_name)
+    module_names = [package_name]
+    for module_info in pkgutil.walk_packages(package.__path__, f"{package_name}."):
+        if not module_info.name.rsplit('.', 1)[-1].startswith('_'):
+            importlib.import_module(module_info.name)
+            module_names.append(module_info.name)
+
+    entries = []
+    for module_name in sorted(module_names):
+        for cls in vars(sys.modules[module_name]).values():
+            if (isinstance(cls, type) and issubclass(cls, MetadataNormalizer)
+                    and cls.__module__ == module_name):
+                entries.append({
+                    'module': module_name,
+                    'name': cls.__qualname__,
+                    'bases': tuple(
+                        get_class_key(base) for base in cls.__bases__
+                        if issubclass(base, MetadataNormalizer)),
+                    'url_prefixes': tuple(cls().url_prefixes),
+                })
+    return tuple(entries)
+
+
+def _format_tuple(values, indent):
+    """Returns a representation of a tuple of strings with one item
+    per line
+    """
+    if not values:
+        return '()'
+    lines = ['(']
+    lines.extend(f"{indent}    {value!r}," for value in values)
+    lines.append(f"{indent})")
+    return '\n'.join(lines)
+
+
+def write_manifest(path=None, package_name=PACKAGE_NAME):
+    """Generates the manifest and writes it as a Python module"""
+    if path is None:
+        path = os.path.join(os.path.dirname(__file__), 'normalizers', '_manifest.py')
+
+    lines = [
+        '"""Manifest of the normalizer classes.',
+        'Generated by `python -m metanorm.manifest`, do not edit by hand.',
+        '"""',
+        '',
+        'NORMALIZERS = (',
+    ]
+    for entry in generate_manifest(package_name):
+        lines.extend([
+            '    {',
+            f"        'module': {entry['module']!r},",
+            f"        'name': {entry['name']!r},",
+            f"        'bases': {_format_tuple(entry['bases'], ' ' * 8)},",
+            f"        'url_prefixes': {_format_tuple(entry['url_prefixes'], ' ' * 8)},",
+            '    },',
+        ])
+    lines.append(')')
+
+    with open(path, 'w') as manifest_file:
+        manifest_file.write('\n'.join(lines) + '\n')
+
+
+def get_manifest():
+    """Returns the entries of the manifest. If the manifest module
+    does not exist, the manifest is generated, which imports all the
+    normalizer modules
+    """
+    try:
+        return importlib.import_module(MANIFEST_MODULE_NAME).NORMALIZERS
+    except ImportError:
+        return generate_manifest()
+
+
+def get_subclass_entries(base_class):
+    """Returns the manifest entries of all the subclasses of
+    `base_class`, in the manifest order
+    """
+    entries = get_manifest()
+    found_keys = {get_class_key(base_class)}
+    previous_count = 0
+    while len(found_keys) != previous_count:
+        previous_count = len(found_keys)
+        for entry in entries:
+            if any(base in found_keys for base in entry['bases']):
+                found_keys.add(get_entry_key(entry))
+    return [
+        entry for entry in entries
+        if get_entry_key(entry) in found_keys and get_entry_key(entry) != get_class_key(base_class)
+    ]
+
+
+def lazy_export(package__all__, package_name, base_class):
+    """Append `base_class` and all of its subclasses listed in the
+    manifest for the package to `package__all__`. Returns a function
+    meant to be used as the package's module-level `__getattr__`: the
+    normalizer classes and sub-packages are imported the first time
+    they are accessed.
+    This is meant to be used in __init__.py files to make normalizer
+    classes easily importable.
+    """
+    entries = {
+        entry['name']: entry
+        for entry in get_subclass_entries(base_class)
+        if entry['module'].startswith(f"{package_name}.")
+    }
+    package__all__.append(base_class.__name__)
+    package__all__.extend(entries)
+
+    def package_getattr(name):
+        if name.startswith('_'):
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+        entry = entries.get(name)
+        if entry is not None:
+            value = getattr(importlib.import_module(entry['module']), name)
+        else:
+            module_name = f"{package_name}.{name}"
+            try:
+                value = importlib.import_module(module_name)
+            except ModuleNotFoundError as error:
+                if error.name != module_name:
+                    raise
+                raise AttributeError(
+                    f"module {package_name!r} has no attribute {name!r}") from None
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    return package_getattr
+
+
+if __name__ == '__main__':
+    write_manifest()
@@ -1,12 +1,13 @@
 """This package contains normalizers for different types of metadata.
 To add a normalizer, create a class which inherits from
 MetadataNormalizer. Put it in a new module in the 'normalizers' folder,
-and don't forget to write tests!
+update the manifest by running `python -m metanorm.manifest`, and
+don't forget to write tests!
+The normalizer modules are only imported when one of their classes is
+used.
 """
-import os.path
-
 from .base import MetadataNormalizer
-from ..utils import export_subclasses
+from ..manifest import lazy_export
 
 __all__ = []
-export_subclasses(__all__, __package__, os.path.dirname(__file__), MetadataNormalizer)
+__getattr__ = lazy_export(__all__, __package__, MetadataNormalizer)
@@ -0,0 +1,273 @@
+"""Manifest of the normalizer classes.
+Generated by `python -m metanorm.manifest`, do not edit by hand.
+"""
+
+NORMALIZERS = (
+    {
+        'module': 'metanorm.normalizers.base',
+        'name': 'MetadataNormalizer',
+        'bases': (),
+        'url_prefixes': (),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.aviso',
+        'name': 'AVISOAltimetryMetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.base.GeoSPaaSMetadataNormalizer',
+        ),
+        'url_prefixes': (),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.base',
+        'name': 'GeoSPaaSMetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.base.MetadataNormalizer',
+        ),
+        'url_prefixes': (),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.ceda_esa_cci',
+        'name': 'CEDAESACCIMetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.base.GeoSPaaSMetadataNormalizer',
+        ),
+        'url_prefixes': (
+            'ftp://ftp.ceda.ac.uk/neodc/esacci/sst/data/CDR_v2/Climatology/',
+            'ftp://anon-ftp.ceda.ac.uk/neodc/esacci/sst/data/CDR_v2/Climatology/',
+        ),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.cmems',
+        'name': 'CMEMSMetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.base.GeoSPaaSMetadataNormalizer',
+        ),
+        'url_prefixes': (),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.cmems',
+        'name': 'CMEMS008046MetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.cmems.CMEMSMetadataNormalizer',
+        ),
+        'url_prefixes': (
+            'ftp://nrt.cmems-du.eu/Core/SEALEVEL_GLO_PHY_L4_NRT_OBSERVATIONS_008_046',
+        ),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.cmems',
+        'name': 'CMEMS015003MetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.cmems.CMEMSMetadataNormalizer',
+        ),
+        'url_prefixes': (
+            'ftp://nrt.cmems-du.eu/Core/MULTIOBS_GLO_PHY_NRT_015_003',
+        ),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.cmems',
+        'name': 'CMEMS001024MetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.cmems.CMEMSMetadataNormalizer',
+        ),
+        'url_prefixes': (
+            'ftp://nrt.cmems-du.eu/Core/GLOBAL_ANALYSIS_FORECAST_PHY_001_024',
+        ),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.cmems',
+        'name': 'CMEMS006013MetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.cmems.CMEMSMetadataNormalizer',
+        ),
+        'url_prefixes': (
+            'ftp://nrt.cmems-du.eu/Core/MEDSEA_ANALYSISFORECAST_PHY_006_013',
+        ),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.cmems',
+        'name': 'CMEMS005001MetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.cmems.CMEMSMetadataNormalizer',
+        ),
+        'url_prefixes': (
+            'ftp://nrt.cmems-du.eu/Core/IBI_ANALYSISFORECAST_PHY_005_001',
+        ),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.cmems',
+        'name': 'CMEMS002003MetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.cmems.CMEMSMetadataNormalizer',
+        ),
+        'url_prefixes': (
+            'ftp://my.cmems-du.eu/Core/ARCTIC_MULTIYEAR_PHY_002_003',
+        ),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.cmems',
+        'name': 'CMEMS002001aMetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.cmems.CMEMSMetadataNormalizer',
+        ),
+        'url_prefixes': (
+            'ftp://nrt.cmems-du.eu/Core/ARCTIC_ANALYSIS_FORECAST_PHYS_002_001_a',
+        ),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.cmems',
+        'name': 'CMEMS002001MetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.cmems.CMEMSMetadataNormalizer',
+        ),
+        'url_prefixes': (),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.cmems',
+        'name': 'CMEMS002004MetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.cmems.CMEMSMetadataNormalizer',
+        ),
+        'url_prefixes': (),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.cmems',
+        'name': 'CMEMS001027MetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.cmems.CMEMSMetadataNormalizer',
+        ),
+        'url_prefixes': (
+            'ftp://nrt.cmems-du.eu/Core/GLOBAL_ANALYSISFORECAST_WAV_001_027',
+        ),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.cmems',
+        'name': 'CMEMS001028MetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.cmems.CMEMSMetadataNormalizer',
+        ),
+        'url_prefixes': (
+            'ftp://nrt.cmems-du.eu/Core/GLOBAL_ANALYSIS_FORECAST_BIO_001_028',
+        ),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.cmems_in_situ_tac',
+        'name': 'CMEMSInSituTACMetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.base.GeoSPaaSMetadataNormalizer',
+        ),
+        'url_prefixes': (),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.cpom',
+        'name': 'CPOMAltimetryMetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.base.GeoSPaaSMetadataNormalizer',
+        ),
+        'url_prefixes': (),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.creodias',
+        'name': 'CreodiasEOFinderMetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.base.GeoSPaaSMetadataNormalizer',
+        ),
+        'url_prefixes': (),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.earthdata_cmr',
+        'name': 'EarthdataCMRMetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.base.GeoSPaaSMetadataNormalizer',
+        ),
+        'url_prefixes': (),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.gportal_gcom',
+        'name': 'GPortalGCOMAMSR2L3MetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.base.GeoSPaaSMetadataNormalizer',
+        ),
+        'url_prefixes': (
+            'ftp://ftp.gportal.jaxa.jp/standard/GCOM-W/GCOM-W.AMSR2/L3.SST',
+        ),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.nextsim',
+        'name': 'NextsimMetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.base.GeoSPaaSMetadataNormalizer',
+        ),
+        'url_prefixes': (),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.noaa_hycom',
+        'name': 'NOAAHYCOMMetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.base.GeoSPaaSMetadataNormalizer',
+        ),
+        'url_prefixes': (
+            'ftp://ftp.opc.ncep.noaa.gov/grids/operational/GLOBALHYCOM/Navy',
+        ),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.noaa_rtofs',
+        'name': 'NOAARTOFSMetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.base.GeoSPaaSMetadataNormalizer',
+        ),
+        'url_prefixes': (
+            'ftp://ftpprd.ncep.noaa.gov/pub/data/nccf/com/rtofs/prod',
+        ),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.osisaf',
+        'name': 'OSISAFMetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.base.GeoSPaaSMetadataNormalizer',
+        ),
+        'url_prefixes': (),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.podaac',
+        'name': 'PODAACMetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.base.GeoSPaaSMetadataNormalizer',
+        ),
+        'url_prefixes': (
+            'https://opendap.jpl.nasa.gov/opendap/',
+        ),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.radarsat2_csv',
+        'name': 'Radarsat2CSVMetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.base.GeoSPaaSMetadataNormalizer',
+        ),
+        'url_prefixes': (),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.remss_gmi',
+        'name': 'REMSSGMIMetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.base.GeoSPaaSMetadataNormalizer',
+        ),
+        'url_prefixes': (
+            'ftp://ftp.remss.com/gmi',
+        ),
+    },
+    {
+        'module': 'metanorm.normalizers.geospaas.scihub_odata',
+        'name': 'ScihubODataMetadataNormalizer',
+        'bases': (
+            'metanorm.normalizers.geospaas.base.GeoSPaaSMetadataNormalizer',
+        ),
+        'url_prefixes': (
+            'https://apihub.copernicus.eu/apihub/odata/v1',
+            'https://scihub.copernicus.eu/apihub/odata/v1',
+            'https://apihub.copernicus.eu/dhus/odata/v1',
+            'https://scihub.copernicus.eu/dhus/odata/v1',
+            'https://colhub.met.no/odata/v1',
+        ),
+    },
+)
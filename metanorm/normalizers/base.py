@@ -5,6 +5,12 @@ MetadataNormalizer
 class MetadataNormalizer():
     """Base class for all metadata normalizers"""
 
+    # Prefixes of the 'url' attribute of the raw metadata that the
+    # normalizer can deal with. When this is not empty, the handler
+    # only calls `check()` for raw metadata whose URL starts with one
+    # of the prefixes
+    url_prefixes = ()
+
     def check(self, raw_metadata):
         """Returns a boolean indicating whether the normalizer is
         capable of handling the raw metadata.
@@ -12,6 +18,19 @@ class MetadataNormalizer():
         """
         return False
 
+    def probe(self, raw_metadata):
+        """Returns a truthy match object if the normalizer is capable
+        of handling the raw metadata, None otherwise. This is what the
+        handlers use to choose a normalizer, so it should not use
+        exceptions to reject raw metadata.
+        The handlers probe and normalize a record in the same
+        `utils.record_context`, so a match obtained from a function
+        decorated with `utils.per_record` is reused by the getters
+        which call the same function.
+        By default, relies on `check()`.
+        """
+        return self.check(raw_metadata) or None
+
     def normalize(self, raw_metadata):
         """Normalizes the raw metadata. Should return a dictionary"""
         raise NotImplementedError
@@ -3,10 +3,8 @@ necessary to instantiate GeoSPaaS Datasets.
 All normalizers in this package should inherit from
 GeoSPaaSMetadataNormalizer.
 """
-import os.path
-
 from .base import GeoSPaaSMetadataNormalizer
-from ...utils import export_subclasses
+from ...manifest import lazy_export
 
 __all__ = []
-export_subclasses(__all__, __package__, os.path.dirname(__file__), GeoSPaaSMetadataNormalizer)
+__getattr__ = lazy_export(__all__, __package__, GeoSPaaSMetadataNormalizer)
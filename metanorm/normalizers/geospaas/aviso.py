@@ -22,7 +22,7 @@ class AVISOAltimetryMetadataNormalizer(GeoSPaaSMetadataNormalizer):
 
     @utils.raises((AttributeError, KeyError))
     def get_entry_id(self, raw_metadata):
-        return utils.NC_H5_FILENAME_MATCHER.search(raw_metadata['url']).group(1)
+        return utils.regex_search(utils.NC_H5_FILENAME_MATCHER, raw_metadata['url']).group(1)
 
     @utils.raises(KeyError)
     def get_summary(self, raw_metadata):
@@ -37,15 +37,17 @@ class AVISOAltimetryMetadataNormalizer(GeoSPaaSMetadataNormalizer):
 
     @utils.raises((KeyError, dateutil.parser.ParserError))
     def get_time_coverage_start(self, raw_metadata):
-        return dateutil.parser.parse(raw_metadata['time_coverage_start'])
+        return utils.parse_datetime(raw_metadata['time_coverage_start'])
 
     @utils.raises((KeyError, dateutil.parser.ParserError))
     def get_time_coverage_end(self, raw_metadata):
-        return dateutil.parser.parse(raw_metadata['time_coverage_end'])
+        return utils.parse_datetime(raw_metadata['time_coverage_end'])
 
+    @utils.record_independent
     def get_platform(self, raw_metadata):
         return utils.get_gcmd_platform('Earth Observation Satellites')
 
+    @utils.record_independent
     def get_instrument(self, raw_metadata):
         return utils.get_gcmd_instrument('Altimeters')
 
@@ -53,5 +55,6 @@ class AVISOAltimetryMetadataNormalizer(GeoSPaaSMetadataNormalizer):
     def get_location_geometry(self, raw_metadata):
         return raw_metadata.get('geometry', '')
 
+    @utils.record_independent
     def get_provider(self, raw_metadata):
         return utils.get_gcmd_provider(['AVISO'])
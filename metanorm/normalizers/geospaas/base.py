@@ -1,8 +1,7 @@
 """Module containing the base class for GeoSPaaS normalizers"""
+import collections.abc
 import logging
 
-import pythesint as pti
-
 import metanorm.utils as utils
 from metanorm.normalizers.base import MetadataNormalizer
 
@@ -13,8 +12,33 @@ logger.addHandler(logging.NullHandler())
 
 class GeoSPaaSMetadataNormalizer(MetadataNormalizer):
     """Base class for GeoSPaaS normalizers. Defaults are defined here.
+    The getters decorated with `utils.record_independent` are only
+    called for the first normalized record, their value is then reused
+    for all the records normalized by the same class.
+    The other getters are called inside a `utils.record_context`, so
+    the values they derive from the same record (URL matches, time
+    coverage...) are only computed once.
     """
 
+    # counts the raw dataset parameters which could not be normalized
+    unresolved_parameters = utils.WarningCollector(
+        logger, "'%s' parameter could not be normalized")
+
+    NORMALIZED_FIELDS = (
+        'entry_title',
+        'entry_id',
+        'summary',
+        'time_coverage_start',
+        'time_coverage_end',
+        'platform',
+        'instrument',
+        'location_geometry',
+        'provider',
+        'iso_topic_category',
+        'gcmd_location',
+        'dataset_parameters',
+    )
+
     def get_entry_title(self, raw_metadata):
         """Get the entry title from the raw metadata"""
         raise NotImplementedError
@@ -23,6 +47,7 @@ class GeoSPaaSMetadataNormalizer(MetadataNormalizer):
         """Get the entry ID from the raw metadata"""
         raise NotImplementedError
 
+    @utils.record_independent
     def get_summary(self, raw_metadata):
         """Get the summary from the raw metadata"""
         return utils.UNKNOWN
@@ -53,44 +78,140 @@ class GeoSPaaSMetadataNormalizer(MetadataNormalizer):
         """Get the provider from the raw metadata"""
         raise NotImplementedError
 
+    @utils.record_independent
     @utils.raises(IndexError)
     def get_iso_topic_category(self, raw_metadata):
         """Get the ISO topic category from the raw metadata"""
+        import pythesint as pti  # pylint: disable=import-outside-toplevel
         return pti.get_iso19115_topic_category('Oceans')
 
+    @utils.record_independent
     @utils.raises(IndexError)
     def get_gcmd_location(self, raw_metadata):
         """Get the GCMD location from the raw metadata"""
+        import pythesint as pti  # pylint: disable=import-outside-toplevel
         return pti.get_gcmd_location('SEA SURFACE')
 
     def get_dataset_parameters(self, raw_metadata):
         """Get the dataset's parameters, if any, from the raw metadata
         Note that if a parameter is not found is pythesint, no error is
-        raised, but a warning is logged
+        raised, but it is counted in `unresolved_parameters`, which logs
+        aggregated warnings.
+        The parameters are returned in a tuple, like the shared lists
+        from `utils.create_parameter_list()`
         """
         normalized_dataset_parameters = []
         if 'raw_dataset_parameters' in raw_metadata:
-            for raw_parameter_name in raw_metadata['raw_dataset_parameters']:
-                try:
-                    normalized_parameter = utils.get_cf_or_wkv_standard_name(raw_parameter_name)
-                except IndexError:
-                    logger.warning("'%s' parameter could not be normalized", raw_parameter_name)
+            raw_parameter_names = raw_metadata['raw_dataset_parameters']
+            resolved_parameters = utils.resolve_standard_names(raw_parameter_names)
+            for raw_parameter_name in raw_parameter_names:
+                normalized_parameter = resolved_parameters[raw_parameter_name]
+                if normalized_parameter is None:
+                    self.unresolved_parameters.add(
+                        self.__class__.__name__, raw_parameter_name)
                 else:
                     normalized_dataset_parameters.append(normalized_parameter)
-        return normalized_dataset_parameters
-
-    def normalize(self, raw_metadata):
-        return {
-            'entry_title': self.get_entry_title(raw_metadata),
-            'entry_id': self.get_entry_id(raw_metadata),
-            'summary': self.get_summary(raw_metadata),
-            'time_coverage_start': self.get_time_coverage_start(raw_metadata),
-            'time_coverage_end': self.get_time_coverage_end(raw_metadata),
-            'platform': self.get_platform(raw_metadata),
-            'instrument': self.get_instrument(raw_metadata),
-            'location_geometry': self.get_location_geometry(raw_metadata),
-            'provider': self.get_provider(raw_metadata),
-            'iso_topic_category': self.get_iso_topic_category(raw_metadata),
-            'gcmd_location': self.get_gcmd_location(raw_metadata),
-            'dataset_parameters': self.get_dataset_parameters(raw_metadata)
-        }
+        return tuple(normalized_dataset_parameters)
+
+    @classmethod
+    def _get_record_independent_values(cls):
+        """Returns the dictionary in which the values of the record
+        independent fields are stored for this class
+        """
+        if '_record_independent_values' not in cls.__dict__:
+            cls._record_independent_values = utils.create_record_independent_cache()
+        return cls._record_independent_values
+
+    def get_field(self, field_name, raw_metadata):
+        """Get the value of a normalized field by calling the
+        corresponding getter, unless the getter is record independent
+        and has already been called
+        """
+        getter = getattr(self, f"get_{field_name}")
+        if getattr(getter, 'record_independent', False) is not True:
+            return getter(raw_metadata)
+
+        values = self._get_record_independent_values()
+        try:
+            return values[field_name]
+        except KeyError:
+            value = values[field_name] = getter(raw_metadata)
+            return value
+
+    def _check_fields(self, fields):
+        """Returns the fields to normalize: all the normalized fields if
+        `fields` is None, otherwise `fields` as a tuple.
+        Raises a ValueError if some fields are unknown
+        """
+        if fields is None:
+            return self.NORMALIZED_FIELDS
+        fields = tuple(fields)
+        unknown_fields = [field for field in fields if field not in self.NORMALIZED_FIELDS]
+        if unknown_fields:
+            raise ValueError(f"Unknown fields: {', '.join(unknown_fields)}")
+        return fields
+
+    def normalize(self, raw_metadata, lazy=False, fields=None):
+        """Returns a dictionary containing the normalized fields.
+        If `fields` is given, only these fields are normalized.
+        If `lazy` is True, a LazyNormalizedMetadata mapping is returned
+        instead: each field is only computed when it is accessed
+        """
+        fields = self._check_fields(fields)
+        if lazy:
+            return LazyNormalizedMetadata(self, raw_metadata, fields)
+        with utils.record_context():
+            return {
+                field_name: self.get_field(field_name, raw_metadata)
+                for field_name in fields
+            }
+
+
+class LazyNormalizedMetadata(collections.abc.Mapping):
+    """Read-only mapping of the normalized fields of a record (or of
+    the subset of them given in `fields`), in which
+    each field is computed the first time it is accessed and then
+    cached. The values derived from the record are shared between
+    fields like in `GeoSPaaSMetadataNormalizer.normalize()`.
+    The raw metadata must not be modified until all the needed fields
+    have been accessed. Errors are raised when accessing the field
+    which causes them.
+    """
+
+    def __init__(self, normalizer, raw_metadata, fields=None):
+        self.normalizer = normalizer
+        self.raw_metadata = raw_metadata
+        self._fields = normalizer.NORMALIZED_FIELDS if fields is None else tuple(fields)
+        self._values = {}
+        self._record_cache = {}
+
+    def __getitem__(self, field_name):
+        try:
+            return self._values[field_name]
+        except KeyError:
+            if field_name not in self._fields:
+                raise
+        with utils.record_context(self._record_cache):
+            value = self.normalizer.get_field(field_name, self.raw_metadata)
+        self._values[field_name] = value
+        return value
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __contains__(self, field_name):
+        return field_name in self._fields
+
+    def __repr__(self):
+        return (f"<{self.__class__.__name__} from {self.normalizer.__class__.__name__}, "
+                f"computed: {list(self._values)}>")
+
+    def materialize(self):
+        """Computes all the fields and returns them in a dictionary"""
+        values = {field_name: self[field_name] for field_name in self._fields}
+        # nothing else needs to be derived from the record
+        self._record_cache.clear()
+        return values
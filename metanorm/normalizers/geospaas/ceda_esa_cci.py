@@ -13,19 +13,26 @@ class CEDAESACCIMetadataNormalizer(GeoSPaaSMetadataNormalizer):
     climatology dataset hosted by CEDA
     """
 
+    url_prefixes = (
+        'ftp://ftp.ceda.ac.uk/neodc/esacci/sst/data/CDR_v2/Climatology/',
+        'ftp://anon-ftp.ceda.ac.uk/neodc/esacci/sst/data/CDR_v2/Climatology/',
+    )
+
     def check(self, raw_metadata):
         """Checks that the URL starts with the right prefix"""
         return re.match(
             r'^ftp://(anon-)?ftp.ceda.ac.uk/neodc/esacci/sst/data/CDR_v2/Climatology/.*',
             raw_metadata.get('url', ''))
 
+    @utils.record_independent
     def get_entry_title(self, raw_metadata):
         return 'ESA SST CCI OSTIA L4 Climatology'
 
     @utils.raises((KeyError, AttributeError))
     def get_entry_id(self, raw_metadata):
-        return utils.NC_H5_FILENAME_MATCHER.search(raw_metadata['url']).group(1)
+        return utils.regex_search(utils.NC_H5_FILENAME_MATCHER, raw_metadata['url']).group(1)
 
+    @utils.record_independent
     def get_summary(self, raw_metadata):
         return utils.dict_to_string({
             utils.SUMMARY_FIELDS['description']: (
@@ -52,17 +59,22 @@ class CEDAESACCIMetadataNormalizer(GeoSPaaSMetadataNormalizer):
     def get_time_coverage_end(self, raw_metadata):
         return utils.find_time_coverage(self.time_patterns, raw_metadata['url'])[1]
 
+    @utils.record_independent
     def get_platform(self, raw_metadata):
         return utils.get_gcmd_platform('Earth Observation Satellites')
 
+    @utils.record_independent
     def get_instrument(self, raw_metadata):
         return utils.get_gcmd_instrument('Imaging Spectrometers/Radiometers')
 
+    @utils.record_independent
     def get_location_geometry(self, raw_metadata):
         return utils.WORLD_WIDE_COVERAGE_WKT
 
+    @utils.record_independent
     def get_provider(self, raw_metadata):
         return utils.get_gcmd_provider(['ESA/CCI'])
 
+    @utils.record_independent
     def get_dataset_parameters(self, raw_metadata):
         return utils.create_parameter_list(('sea_surface_temperature',))
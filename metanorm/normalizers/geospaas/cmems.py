@@ -10,21 +10,92 @@ from .base import GeoSPaaSMetadataNormalizer
 
 
 class CMEMSMetadataNormalizer(GeoSPaaSMetadataNormalizer):
-    """Base class for CMEMS normalizers"""
+    """Base class for CMEMS normalizers.
+    Each subclass describes a CMEMS product using the following class
+    attributes, from which the normalized values are built:
+      - url_prefix: the prefix of the URLs of the product's files
+      - time_patterns: the patterns used to extract the time coverage
+        from the URL (see `utils.find_time_coverage()`)
+      - entry_title: the product's title
+      - summary: dictionary whose keys are keys of
+        `utils.SUMMARY_FIELDS`
+      - platform, instrument: GCMD keywords
+      - provider: GCMD provider short name
+      - location_geometry: WKT geometry
+      - dataset_parameters: tuple of standard names
+      - dataset_parameters_table: for products whose parameters
+        depend on the file, a `utils.PrefixTable` or
+        `utils.SubstringTable` associating parts of the URLs with
+        tuples of standard names. It is built once with the class.
+    The getters which depend on the URL are overridden in the
+    subclasses when needed.
+    """
 
-    time_patterns = ()
     url_prefix = None
+    time_patterns = ()
+    entry_title = None
+    summary = None
+    platform = 'OPERATIONAL MODELS'
+    instrument = 'Computer'
+    provider = 'CMEMS'
+    location_geometry = utils.WORLD_WIDE_COVERAGE_WKT
+    dataset_parameters = ()
+    dataset_parameters_table = None
+
+    @property
+    def url_prefixes(self):
+        return (self.url_prefix,) if self.url_prefix is not None else ()
 
     def check(self, raw_metadata):
         return (self.url_prefix is not None
                 and raw_metadata.get('url', '').startswith(self.url_prefix))
 
+    @utils.record_independent
+    def get_entry_title(self, raw_metadata):
+        if self.entry_title is None:
+            raise NotImplementedError
+        return self.entry_title
+
     @utils.raises((AttributeError, KeyError))
     def get_entry_id(self, raw_metadata):
-        return utils.NC_H5_FILENAME_MATCHER.search(raw_metadata['url']).group(1)
+        return utils.regex_search(utils.NC_H5_FILENAME_MATCHER, raw_metadata['url']).group(1)
+
+    @utils.record_independent
+    def get_summary(self, raw_metadata):
+        if self.summary is None:
+            return super().get_summary(raw_metadata)
+        return utils.dict_to_string({
+            utils.SUMMARY_FIELDS[key]: value for key, value in self.summary.items()
+        })
+
+    @utils.record_independent
+    def get_platform(self, raw_metadata):
+        return utils.get_gcmd_platform(self.platform)
 
+    @utils.record_independent
+    def get_instrument(self, raw_metadata):
+        return utils.get_gcmd_instrument(self.instrument)
+
+    @utils.record_independent
     def get_provider(self, raw_metadata):
-        return utils.get_gcmd_provider(['CMEMS'])
+        return utils.get_gcmd_provider([self.provider])
+
+    @utils.record_independent
+    def get_location_geometry(self, raw_metadata):
+        return self.location_geometry
+
+    @utils.record_independent
+    def get_dataset_parameters(self, raw_metadata):
+        return utils.create_parameter_list(self.dataset_parameters)
+
+    def find_dataset_parameters(self, url):
+        """Returns the parameters associated with `url` in
+        `dataset_parameters_table`, or an empty tuple if there are none
+        """
+        parameter_list = self.dataset_parameters_table.find(url)
+        if parameter_list is None:
+            return ()
+        return utils.create_parameter_list(parameter_list)
 
     @utils.raises(KeyError)
     def get_time_coverage_start(self, raw_metadata):
@@ -48,39 +119,26 @@ class CMEMS008046MetadataNormalizer(CMEMSMetadataNormalizer):
             lambda time: (time - relativedelta(hours=12), time + relativedelta(hours=12))
         ),
     )
-
-    def get_entry_title(self, raw_metadata):
-        return 'GLOBAL OCEAN GRIDDED L4 SEA SURFACE HEIGHTS AND DERIVED VARIABLES NRT'
-
-    def get_summary(self, raw_metadata):
-        return utils.dict_to_string({
-            utils.SUMMARY_FIELDS['description']:
+    entry_title = 'GLOBAL OCEAN GRIDDED L4 SEA SURFACE HEIGHTS AND DERIVED VARIABLES NRT'
+    summary = {
+        'description':
             'Altimeter satellite gridded Sea Level Anomalies (SLA) computed with '
             'respect to a twenty-year mean.',
-            utils.SUMMARY_FIELDS['processing_level']: '4',
-            utils.SUMMARY_FIELDS['product']: 'SEALEVEL_GLO_PHY_L4_NRT_OBSERVATIONS_008_046'
-        })
-
-    def get_platform(self, raw_metadata):
-        return utils.get_gcmd_platform('Earth Observation satellites')
-
-    def get_instrument(self, raw_metadata):
-        return utils.get_gcmd_instrument('altimeters')
-
-    def get_location_geometry(self, raw_metadata):
-        return utils.WORLD_WIDE_COVERAGE_WKT
-
-    def get_dataset_parameters(self, raw_metadata):
-        # based on "http://nrt.cmems-du.eu/motu-web/Motu?action=describeProduct
-        #           &service=SEALEVEL_GLO_PHY_L4_NRT_OBSERVATIONS_008_046-TDS"
-        return utils.create_parameter_list((
-            'sea_surface_height_above_geoid',
-            'sea_surface_height_above_sea_level',
-            'surface_geostrophic_eastward_sea_water_velocity',
-            'surface_geostrophic_eastward_sea_water_velocity_assuming_mean_sea_level_for_geoid',
-            'surface_geostrophic_northward_sea_water_velocity',
-            'surface_geostrophic_northward_sea_water_velocity_assuming_mean_sea_level_for_geoid'
-        ))
+        'processing_level': '4',
+        'product': 'SEALEVEL_GLO_PHY_L4_NRT_OBSERVATIONS_008_046'
+    }
+    platform = 'Earth Observation satellites'
+    instrument = 'altimeters'
+    # based on "http://nrt.cmems-du.eu/motu-web/Motu?action=describeProduct
+    #           &service=SEALEVEL_GLO_PHY_L4_NRT_OBSERVATIONS_008_046-TDS"
+    dataset_parameters = (
+        'sea_surface_height_above_geoid',
+        'sea_surface_height_above_sea_level',
+        'surface_geostrophic_eastward_sea_water_velocity',
+        'surface_geostrophic_eastward_sea_water_velocity_assuming_mean_sea_level_for_geoid',
+        'surface_geostrophic_northward_sea_water_velocity',
+        'surface_geostrophic_northward_sea_water_velocity_assuming_mean_sea_level_for_geoid'
+    )
 
 
 class CMEMS015003MetadataNormalizer(CMEMSMetadataNormalizer):
@@ -100,35 +158,22 @@ class CMEMS015003MetadataNormalizer(CMEMSMetadataNormalizer):
             lambda time: (time, time + relativedelta(months=1))
         )
     )
-
-    def get_entry_title(self, raw_metadata):
-        return ('GLOBAL TOTAL SURFACE AND 15M CURRENT FROM ALTIMETRIC '
-                'GEOSTROPHIC CURRENT AND MODELED EKMAN CURRENT PROCESSING')
-
-    def get_summary(self, raw_metadata):
-        return utils.dict_to_string({
-            utils.SUMMARY_FIELDS['description']:
+    entry_title = ('GLOBAL TOTAL SURFACE AND 15M CURRENT FROM ALTIMETRIC '
+                   'GEOSTROPHIC CURRENT AND MODELED EKMAN CURRENT PROCESSING')
+    summary = {
+        'description':
             'This product is a NRT L4 global total velocity field at 0m and 15m.',
-            utils.SUMMARY_FIELDS['processing_level']: '4',
-            utils.SUMMARY_FIELDS['product']: 'MULTIOBS_GLO_PHY_NRT_015_003'
-        })
-
-    def get_platform(self, raw_metadata):
-        return utils.get_gcmd_platform('Earth Observation satellites')
-
-    def get_instrument(self, raw_metadata):
-        return utils.get_gcmd_instrument('altimeters')
-
-    def get_location_geometry(self, raw_metadata):
-        return utils.WORLD_WIDE_COVERAGE_WKT
-
-    def get_dataset_parameters(self, raw_metadata):
-        # based on "http://nrt.cmems-du.eu/motu-web/Motu?
-        #           action=describeProduct&service=MULTIOBS_GLO_PHY_NRT_015_003-TDS"
-        return utils.create_parameter_list((
-            'eastward_sea_water_velocity',
-            'northward_sea_water_velocity'
-        ))
+        'processing_level': '4',
+        'product': 'MULTIOBS_GLO_PHY_NRT_015_003'
+    }
+    platform = 'Earth Observation satellites'
+    instrument = 'altimeters'
+    # based on "http://nrt.cmems-du.eu/motu-web/Motu?
+    #           action=describeProduct&service=MULTIOBS_GLO_PHY_NRT_015_003-TDS"
+    dataset_parameters = (
+        'eastward_sea_water_velocity',
+        'northward_sea_water_velocity'
+    )
 
 
 class CMEMS001024MetadataNormalizer(CMEMSMetadataNormalizer):
@@ -159,44 +204,29 @@ class CMEMS001024MetadataNormalizer(CMEMSMetadataNormalizer):
             lambda time: (time, time)
         )
     )
-
-    def get_entry_title(self, raw_metadata):
-        return 'GLOBAL OCEAN 1_12 PHYSICS ANALYSIS AND FORECAST UPDATED DAILY'
-
-    def get_summary(self, raw_metadata):
-        return utils.dict_to_string({
-            utils.SUMMARY_FIELDS['description']:
-                'The Operational Mercator global ocean analysis and forecast system at '
-                '1/12 degree is providing 10 days of 3D global ocean forecasts updated daily.',
-            utils.SUMMARY_FIELDS['processing_level']: '4',
-            utils.SUMMARY_FIELDS['product']: 'GLOBAL_ANALYSIS_FORECAST_PHY_001_024'
-        })
-
-    def get_platform(self, raw_metadata):
-        return utils.get_gcmd_platform('OPERATIONAL MODELS')
-
-    def get_instrument(self, raw_metadata):
-        return utils.get_gcmd_instrument('Computer')
-
-    def get_location_geometry(self, raw_metadata):
-        return utils.WORLD_WIDE_COVERAGE_WKT
-
-    def get_dataset_parameters(self, raw_metadata):
-        # based on "http://nrt.cmems-du.eu/motu-web/Motu?
-        #           action=describeProduct&service=GLOBAL_ANALYSIS_FORECAST_PHY_001_024-TDS"
-        return utils.create_parameter_list((
-            'sea_water_potential_temperature_at_sea_floor',
-            'ocean_mixed_layer_thickness_defined_by_sigma_theta',
-            'sea_ice_area_fraction',
-            'sea_ice_thickness',
-            'sea_water_salinity',
-            'sea_water_potential_temperature',
-            'eastward_sea_water_velocity',
-            'eastward_sea_ice_velocity',
-            'northward_sea_water_velocity',
-            'northward_sea_ice_velocity',
-            'sea_surface_height_above_geoid'
-        ))
+    entry_title = 'GLOBAL OCEAN 1_12 PHYSICS ANALYSIS AND FORECAST UPDATED DAILY'
+    summary = {
+        'description':
+            'The Operational Mercator global ocean analysis and forecast system at '
+            '1/12 degree is providing 10 days of 3D global ocean forecasts updated daily.',
+        'processing_level': '4',
+        'product': 'GLOBAL_ANALYSIS_FORECAST_PHY_001_024'
+    }
+    # based on "http://nrt.cmems-du.eu/motu-web/Motu?
+    #           action=describeProduct&service=GLOBAL_ANALYSIS_FORECAST_PHY_001_024-TDS"
+    dataset_parameters = (
+        'sea_water_potential_temperature_at_sea_floor',
+        'ocean_mixed_layer_thickness_defined_by_sigma_theta',
+        'sea_ice_area_fraction',
+        'sea_ice_thickness',
+        'sea_water_salinity',
+        'sea_water_potential_temperature',
+        'eastward_sea_water_velocity',
+        'eastward_sea_ice_velocity',
+        'northward_sea_water_velocity',
+        'northward_sea_ice_velocity',
+        'sea_surface_height_above_geoid'
+    )
 
 
 class CMEMS006013MetadataNormalizer(CMEMSMetadataNormalizer):
@@ -216,60 +246,48 @@ class CMEMS006013MetadataNormalizer(CMEMSMetadataNormalizer):
             lambda time: (time, time + relativedelta(months=1))
         )
     )
-
-    def get_entry_title(self, raw_metadata):
-        return 'Mediterranean Forecasting System (hydrodynamic-wave model)'
-
-    def get_summary(self, raw_metadata):
-        return utils.dict_to_string({
-            utils.SUMMARY_FIELDS['description']:
-                'The physical component of the Mediterranean Forecasting System '
-                '(Med-Currents) is a coupled hydrodynamic-wave model implemented over the whole '
-                'Mediterranean Basin.',
-            utils.SUMMARY_FIELDS['processing_level']: '4',
-            utils.SUMMARY_FIELDS['product']: 'MEDSEA_ANALYSISFORECAST_PHY_006_013'
-        })
-
-    def get_platform(self, raw_metadata):
-        return utils.get_gcmd_platform('OPERATIONAL MODELS')
-
-    def get_instrument(self, raw_metadata):
-        return utils.get_gcmd_instrument('Computer')
-
-    def get_location_geometry(self, raw_metadata):
-        return 'POLYGON((-17.29 45.98, -17.29 30.18, 36.30 30.18, 36.30 45.98, -17.29 45.98))'
+    entry_title = 'Mediterranean Forecasting System (hydrodynamic-wave model)'
+    summary = {
+        'description':
+            'The physical component of the Mediterranean Forecasting System '
+            '(Med-Currents) is a coupled hydrodynamic-wave model implemented over the whole '
+            'Mediterranean Basin.',
+        'processing_level': '4',
+        'product': 'MEDSEA_ANALYSISFORECAST_PHY_006_013'
+    }
+    location_geometry = (
+        'POLYGON((-17.29 45.98, -17.29 30.18, 36.30 30.18, 36.30 45.98, -17.29 45.98))')
+
+    dataset_parameters_table = utils.PrefixTable((
+        (f"{url_prefix}/med-cmcc-cur", (
+            'eastward_sea_water_velocity',
+            'northward_sea_water_velocity',
+        )),
+        (f"{url_prefix}/med-cmcc-mld", ('ocean_mixed_layer_thickness_defined_by_sigma_theta',)),
+        (f"{url_prefix}/med-cmcc-sal", ('sea_water_salinity',)),
+        (f"{url_prefix}/med-cmcc-ssh", ('sea_surface_height_above_geoid',)),
+        (f"{url_prefix}/med-cmcc-tem", (
+            'sea_water_potential_temperature_at_sea_floor',
+            'sea_water_potential_temperature'
+        )),
+        (f"{url_prefix}/MEDSEA_ANALYSISFORECAST_PHY_006_013-statics/"
+         f"MED-MFC_006_013_mask_bathy.nc", (
+            'model_level_number_at_sea_floor',
+            'sea_binary_mask',
+            'sea_floor_depth_below_geoid'
+        )),
+        (f"{url_prefix}/MEDSEA_ANALYSISFORECAST_PHY_006_013-statics/"
+         f"MED-MFC_006_013_coordinates.nc", (
+            'cell_thickness',
+        )),
+        (f"{url_prefix}/MEDSEA_ANALYSISFORECAST_PHY_006_013-statics/MED-MFC_006_013_mdt.nc", (
+            'sea_surface_height_above_geoid',
+        )),
+    ))
 
     @utils.raises(KeyError)
     def get_dataset_parameters(self, raw_metadata):
-        parameters = {
-            "med-cmcc-cur": (
-                'eastward_sea_water_velocity',
-                'northward_sea_water_velocity',
-            ),
-            "med-cmcc-mld": ('ocean_mixed_layer_thickness_defined_by_sigma_theta',),
-            "med-cmcc-sal": ('sea_water_salinity',),
-            "med-cmcc-ssh": ('sea_surface_height_above_geoid',),
-            "med-cmcc-tem": (
-                'sea_water_potential_temperature_at_sea_floor',
-                'sea_water_potential_temperature'
-            ),
-            "MEDSEA_ANALYSISFORECAST_PHY_006_013-statics/MED-MFC_006_013_mask_bathy.nc": (
-                'model_level_number_at_sea_floor',
-                'sea_binary_mask',
-                'sea_floor_depth_below_geoid'
-            ),
-            "MEDSEA_ANALYSISFORECAST_PHY_006_013-statics/MED-MFC_006_013_coordinates.nc": (
-                'cell_thickness',
-            ),
-            "MEDSEA_ANALYSISFORECAST_PHY_006_013-statics/MED-MFC_006_013_mdt.nc": (
-                'sea_surface_height_above_geoid',
-            )
-        }
-
-        for prefix, parameter_list in parameters.items():
-            if raw_metadata['url'].startswith(f"{self.url_prefix}/{prefix}"):
-                return utils.create_parameter_list(parameter_list)
-        return []
+        return self.find_dataset_parameters(raw_metadata['url'])
 
 
 class CMEMS005001MetadataNormalizer(CMEMSMetadataNormalizer):
@@ -292,77 +310,62 @@ class CMEMS005001MetadataNormalizer(CMEMSMetadataNormalizer):
             lambda time: (time, time + relativedelta(months=1))
         )
     )
-
-    def get_entry_title(self, raw_metadata):
-        return 'Atlantic-Iberian Biscay Irish-Ocean Physics Analysis and Forecast'
-
-    def get_summary(self, raw_metadata):
-        return utils.dict_to_string({
-            utils.SUMMARY_FIELDS['description']:
-                'The operational IBI (Iberian Biscay Irish) Ocean Analysis and Forecasting'
-                ' system provides a 5-day hydrodynamic forecast including high frequency '
-                'processes of paramount importance to characterize regional scale marine '
-                'processes.',
-            utils.SUMMARY_FIELDS['processing_level']: '4',
-            utils.SUMMARY_FIELDS['product']: 'IBI_ANALYSISFORECAST_PHY_005_001'
-        })
-
-    def get_platform(self, raw_metadata):
-        return utils.get_gcmd_platform('OPERATIONAL MODELS')
-
-    def get_instrument(self, raw_metadata):
-        return utils.get_gcmd_instrument('Computer')
-
-    def get_location_geometry(self, raw_metadata):
-        return 'POLYGON((-19 56, 5 56, 5 26, -19 26, -19 56))'
+    entry_title = 'Atlantic-Iberian Biscay Irish-Ocean Physics Analysis and Forecast'
+    summary = {
+        'description':
+            'The operational IBI (Iberian Biscay Irish) Ocean Analysis and Forecasting'
+            ' system provides a 5-day hydrodynamic forecast including high frequency '
+            'processes of paramount importance to characterize regional scale marine '
+            'processes.',
+        'processing_level': '4',
+        'product': 'IBI_ANALYSISFORECAST_PHY_005_001'
+    }
+    location_geometry = 'POLYGON((-19 56, 5 56, 5 26, -19 26, -19 56))'
+
+    dataset_parameters_table = utils.PrefixTable((
+        (f"{url_prefix}/cmems_mod_ibi_phy_anfc_0.027deg-2D_PT15M-m/", (
+            'sea_surface_height_above_geoid',
+            'eastward_sea_water_velocity',
+            'northward_sea_water_velocity'
+        )),
+        (f"{url_prefix}/cmems_mod_ibi_phy_anfc_0.027deg-3D_P1D-m/", (
+            'sea_water_potential_temperature',
+            'sea_water_salinity',
+            'eastward_sea_water_velocity',
+            'northward_sea_water_velocity',
+            'sea_surface_height_above_geoid',
+            'ocean_mixed_layer_thickness_defined_by_sigma_theta',
+            'sea_water_potential_temperature_at_sea_floor'
+        )),
+        (f"{url_prefix}/cmems_mod_ibi_phy_anfc_0.027deg-2D_PT1H-m/", (
+            'sea_water_potential_temperature',
+            'eastward_sea_water_velocity',
+            'northward_sea_water_velocity',
+            'barotropic_eastward_sea_water_velocity',
+            'barotropic_northward_sea_water_velocity',
+            'sea_surface_height_above_geoid',
+            'ocean_mixed_layer_thickness_defined_by_sigma_theta'
+        )),
+        (f"{url_prefix}/cmems_mod_ibi_phy_anfc_0.027deg-3D_PT1H-m/", (
+            'sea_water_potential_temperature',
+            'sea_water_salinity',
+            'eastward_sea_water_velocity',
+            'northward_sea_water_velocity'
+        )),
+        (f"{url_prefix}/cmems_mod_ibi_phy_anfc_0.027deg-3D_P1M-m/", (
+            'sea_water_potential_temperature',
+            'sea_water_salinity',
+            'eastward_sea_water_velocity',
+            'northward_sea_water_velocity',
+            'sea_surface_height_above_geoid',
+            'ocean_mixed_layer_thickness_defined_by_sigma_theta',
+            'sea_water_potential_temperature_at_sea_floor'
+        )),
+    ))
 
     @utils.raises(KeyError)
     def get_dataset_parameters(self, raw_metadata):
-        parameters = {
-            "cmems_mod_ibi_phy_anfc_0.027deg-2D_PT15M-m/": (
-                'sea_surface_height_above_geoid',
-                'eastward_sea_water_velocity',
-                'northward_sea_water_velocity'
-            ),
-            "cmems_mod_ibi_phy_anfc_0.027deg-3D_P1D-m/": (
-                'sea_water_potential_temperature',
-                'sea_water_salinity',
-                'eastward_sea_water_velocity',
-                'northward_sea_water_velocity',
-                'sea_surface_height_above_geoid',
-                'ocean_mixed_layer_thickness_defined_by_sigma_theta',
-                'sea_water_potential_temperature_at_sea_floor'
-            ),
-            "cmems_mod_ibi_phy_anfc_0.027deg-2D_PT1H-m/": (
-                'sea_water_potential_temperature',
-                'eastward_sea_water_velocity',
-                'northward_sea_water_velocity',
-                'barotropic_eastward_sea_water_velocity',
-                'barotropic_northward_sea_water_velocity',
-                'sea_surface_height_above_geoid',
-                'ocean_mixed_layer_thickness_defined_by_sigma_theta'
-            ),
-            "cmems_mod_ibi_phy_anfc_0.027deg-3D_PT1H-m/": (
-                'sea_water_potential_temperature',
-                'sea_water_salinity',
-                'eastward_sea_water_velocity',
-                'northward_sea_water_velocity'
-            ),
-            "cmems_mod_ibi_phy_anfc_0.027deg-3D_P1M-m/": (
-                'sea_water_potential_temperature',
-                'sea_water_salinity',
-                'eastward_sea_water_velocity',
-                'northward_sea_water_velocity',
-                'sea_surface_height_above_geoid',
-                'ocean_mixed_layer_thickness_defined_by_sigma_theta',
-                'sea_water_potential_temperature_at_sea_floor'
-            )
-        }
-
-        for prefix, parameter_list in parameters.items():
-            if raw_metadata['url'].startswith(f"{self.url_prefix}/{prefix}"):
-                return utils.create_parameter_list(parameter_list)
-        return []
+        return self.find_dataset_parameters(raw_metadata['url'])
 
 
 class CMEMS002003MetadataNormalizer(CMEMSMetadataNormalizer):
@@ -388,51 +391,37 @@ class CMEMS002003MetadataNormalizer(CMEMSMetadataNormalizer):
             lambda time: (time, time + relativedelta(years=1))
         ),
     )
-
-    def get_entry_title(self, raw_metadata):
-        return 'Arctic Ocean Physics Reanalysis'
-
-    def get_summary(self, raw_metadata):
-        return utils.dict_to_string({
-            utils.SUMMARY_FIELDS['description']:
-                'The current version of the TOPAZ system - TOPAZ4b - is nearly identical to the '
-                'real-time forecast system run at MET Norway. It uses a recent version of the '
-                'Hybrid Coordinate Ocean Model (HYCOM) developed at University of Miami (Bleck '
-                '2002). HYCOM is coupled to a sea ice model; ice thermodynamics are described in '
-                'Drange and Simonsen (1996) and the elastic-viscous-plastic rheology in Hunke and '
-                'Dukowicz (1997).',
-            utils.SUMMARY_FIELDS['processing_level']: '4',
-            utils.SUMMARY_FIELDS['product']: 'ARCTIC_MULTIYEAR_PHY_002_003'
-        })
-
-    def get_platform(self, raw_metadata):
-        return utils.get_gcmd_platform('OPERATIONAL MODELS')
-
-    def get_instrument(self, raw_metadata):
-        return utils.get_gcmd_instrument('Computer')
-
-    def get_location_geometry(self, raw_metadata):
-        return 'POLYGON((-180 53, -180 90, 180 90, 180 53, -180 53))'
-
-    def get_dataset_parameters(self, raw_metadata):
-        return utils.create_parameter_list([
-            'latitude',
-            'longitude',
-            'sea_water_potential_temperature_at_sea_floor',
-            'ocean_mixed_layer_thickness_defined_by_sigma_theta',
-            'sea_floor_depth_below_geoid',
-            'sea_ice_area_fraction',
-            'surface_snow_thickness',
-            'sea_ice_thickness',
-            'sea_water_salinity',
-            'ocean_barotropic_streamfunction',
-            'sea_water_potential_temperature',
-            'sea_water_x_velocity',
-            'sea_water_y_velocity',
-            'sea_ice_x_velocity',
-            'sea_ice_y_velocity',
-            'sea_surface_height_above_geoid',
-        ])
+    entry_title = 'Arctic Ocean Physics Reanalysis'
+    summary = {
+        'description':
+            'The current version of the TOPAZ system - TOPAZ4b - is nearly identical to the '
+            'real-time forecast system run at MET Norway. It uses a recent version of the '
+            'Hybrid Coordinate Ocean Model (HYCOM) developed at University of Miami (Bleck '
+            '2002). HYCOM is coupled to a sea ice model; ice thermodynamics are described in '
+            'Drange and Simonsen (1996) and the elastic-viscous-plastic rheology in Hunke and '
+            'Dukowicz (1997).',
+        'processing_level': '4',
+        'product': 'ARCTIC_MULTIYEAR_PHY_002_003'
+    }
+    location_geometry = 'POLYGON((-180 53, -180 90, 180 90, 180 53, -180 53))'
+    dataset_parameters = (
+        'latitude',
+        'longitude',
+        'sea_water_potential_temperature_at_sea_floor',
+        'ocean_mixed_layer_thickness_defined_by_sigma_theta',
+        'sea_floor_depth_below_geoid',
+        'sea_ice_area_fraction',
+        'surface_snow_thickness',
+        'sea_ice_thickness',
+        'sea_water_salinity',
+        'ocean_barotropic_streamfunction',
+        'sea_water_potential_temperature',
+        'sea_water_x_velocity',
+        'sea_water_y_velocity',
+        'sea_ice_x_velocity',
+        'sea_ice_y_velocity',
+        'sea_surface_height_above_geoid',
+    )
 
 
 class CMEMS002001aMetadataNormalizer(CMEMSMetadataNormalizer):
@@ -446,77 +435,62 @@ class CMEMS002001aMetadataNormalizer(CMEMSMetadataNormalizer):
             lambda time: (time, time + relativedelta(days=1))
         ),
     )
-
-    def get_entry_title(self, raw_metadata):
-        return 'Arctic Ocean Physics Analysis and Forecast'
-
-    def get_summary(self, raw_metadata):
-        return utils.dict_to_string({
-            utils.SUMMARY_FIELDS['description']:
-                'The operational TOPAZ4 Arctic Ocean system uses the HYCOM model and a 100-member '
-                'EnKF assimilation scheme. It is run daily to provide 10 days of forecast(average '
-                'of 10 members) of the 3D physical ocean, including sea ice data assimilation is '
-                'performed weekly to provide 7 days of analysis(ensemble average). Output products '
-                'are interpolated on a grid of 12.5 km resolution at the North Pole (equivalent to '
-                '1/8 deg in mid-latitudes) on a polar stereographic projection.',
-            utils.SUMMARY_FIELDS['processing_level']: '4',
-            utils.SUMMARY_FIELDS['product']: 'ARCTIC_ANALYSIS_FORECAST_PHYS_002_001_a'
-        })
-
-    def get_platform(self, raw_metadata):
-        return utils.get_gcmd_platform('OPERATIONAL MODELS')
-
-    def get_instrument(self, raw_metadata):
-        return utils.get_gcmd_instrument('Computer')
-
-    def get_location_geometry(self, raw_metadata):
-        return 'POLYGON((-180 62, -180 90, 180 90, 180 62, -180 62))'
+    entry_title = 'Arctic Ocean Physics Analysis and Forecast'
+    summary = {
+        'description':
+            'The operational TOPAZ4 Arctic Ocean system uses the HYCOM model and a 100-member '
+            'EnKF assimilation scheme. It is run daily to provide 10 days of forecast(average '
+            'of 10 members) of the 3D physical ocean, including sea ice data assimilation is '
+            'performed weekly to provide 7 days of analysis(ensemble average). Output products '
+            'are interpolated on a grid of 12.5 km resolution at the North Pole (equivalent to '
+            '1/8 deg in mid-latitudes) on a polar stereographic projection.',
+        'processing_level': '4',
+        'product': 'ARCTIC_ANALYSIS_FORECAST_PHYS_002_001_a'
+    }
+    location_geometry = 'POLYGON((-180 62, -180 90, 180 90, 180 62, -180 62))'
+
+    dataset_parameters_table = utils.PrefixTable((
+        (f"{url_prefix}/dataset-topaz4-arc-1hr-myoceanv2-be/", (
+            'longitude',
+            'latitude',
+            'sea_floor_depth_below_geoid',
+            'sea_water_salinity',
+            'sea_water_potential_temperature',
+            'sea_ice_area_fraction',
+            'sea_ice_thickness',
+            'surface_snow_thickness',
+            'sea_ice_x_velocity',
+            'sea_ice_y_velocity',
+            'sea_surface_height_above_geoid',
+            'x_sea_water_velocity',
+            'y_sea_water_velocity',
+        )),
+        (f"{url_prefix}/dataset-topaz4-arc-myoceanv2-be/", (
+            'longitude',
+            'latitude',
+            'sea_floor_depth_below_geoid',
+            'sea_water_potential_temperature',
+            'sea_water_salinity',
+            'x_sea_water_velocity',
+            'y_sea_water_velocity',
+            'ocean_mixed_layer_thickness',
+            'sea_surface_height_above_geoid',
+            'ocean_barotropic_streamfunction',
+            'sea_ice_area_fraction',
+            'sea_ice_thickness',
+            'sea_ice_x_velocity',
+            'sea_ice_y_velocity',
+            'surface_snow_thickness',
+            'fy_frac',
+            'fy_age',
+            'sea_ice_albedo',
+            'sea_water_potential_temperature_at_sea_floor',
+        )),
+    ))
 
     @utils.raises(KeyError)
     def get_dataset_parameters(self, raw_metadata):
-        parameters = {
-            "dataset-topaz4-arc-1hr-myoceanv2-be/": (
-                'longitude',
-                'latitude',
-                'sea_floor_depth_below_geoid',
-                'sea_water_salinity',
-                'sea_water_potential_temperature',
-                'sea_ice_area_fraction',
-                'sea_ice_thickness',
-                'surface_snow_thickness',
-                'sea_ice_x_velocity',
-                'sea_ice_y_velocity',
-                'sea_surface_height_above_geoid',
-                'x_sea_water_velocity',
-                'y_sea_water_velocity',
-            ),
-            "dataset-topaz4-arc-myoceanv2-be/": (
-                'longitude',
-                'latitude',
-                'sea_floor_depth_below_geoid',
-                'sea_water_potential_temperature',
-                'sea_water_salinity',
-                'x_sea_water_velocity',
-                'y_sea_water_velocity',
-                'ocean_mixed_layer_thickness',
-                'sea_surface_height_above_geoid',
-                'ocean_barotropic_streamfunction',
-                'sea_ice_area_fraction',
-                'sea_ice_thickness',
-                'sea_ice_x_velocity',
-                'sea_ice_y_velocity',
-                'surface_snow_thickness',
-                'fy_frac',
-                'fy_age',
-                'sea_ice_albedo',
-                'sea_water_potential_temperature_at_sea_floor',
-            ),
-        }
-
-        for prefix, parameter_list in parameters.items():
-            if raw_metadata['url'].startswith(f"{self.url_prefix}/{prefix}"):
-                return utils.create_parameter_list(parameter_list)
-        return []
+        return self.find_dataset_parameters(raw_metadata['url'])
 
 
 class CMEMS002001MetadataNormalizer(CMEMSMetadataNormalizer):
@@ -531,78 +505,61 @@ class CMEMS002001MetadataNormalizer(CMEMSMetadataNormalizer):
             lambda time: (time, time + relativedelta(days=1))
         ),
     )
+    entry_title = 'Arctic Ocean Physics Analysis and Forecast, 6.25 km'
+    summary = {
+        'description': 'TOPAZ 5 physical model',
+        'processing_level': '4',
+        'product': 'ARCTIC_ANALYSISFORECAST_PHY_002_001'
+    }
+    provider = 'NO/MET'
+    location_geometry = 'POLYGON((-180 50, -180 90, 180 90, 180 50, -180 50))'
+
+    dataset_parameters_table = utils.SubstringTable((
+        ('/topaz5_phy_hr_files/', (
+            'longitude',
+            'latitude',
+            'sea_floor_depth_below_geoid',
+            'sea_water_salinity',
+            'sea_water_potential_temperature',
+            'sea_ice_area_fraction',
+            'sea_ice_thickness',
+            'surface_snow_thickness',
+            'sea_ice_x_velocity',
+            'sea_ice_y_velocity',
+            'sea_surface_height_above_geoid',
+            'sea_water_x_velocity',
+            'sea_water_y_velocity',
+        )),
+        ('/topaz5_phy_dm_files/', (
+            'longitude',
+            'latitude',
+            'depth',
+            'sea_floor_depth_below_geoid',
+            'sea_water_potential_temperature',
+            'sea_water_salinity',
+            'sea_water_x_velocity',
+            'sea_water_y_velocity',
+            'ocean_mixed_layer_thickness_defined_by_sigma_theta',
+            'sea_surface_height_above_geoid',
+            'ocean_barotropic_streamfunction',
+            'sea_ice_area_fraction',
+            'sea_ice_thickness',
+            'sea_ice_x_velocity',
+            'sea_ice_y_velocity',
+            'surface_snow_thickness',
+            'age_of_sea_ice',
+            'sea_ice_classification',
+            'sea_ice_albedo',
+            'sea_water_potential_temperature_at_sea_floor',
+        )),
+    ))
 
     def check(self, raw_metadata):
         return '-metno-MODEL-topaz5-ARC-' in raw_metadata.get('url', '')
 
-    def get_provider(self, raw_metadata):
-        return utils.get_gcmd_provider(['NO/MET'])
-
-    def get_entry_title(self, raw_metadata):
-        return 'Arctic Ocean Physics Analysis and Forecast, 6.25 km'
-
-    def get_summary(self, raw_metadata):
-        return utils.dict_to_string({
-            utils.SUMMARY_FIELDS['description']: 'TOPAZ 5 physical model',
-            utils.SUMMARY_FIELDS['processing_level']: '4',
-            utils.SUMMARY_FIELDS['product']: 'ARCTIC_ANALYSISFORECAST_PHY_002_001'
-        })
-
-    def get_platform(self, raw_metadata):
-        return utils.get_gcmd_platform('OPERATIONAL MODELS')
-
-    def get_instrument(self, raw_metadata):
-        return utils.get_gcmd_instrument('Computer')
-
-    def get_location_geometry(self, raw_metadata):
-        return 'POLYGON((-180 50, -180 90, 180 90, 180 50, -180 50))'
-
     @utils.raises(KeyError)
     def get_dataset_parameters(self, raw_metadata):
-        parameters = {
-            "/topaz5_phy_hr_files/": (
-                'longitude',
-                'latitude',
-                'sea_floor_depth_below_geoid',
-                'sea_water_salinity',
-                'sea_water_potential_temperature',
-                'sea_ice_area_fraction',
-                'sea_ice_thickness',
-                'surface_snow_thickness',
-                'sea_ice_x_velocity',
-                'sea_ice_y_velocity',
-                'sea_surface_height_above_geoid',
-                'sea_water_x_velocity',
-                'sea_water_y_velocity',
-            ),
-            "/topaz5_phy_dm_files/": (
-                'longitude',
-                'latitude',
-                'depth',
-                'sea_floor_depth_below_geoid',
-                'sea_water_potential_temperature',
-                'sea_water_salinity',
-                'sea_water_x_velocity',
-                'sea_water_y_velocity',
-                'ocean_mixed_layer_thickness_defined_by_sigma_theta',
-                'sea_surface_height_above_geoid',
-                'ocean_barotropic_streamfunction',
-                'sea_ice_area_fraction',
-                'sea_ice_thickness',
-                'sea_ice_x_velocity',
-                'sea_ice_y_velocity',
-                'surface_snow_thickness',
-                'age_of_sea_ice',
-                'sea_ice_classification',
-                'sea_ice_albedo',
-                'sea_water_potential_temperature_at_sea_floor',
-            ),
-        }
-
-        for prefix, parameter_list in parameters.items():
-            if prefix in raw_metadata['url']:
-                return utils.create_parameter_list(parameter_list)
-        return []
+        return self.find_dataset_parameters(raw_metadata['url'])
 
 
 class CMEMS002004MetadataNormalizer(CMEMSMetadataNormalizer):
@@ -620,6 +577,55 @@ class CMEMS002004MetadataNormalizer(CMEMSMetadataNormalizer):
             lambda time: (time, time + relativedelta(months=1))
         ),
     )
+    entry_title = 'Arctic Ocean Biogeochemistry Analysis and Forecast, 6.25 km'
+    summary = {
+        'description': 'TOPAZ 5 biochemistry model',
+        'processing_level': '4',
+        'product': 'ARCTIC_ANALYSISFORECAST_BGC_002_004'
+    }
+    location_geometry = 'POLYGON((-180 50, -180 90, 180 90, 180 50, -180 50))'
+
+    dataset_parameters_table = utils.SubstringTable((
+        ('/topaz5_bgc_mm_files/', (
+            'longitude',
+            'latitude',
+            'sea_floor_depth_below_geoid',
+            ('net_primary_production_of_biomass_'
+                'expressed_as_carbon_per_unit_volume_in_sea_water'),
+            'mass_concentration_of_chlorophyll_a_in_sea_water',
+            'volume_attenuation_coefficient_of_downwelling_radiative_flux_in_sea_water',
+            'mole_concentration_of_nitrate_in_sea_water',
+            'mole_concentration_of_phosphate_in_sea_water',
+            'mole_concentration_of_phytoplankton_expressed_as_carbon_in_sea_water',
+            'mole_concentration_of_zooplankton_expressed_as_carbon_in_sea_water',
+            'mole_concentration_of_dissolved_molecular_oxygen_in_sea_water',
+            'mole_concentration_of_silicate_in_sea_water',
+            'sinking_mole_flux_of_particulate_organic_matter_expressed_as_carbon_in_sea_water',
+            'sea_water_ph_reported_on_total_scale',
+            'mole_concentration_of_dissolved_inorganic_carbon_in_sea_water',
+            'surface_partial_pressure_of_carbon_dioxide_in_sea_water',
+        )),
+        ('/topaz5_bgc_dm_files/', (
+            'longitude',
+            'latitude',
+            'depth',
+            'sea_floor_depth_below_geoid',
+            ('net_primary_production_of_biomass_'
+                'expressed_as_carbon_per_unit_volume_in_sea_water'),
+            'mass_concentration_of_chlorophyll_a_in_sea_water',
+            'volume_attenuation_coefficient_of_downwelling_radiative_flux_in_sea_water',
+            'mole_concentration_of_nitrate_in_sea_water',
+            'mole_concentration_of_phosphate_in_sea_water',
+            'mole_concentration_of_phytoplankton_expressed_as_carbon_in_sea_water',
+            'mole_concentration_of_zooplankton_expressed_as_carbon_in_sea_water',
+            'mole_concentration_of_dissolved_molecular_oxygen_in_sea_water',
+            'mole_concentration_of_silicate_in_sea_water',
+            'sinking_mole_flux_of_particulate_organic_matter_expressed_as_carbon_in_sea_water',
+            'sea_water_ph_reported_on_total_scale',
+            'mole_concentration_of_dissolved_inorganic_carbon_in_sea_water',
+            'surface_partial_pressure_of_carbon_dioxide_in_sea_water',
+        )),
+    ))
 
     def check(self, raw_metadata):
         return '-metno-MODEL-topaz5_ecosmo-ARC-' in raw_metadata.get('url', '')
@@ -632,73 +638,9 @@ class CMEMS002004MetadataNormalizer(CMEMSMetadataNormalizer):
         else:
             return None
 
-    def get_entry_title(self, raw_metadata):
-        return 'Arctic Ocean Biogeochemistry Analysis and Forecast, 6.25 km'
-
-    def get_summary(self, raw_metadata):
-        return utils.dict_to_string({
-            utils.SUMMARY_FIELDS['description']: 'TOPAZ 5 biochemistry model',
-            utils.SUMMARY_FIELDS['processing_level']: '4',
-            utils.SUMMARY_FIELDS['product']: 'ARCTIC_ANALYSISFORECAST_BGC_002_004'
-        })
-
-    def get_platform(self, raw_metadata):
-        return utils.get_gcmd_platform('OPERATIONAL MODELS')
-
-    def get_instrument(self, raw_metadata):
-        return utils.get_gcmd_instrument('Computer')
-
-    def get_location_geometry(self, raw_metadata):
-        return 'POLYGON((-180 50, -180 90, 180 90, 180 50, -180 50))'
-
     @utils.raises(KeyError)
     def get_dataset_parameters(self, raw_metadata):
-        parameters = {
-            "/topaz5_bgc_mm_files/": (
-                'longitude',
-                'latitude',
-                'sea_floor_depth_below_geoid',
-                ('net_primary_production_of_biomass_'
-                    'expressed_as_carbon_per_unit_volume_in_sea_water'),
-                'mass_concentration_of_chlorophyll_a_in_sea_water',
-                'volume_attenuation_coefficient_of_downwelling_radiative_flux_in_sea_water',
-                'mole_concentration_of_nitrate_in_sea_water',
-                'mole_concentration_of_phosphate_in_sea_water',
-                'mole_concentration_of_phytoplankton_expressed_as_carbon_in_sea_water',
-                'mole_concentration_of_zooplankton_expressed_as_carbon_in_sea_water',
-                'mole_concentration_of_dissolved_molecular_oxygen_in_sea_water',
-                'mole_concentration_of_silicate_in_sea_water',
-                'sinking_mole_flux_of_particulate_organic_matter_expressed_as_carbon_in_sea_water',
-                'sea_water_ph_reported_on_total_scale',
-                'mole_concentration_of_dissolved_inorganic_carbon_in_sea_water',
-                'surface_partial_pressure_of_carbon_dioxide_in_sea_water',
-            ),
-            "/topaz5_bgc_dm_files/": (
-                'longitude',
-                'latitude',
-                'depth',
-                'sea_floor_depth_below_geoid',
-                ('net_primary_production_of_biomass_'
-                    'expressed_as_carbon_per_unit_volume_in_sea_water'),
-                'mass_concentration_of_chlorophyll_a_in_sea_water',
-                'volume_attenuation_coefficient_of_downwelling_radiative_flux_in_sea_water',
-                'mole_concentration_of_nitrate_in_sea_water',
-                'mole_concentration_of_phosphate_in_sea_water',
-                'mole_concentration_of_phytoplankton_expressed_as_carbon_in_sea_water',
-                'mole_concentration_of_zooplankton_expressed_as_carbon_in_sea_water',
-                'mole_concentration_of_dissolved_molecular_oxygen_in_sea_water',
-                'mole_concentration_of_silicate_in_sea_water',
-                'sinking_mole_flux_of_particulate_organic_matter_expressed_as_carbon_in_sea_water',
-                'sea_water_ph_reported_on_total_scale',
-                'mole_concentration_of_dissolved_inorganic_carbon_in_sea_water',
-                'surface_partial_pressure_of_carbon_dioxide_in_sea_water',
-            ),
-        }
-
-        for prefix, parameter_list in parameters.items():
-            if prefix in raw_metadata['url']:
-                return utils.create_parameter_list(parameter_list)
-        return []
+        return self.find_dataset_parameters(raw_metadata['url'])
 
 
 class CMEMS001027MetadataNormalizer(CMEMSMetadataNormalizer):
@@ -713,52 +655,37 @@ class CMEMS001027MetadataNormalizer(CMEMSMetadataNormalizer):
             lambda time: (time, time + relativedelta(hours=24))
         ),
     )
-
-    def get_entry_title(self, raw_metadata):
-        return 'Global Ocean Waves Analysis and Forecast'
-
-    def get_summary(self, raw_metadata):
-        return utils.dict_to_string({
-            utils.SUMMARY_FIELDS['description']:
+    entry_title = 'Global Ocean Waves Analysis and Forecast'
+    summary = {
+        'description':
             'The operational global ocean analysis and forecast system of Météo-France with a '
             'resolution of 1/12 degree is providing daily analyses and 10 days forecasts for the '
             'global ocean sea surface waves. This product includes 3-hourly instantaneous fields of'
             ' integrated wave parameters from the total spectrum (significant height, period, '
             'direction, Stokes drift,...etc), as well as the following partitions: the wind wave, '
             'the primary and secondary swell waves.',
-            utils.SUMMARY_FIELDS['processing_level']: '4',
-            utils.SUMMARY_FIELDS['product']: 'GLOBAL_ANALYSISFORECAST_WAV_001_027'
-        })
-
-    def get_platform(self, raw_metadata):
-        return utils.get_gcmd_platform('OPERATIONAL MODELS')
-
-    def get_instrument(self, raw_metadata):
-        return utils.get_gcmd_instrument('Computer')
-
-    def get_location_geometry(self, raw_metadata):
-        return utils.WORLD_WIDE_COVERAGE_WKT
-
-    def get_dataset_parameters(self, raw_metadata):
-        return utils.create_parameter_list((
-            'sea_surface_wave_significant_height',
-            'sea_surface_wind_wave_from_direction',
-            'sea_surface_wind_wave_significant_height',
-            'sea_surface_primary_swell_wave_from_direction',
-            'sea_surface_primary_swell_wave_mean_period',
-            'sea_surface_secondary_swell_wave_from_direction',
-            'sea_surface_secondary_swell_wave_mean_period',
-            'sea_surface_wave_from_direction',
-            'sea_surface_wave_mean_period_from_variance_spectral_density_inverse_frequency_moment',
-            'sea_surface_primary_swell_wave_significant_height',
-            'sea_surface_secondary_swell_wave_significant_height',
-            'sea_surface_wave_period_at_variance_spectral_density_maximum',
-            'sea_surface_wave_stokes_drift_x_velocity',
-            'sea_surface_wave_stokes_drift_y_velocity',
-            'sea_surface_wave_from_direction_at_variance_spectral_density_maximum',
-            'sea_surface_wave_mean_period_from_variance_spectral_density_second_frequency_moment',
-            'sea_surface_wind_wave_mean_period',
-        ))
+        'processing_level': '4',
+        'product': 'GLOBAL_ANALYSISFORECAST_WAV_001_027'
+    }
+    dataset_parameters = (
+        'sea_surface_wave_significant_height',
+        'sea_surface_wind_wave_from_direction',
+        'sea_surface_wind_wave_significant_height',
+        'sea_surface_primary_swell_wave_from_direction',
+        'sea_surface_primary_swell_wave_mean_period',
+        'sea_surface_secondary_swell_wave_from_direction',
+        'sea_surface_secondary_swell_wave_mean_period',
+        'sea_surface_wave_from_direction',
+        'sea_surface_wave_mean_period_from_variance_spectral_density_inverse_frequency_moment',
+        'sea_surface_primary_swell_wave_significant_height',
+        'sea_surface_secondary_swell_wave_significant_height',
+        'sea_surface_wave_period_at_variance_spectral_density_maximum',
+        'sea_surface_wave_stokes_drift_x_velocity',
+        'sea_surface_wave_stokes_drift_y_velocity',
+        'sea_surface_wave_from_direction_at_variance_spectral_density_maximum',
+        'sea_surface_wave_mean_period_from_variance_spectral_density_second_frequency_moment',
+        'sea_surface_wind_wave_mean_period',
+    )
 
 
 class CMEMS001028MetadataNormalizer(CMEMSMetadataNormalizer):
@@ -778,42 +705,27 @@ class CMEMS001028MetadataNormalizer(CMEMSMetadataNormalizer):
             lambda time: (time, time + relativedelta(months=1))
         ),
     )
-
-    def get_entry_title(self, raw_metadata):
-        return 'Global Ocean Biogeochemistry Analysis and Forecast'
-
-    def get_summary(self, raw_metadata):
-        return utils.dict_to_string({
-            utils.SUMMARY_FIELDS['description']:
+    entry_title = 'Global Ocean Biogeochemistry Analysis and Forecast'
+    summary = {
+        'description':
             'The Operational Mercator Ocean biogeochemical global ocean analysis and forecast '
             'system at 1/4 degree is providing 10 days of 3D global ocean forecasts updated weekly.'
             ' The time series is aggregated in time, in order to reach a two full year’s time '
             'series sliding window.',
-            utils.SUMMARY_FIELDS['processing_level']: '4',
-            utils.SUMMARY_FIELDS['product']: 'GLOBAL_ANALYSIS_FORECAST_BIO_001_028'
-        })
-
-    def get_platform(self, raw_metadata):
-        return utils.get_gcmd_platform('OPERATIONAL MODELS')
-
-    def get_instrument(self, raw_metadata):
-        return utils.get_gcmd_instrument('Computer')
-
-    def get_location_geometry(self, raw_metadata):
-        return utils.WORLD_WIDE_COVERAGE_WKT
-
-    def get_dataset_parameters(self, raw_metadata):
-        return utils.create_parameter_list((
-            'sea_water_alkalinity_expressed_as_mole_equivalent',
-            'mass_concentration_of_chlorophyll_a_in_sea_water',
-            'mole_concentration_of_dissolved_inorganic_carbon_in_sea_water',
-            'mole_concentration_of_dissolved_iron_in_sea_water',
-            'mole_concentration_of_nitrate_in_sea_water',
-            'net_primary_production_of_biomass_expressed_as_carbon_per_unit_volume_in_sea_water',
-            'mole_concentration_of_dissolved_molecular_oxygen_in_sea_water',
-            'sea_water_ph_reported_on_total_scale',
-            'mole_concentration_of_phytoplankton_expressed_as_carbon_in_sea_water',
-            'mole_concentration_of_phosphate_in_sea_water',
-            'mole_concentration_of_silicate_in_sea_water',
-            'surface_partial_pressure_of_carbon_dioxide_in_sea_water',
-        ))
+        'processing_level': '4',
+        'product': 'GLOBAL_ANALYSIS_FORECAST_BIO_001_028'
+    }
+    dataset_parameters = (
+        'sea_water_alkalinity_expressed_as_mole_equivalent',
+        'mass_concentration_of_chlorophyll_a_in_sea_water',
+        'mole_concentration_of_dissolved_inorganic_carbon_in_sea_water',
+        'mole_concentration_of_dissolved_iron_in_sea_water',
+        'mole_concentration_of_nitrate_in_sea_water',
+        'net_primary_production_of_biomass_expressed_as_carbon_per_unit_volume_in_sea_water',
+        'mole_concentration_of_dissolved_molecular_oxygen_in_sea_water',
+        'sea_water_ph_reported_on_total_scale',
+        'mole_concentration_of_phytoplankton_expressed_as_carbon_in_sea_water',
+        'mole_concentration_of_phosphate_in_sea_water',
+        'mole_concentration_of_silicate_in_sea_water',
+        'surface_partial_pressure_of_carbon_dioxide_in_sea_water',
+    )
@@ -73,15 +73,17 @@ class CMEMSInSituTACMetadataNormalizer(GeoSPaaSMetadataNormalizer):
 
     @utils.raises((KeyError, dateutil.parser.ParserError))
     def get_time_coverage_start(self, raw_metadata):
-        return dateutil.parser.parse(raw_metadata['time_coverage_start'])
+        return utils.parse_datetime(raw_metadata['time_coverage_start'])
 
     @utils.raises((KeyError, dateutil.parser.ParserError))
     def get_time_coverage_end(self, raw_metadata):
-        return dateutil.parser.parse(raw_metadata['time_coverage_end'])
+        return utils.parse_datetime(raw_metadata['time_coverage_end'])
 
+    @utils.record_independent
     def get_platform(self, raw_metadata):
         return utils.get_gcmd_platform('In Situ Ocean-based Platforms')
 
+    @utils.record_independent
     def get_instrument(self, raw_metadata):
         return utils.get_gcmd_instrument('In Situ/Laboratory Instruments')
 
@@ -89,5 +91,6 @@ class CMEMSInSituTACMetadataNormalizer(GeoSPaaSMetadataNormalizer):
     def get_location_geometry(self, raw_metadata):
         return raw_metadata.get('geometry', '')
 
+    @utils.record_independent
     def get_provider(self, raw_metadata):
         return utils.get_gcmd_provider(['cmems'])
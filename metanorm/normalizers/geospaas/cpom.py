@@ -16,21 +16,27 @@ class CPOMAltimetryMetadataNormalizer(GeoSPaaSMetadataNormalizer):
     def check(self, raw_metadata):
         return raw_metadata.get('url', '').rstrip('/').split('/')[-1] == "CPOM_DOT.nc"
 
+    @utils.record_independent
     def get_entry_title(self, raw_metadata):
         return 'CPOM SLA'
 
+    @utils.record_independent
     def get_entry_id(self, raw_metadata):
         return "CPOM_DOT"
 
+    @utils.record_independent
     def get_time_coverage_start(self, raw_metadata):
         return datetime(2003, 1, 1, tzinfo=timezone.utc)
 
+    @utils.record_independent
     def get_time_coverage_end(self, raw_metadata):
         return datetime(2015, 1, 1, tzinfo=timezone.utc)
 
+    @utils.record_independent
     def get_platform(self, raw_metadata):
         return utils.get_gcmd_platform('Earth Observation Satellites')
 
+    @utils.record_independent
     def get_instrument(self, raw_metadata):
         return utils.get_gcmd_instrument('Altimeters')
 
@@ -38,8 +44,10 @@ class CPOMAltimetryMetadataNormalizer(GeoSPaaSMetadataNormalizer):
     def get_location_geometry(self, raw_metadata):
         return raw_metadata.get('geometry', '')
 
+    @utils.record_independent
     def get_provider(self, raw_metadata):
         return utils.get_gcmd_provider(['UC-LONDON/CPOM'])
 
+    @utils.record_independent
     def get_dataset_parameters(self, raw_metadata):
         return utils.create_parameter_list(['sea_surface_height_above_sea_level'])
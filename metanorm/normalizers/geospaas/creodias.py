@@ -1,8 +1,5 @@
 """Normalizer for the metadata used in the Creodias finder API"""
 
-import dateutil
-import dateutil.parser
-
 import metanorm.utils as utils
 
 from .base import GeoSPaaSMetadataNormalizer
@@ -14,7 +11,6 @@ class CreodiasEOFinderMetadataNormalizer(GeoSPaaSMetadataNormalizer):
     attributes
     """
 
-    @utils.raises(KeyError)
     def check(self, raw_metadata):
         """Looks for a URL in `raw_metadata['url']`
         (added in geospaas_harvesting) and in
@@ -55,11 +51,11 @@ class CreodiasEOFinderMetadataNormalizer(GeoSPaaSMetadataNormalizer):
 
     @utils.raises(KeyError)
     def get_time_coverage_start(self, raw_metadata):
-        return dateutil.parser.parse(raw_metadata['startDate']).replace(microsecond=0)
+        return utils.parse_datetime(raw_metadata['startDate']).replace(microsecond=0)
 
     @utils.raises(KeyError)
     def get_time_coverage_end(self, raw_metadata):
-        return dateutil.parser.parse(raw_metadata['completionDate']).replace(microsecond=0)
+        return utils.parse_datetime(raw_metadata['completionDate']).replace(microsecond=0)
 
     @utils.raises(KeyError)
     def get_platform(self, raw_metadata):
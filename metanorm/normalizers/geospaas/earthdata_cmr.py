@@ -50,12 +50,12 @@ class EarthdataCMRMetadataNormalizer(GeoSPaaSMetadataNormalizer):
 
     @utils.raises((KeyError, dateutil.parser.ParserError))
     def get_time_coverage_start(self, raw_metadata):
-        return dateutil.parser.parse(
+        return utils.parse_datetime(
             raw_metadata['umm']['TemporalExtent']['RangeDateTime']['BeginningDateTime'])
 
     @utils.raises((KeyError, dateutil.parser.ParserError))
     def get_time_coverage_end(self, raw_metadata):
-        return dateutil.parser.parse(
+        return utils.parse_datetime(
             raw_metadata['umm']['TemporalExtent']['RangeDateTime']['EndingDateTime'])
 
     @utils.raises((KeyError, IndexError))
@@ -12,18 +12,21 @@ class GPortalGCOMAMSR2L3MetadataNormalizer(GeoSPaaSMetadataNormalizer):
     L3 dataset
     """
 
+    url_prefixes = ('ftp://ftp.gportal.jaxa.jp/standard/GCOM-W/GCOM-W.AMSR2/L3.SST',)
+
     def check(self, raw_metadata):
         """Checks that the URL starts with the right prefix"""
-        return raw_metadata.get('url', '').startswith(
-            'ftp://ftp.gportal.jaxa.jp/standard/GCOM-W/GCOM-W.AMSR2/L3.SST')
+        return raw_metadata.get('url', '').startswith(self.url_prefixes)
 
+    @utils.record_independent
     def get_entry_title(self, raw_metadata):
         return 'AMSR2-L3 Sea Surface Temperature'
 
     @utils.raises((AttributeError, KeyError))
     def get_entry_id(self, raw_metadata):
-        return utils.NC_H5_FILENAME_MATCHER.search(raw_metadata['url']).group(1)
+        return utils.regex_search(utils.NC_H5_FILENAME_MATCHER, raw_metadata['url']).group(1)
 
+    @utils.record_independent
     def get_summary(self, raw_metadata):
         return utils.dict_to_string({
             utils.SUMMARY_FIELDS['description']: 'GCOM-W AMSR2 data',
@@ -51,17 +54,22 @@ class GPortalGCOMAMSR2L3MetadataNormalizer(GeoSPaaSMetadataNormalizer):
     def get_time_coverage_end(self, raw_metadata):
         return utils.find_time_coverage(self.time_patterns, raw_metadata['url'])[1]
 
+    @utils.record_independent
     def get_platform(self, raw_metadata):
         return utils.get_gcmd_platform('GCOM-W1')
 
+    @utils.record_independent
     def get_instrument(self, raw_metadata):
         return utils.get_gcmd_instrument('AMSR2')
 
+    @utils.record_independent
     def get_location_geometry(self, raw_metadata):
         return utils.WORLD_WIDE_COVERAGE_WKT
 
+    @utils.record_independent
     def get_provider(self, raw_metadata):
         return utils.get_gcmd_provider(['JP/JAXA/EOC'])
 
+    @utils.record_independent
     def get_dataset_parameters(self, raw_metadata):
         return utils.create_parameter_list(('sea_surface_temperature',))
@@ -9,7 +9,6 @@ import pythesint as pti
 import metanorm.utils as utils
 
 from .base import GeoSPaaSMetadataNormalizer
-from ...errors import MetadataNormalizationError
 
 
 class NextsimMetadataNormalizer(GeoSPaaSMetadataNormalizer):
@@ -17,13 +16,22 @@ class NextsimMetadataNormalizer(GeoSPaaSMetadataNormalizer):
     CMEMS In Situ TAC attributes
     """
 
+    entry_id_matcher = re.compile(
+        r'^.*/(\d{8}_hr-nersc-MODEL-nextsimf-ARC-b\d{8}-fv\d{2}.\d).nc$')
+
+    def probe(self, raw_metadata):
+        """Returns the match of the entry ID in the dataset's URL, or
+        None if it is not a neXtSIM dataset. The match is reused by
+        get_entry_id()
+        """
+        url = raw_metadata.get('url')
+        if not isinstance(url, str):
+            return None
+        return utils.regex_search(self.entry_id_matcher, url)
+
     def check(self, raw_metadata):
-        """Check that the dataset's id matches CMEMS in situ TAC data"""
-        try:
-            entry_id = self.get_entry_id(raw_metadata)
-        except MetadataNormalizationError:
-            return False
-        return bool(entry_id) # return True if the entry_id is not empty
+        """Check that the dataset's URL matches neXtSIM data"""
+        return self.probe(raw_metadata) is not None
 
     @utils.raises(KeyError)
     def get_entry_title(self, raw_metadata):
@@ -31,11 +39,9 @@ class NextsimMetadataNormalizer(GeoSPaaSMetadataNormalizer):
 
     @utils.raises((AttributeError, KeyError))
     def get_entry_id(self, raw_metadata):
-        return re.match(
-            r'^.*/(\d{8}_hr-nersc-MODEL-nextsimf-ARC-b\d{8}-fv\d{2}.\d).nc$',
-            raw_metadata['url']
-        ).group(1)
+        return utils.regex_search(self.entry_id_matcher, raw_metadata['url']).group(1)
 
+    @utils.record_independent
     def get_summary(self, raw_metadata):
         """Get the dataset's summary if it is available in the
         metadata, otherwise use a default
@@ -51,7 +57,7 @@ class NextsimMetadataNormalizer(GeoSPaaSMetadataNormalizer):
 
     @utils.raises((KeyError, dateutil.parser.ParserError))
     def get_time_coverage_start(self, raw_metadata):
-        date = dateutil.parser.parse(raw_metadata['field_date'])
+        date = utils.parse_datetime(raw_metadata['field_date'])
         if not date.tzinfo:
             date = date.replace(tzinfo=timezone.utc)
         return date
@@ -60,14 +66,18 @@ class NextsimMetadataNormalizer(GeoSPaaSMetadataNormalizer):
     def get_time_coverage_end(self, raw_metadata):
         return self.get_time_coverage_start(raw_metadata) + timedelta(days=1)
 
+    @utils.record_independent
     def get_platform(self, raw_metadata):
         return utils.get_gcmd_platform('OPERATIONAL MODELS')
 
+    @utils.record_independent
     def get_instrument(self, raw_metadata):
         return utils.get_gcmd_instrument('Computer')
 
+    @utils.record_independent
     def get_location_geometry(self, raw_metadata):
         return utils.wkt_polygon_from_wgs84_limits('90', '62', '180', '-180')
 
+    @utils.record_independent
     def get_provider(self, raw_metadata):
         return utils.get_gcmd_provider(['NERSC'])
@@ -14,18 +14,32 @@ class NOAAHYCOMMetadataNormalizer(GeoSPaaSMetadataNormalizer):
     """
 
     url_prefix = 'ftp://ftp.opc.ncep.noaa.gov/grids/operational/GLOBALHYCOM/Navy'
+    url_prefixes = (url_prefix,)
+    locations = utils.PrefixTable((
+        (f"{url_prefix}/hycom_glb_regp01",
+         'POLYGON((-100.04 70.04, -100.04 -0.04, -49.96 -0.04, -49.96 70.04, -100.04 70.04))'),
+        (f"{url_prefix}/hycom_glb_regp06",
+         'POLYGON((149.96 70.04, 149.96 9.96, 210.04 9.96, 210.04 70.04, 149.96 70.04))'),
+        (f"{url_prefix}/hycom_glb_regp07",
+         'POLYGON((-150.04 60.04, -150.04 9.96, -99.96 9.96, -99.96 60.04, -150.04 60.04))'),
+        (f"{url_prefix}/hycom_glb_regp17",
+         'POLYGON((-180.04 80.02,-180.04 59.98,-119.96 59.98,-119.96 80.02,-180.04 80.02))'),
+        (f"{url_prefix}/hycom_glb_sfc_u", utils.WORLD_WIDE_COVERAGE_WKT),
+    ))
 
     def check(self, raw_metadata):
         """Checks that the URL starts with the right prefix"""
         return raw_metadata.get('url', '').startswith(self.url_prefix)
 
+    @utils.record_independent
     def get_entry_title(self, raw_metadata):
         return 'Global Hybrid Coordinate Ocean Model (HYCOM)'
 
     @utils.raises((KeyError, AttributeError))
     def get_entry_id(self, raw_metadata):
-        return utils.NC_H5_FILENAME_MATCHER.search(raw_metadata['url']).group(1)
+        return utils.regex_search(utils.NC_H5_FILENAME_MATCHER, raw_metadata['url']).group(1)
 
+    @utils.record_independent
     def get_summary(self, raw_metadata):
         return utils.dict_to_string({
             utils.SUMMARY_FIELDS['description']:
@@ -58,33 +72,27 @@ class NOAAHYCOMMetadataNormalizer(GeoSPaaSMetadataNormalizer):
     def get_time_coverage_end(self, raw_metadata):
         return utils.find_time_coverage(self.time_patterns, raw_metadata['url'])[1]
 
+    @utils.record_independent
     def get_platform(self, raw_metadata):
         return utils.get_gcmd_platform('OPERATIONAL MODELS')
 
+    @utils.record_independent
     def get_instrument(self, raw_metadata):
         return utils.get_gcmd_instrument('Computer')
 
     @utils.raises(KeyError)
     def get_location_geometry(self, raw_metadata):
-        locations = {
-            'hycom_glb_regp01': 'POLYGON((-100.04 70.04, -100.04 -0.04, -49.96 -0.04, '
-                                '-49.96 70.04, -100.04 70.04))',
-            'hycom_glb_regp06': 'POLYGON((149.96 70.04, 149.96 9.96, 210.04 9.96, 210.04 70.04, '
-                                '149.96 70.04))',
-            'hycom_glb_regp07': 'POLYGON((-150.04 60.04, -150.04 9.96, -99.96 9.96, -99.96 60.04, '
-                                '-150.04 60.04))',
-            'hycom_glb_regp17': 'POLYGON((-180.04 80.02,-180.04 59.98,-119.96 59.98,-119.96 80.02,'
-                                '-180.04 80.02))',
-            'hycom_glb_sfc_u': utils.WORLD_WIDE_COVERAGE_WKT,
-        }
-        for prefix, location in locations.items():
-            if raw_metadata['url'].startswith(f"{self.url_prefix}/{prefix}"):
-                return location
-        raise MetadataNormalizationError(f"Could not find a location gemetry for {raw_metadata}")
+        location = self.locations.find(raw_metadata['url'])
+        if location is None:
+            raise MetadataNormalizationError(
+                f"Could not find a location gemetry for {raw_metadata}")
+        return location
 
+    @utils.record_independent
     def get_provider(self, raw_metadata):
         return utils.get_gcmd_provider(['DOC/NOAA/NWS/NCEP'])
 
+    @utils.record_independent
     def get_dataset_parameters(self, raw_metadata):
         return utils.create_parameter_list((
             'sea_water_salinity',
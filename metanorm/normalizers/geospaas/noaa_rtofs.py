@@ -12,11 +12,32 @@ class NOAARTOFSMetadataNormalizer(GeoSPaaSMetadataNormalizer):
     dataset
     """
 
+    url_prefixes = ('ftp://ftpprd.ncep.noaa.gov/pub/data/nccf/com/rtofs/prod',)
+    locations = utils.SubstringTable((
+        ('US_east', ('POLYGON (('
+                     '-105.193603515625 0, -40.719970703125 0,'
+                     '-40.719970703125 79.74808502197266,'
+                     '-105.193603515625 79.74808502197266,'
+                     '-105.193603515625 0))')),
+        ('US_west', ('POLYGON (('
+                     '-157.9200439453125 10.02840137481689,'
+                     '-74.239990234375 10.02840137481689,'
+                     '-74.239990234375 74.57466888427734,'
+                     '-157.9200439453125 74.57466888427734,'
+                     '-157.9200439453125 10.02840137481689))')),
+        ('alaska', ('POLYGON (('
+                    '-179.1199951171875 45.77324676513672,'
+                    '-112.6572265625 45.77324676513672,'
+                    '-112.6572265625 78.41667938232422,'
+                    '-179.1199951171875 78.41667938232422,'
+                    '-179.1199951171875 45.77324676513672))')),
+    ))
+
     def check(self, raw_metadata):
         """Checks that the URL starts with the right prefix"""
-        return raw_metadata.get('url', '').startswith(
-            'ftp://ftpprd.ncep.noaa.gov/pub/data/nccf/com/rtofs/prod')
+        return raw_metadata.get('url', '').startswith(self.url_prefixes)
 
+    @utils.record_independent
     def get_entry_title(self, raw_metadata):
         return 'Global operational Real-Time Ocean Forecast System'
 
@@ -24,6 +45,7 @@ class NOAARTOFSMetadataNormalizer(GeoSPaaSMetadataNormalizer):
     def get_entry_id(self, raw_metadata):
         return re.search(r'(\d{8}/[^/]+)\.(nc|h5)(\.gz)?$', raw_metadata['url']).group(1)
 
+    @utils.record_independent
     def get_summary(self, raw_metadata):
         return utils.dict_to_string({
             utils.SUMMARY_FIELDS['description']:
@@ -74,38 +96,19 @@ class NOAARTOFSMetadataNormalizer(GeoSPaaSMetadataNormalizer):
     def get_time_coverage_end(self, raw_metadata):
         return utils.find_time_coverage(self.time_patterns, raw_metadata['url'])[1]
 
+    @utils.record_independent
     def get_platform(self, raw_metadata):
         return utils.get_gcmd_platform('OPERATIONAL MODELS')
 
+    @utils.record_independent
     def get_instrument(self, raw_metadata):
         return utils.get_gcmd_instrument('Computer')
 
     @utils.raises(KeyError)
     def get_location_geometry(self, raw_metadata):
-        url = raw_metadata['url']
-        if 'US_east' in url:
-            return ('POLYGON (('
-                    '-105.193603515625 0, -40.719970703125 0,'
-                    '-40.719970703125 79.74808502197266,'
-                    '-105.193603515625 79.74808502197266,'
-                    '-105.193603515625 0))')
-        elif 'US_west' in url:
-            return ('POLYGON (('
-                    '-157.9200439453125 10.02840137481689,'
-                    '-74.239990234375 10.02840137481689,'
-                    '-74.239990234375 74.57466888427734,'
-                    '-157.9200439453125 74.57466888427734,'
-                    '-157.9200439453125 10.02840137481689))')
-        elif 'alaska' in url:
-            return ('POLYGON (('
-                    '-179.1199951171875 45.77324676513672,'
-                    '-112.6572265625 45.77324676513672,'
-                    '-112.6572265625 78.41667938232422,'
-                    '-179.1199951171875 78.41667938232422,'
-                    '-179.1199951171875 45.77324676513672))')
-        else:
-            return utils.WORLD_WIDE_COVERAGE_WKT
+        return self.locations.find(raw_metadata['url'], utils.WORLD_WIDE_COVERAGE_WKT)
 
+    @utils.record_independent
     def get_provider(self, raw_metadata):
         return utils.get_gcmd_provider(['DOC/NOAA/NWS/NCEP'])
 
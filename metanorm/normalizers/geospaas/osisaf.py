@@ -2,7 +2,6 @@
 
 import re
 
-import dateutil.parser
 from dateutil.tz import tzutc
 
 import metanorm.utils as utils
@@ -35,11 +34,11 @@ class OSISAFMetadataNormalizer(GeoSPaaSMetadataNormalizer):
 
     @utils.raises(KeyError)
     def get_time_coverage_start(self, raw_metadata):
-        return dateutil.parser.parse(raw_metadata['start_date']).replace(tzinfo=tzutc())
+        return utils.parse_datetime(raw_metadata['start_date']).replace(tzinfo=tzutc())
 
     @utils.raises(KeyError)
     def get_time_coverage_end(self, raw_metadata):
-        return dateutil.parser.parse(raw_metadata['stop_date']).replace(tzinfo=tzutc())
+        return utils.parse_datetime(raw_metadata['stop_date']).replace(tzinfo=tzutc())
 
     @utils.raises(KeyError)
     def get_platform(self, raw_metadata):
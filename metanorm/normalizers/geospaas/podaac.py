@@ -13,8 +13,10 @@ class PODAACMetadataNormalizer(GeoSPaaSMetadataNormalizer):
     attributes
     """
 
+    url_prefixes = ('https://opendap.jpl.nasa.gov/opendap/',)
+
     def check(self, raw_metadata):
-        return raw_metadata.get('url', '').startswith('https://opendap.jpl.nasa.gov/opendap/')
+        return raw_metadata.get('url', '').startswith(self.url_prefixes)
 
     @utils.raises(KeyError)
     def get_entry_title(self, raw_metadata):
@@ -22,7 +24,7 @@ class PODAACMetadataNormalizer(GeoSPaaSMetadataNormalizer):
 
     @utils.raises((AttributeError, KeyError))
     def get_entry_id(self, raw_metadata):
-        return utils.NC_H5_FILENAME_MATCHER.search(raw_metadata['url']).group(1)
+        return utils.regex_search(utils.NC_H5_FILENAME_MATCHER, raw_metadata['url']).group(1)
 
     @utils.raises(KeyError)
     def get_summary(self, raw_metadata):
@@ -37,11 +39,11 @@ class PODAACMetadataNormalizer(GeoSPaaSMetadataNormalizer):
 
     @utils.raises((KeyError, dateutil.parser.ParserError))
     def get_time_coverage_start(self, raw_metadata):
-        return dateutil.parser.parse(raw_metadata['time_coverage_start'])
+        return utils.parse_datetime(raw_metadata['time_coverage_start'])
 
     @utils.raises((KeyError, dateutil.parser.ParserError))
     def get_time_coverage_end(self, raw_metadata):
-        return dateutil.parser.parse(raw_metadata['time_coverage_end'])
+        return utils.parse_datetime(raw_metadata['time_coverage_end'])
 
     @utils.raises(KeyError)
     def get_platform(self, raw_metadata):
@@ -95,6 +97,7 @@ class PODAACMetadataNormalizer(GeoSPaaSMetadataNormalizer):
 
         return srid + result_wkt
 
+    @utils.record_independent
     def get_provider(self, raw_metadata):
         """Get the provider from the raw metadata"""
         return utils.get_gcmd_provider(['NASA/JPL/PODAAC'])
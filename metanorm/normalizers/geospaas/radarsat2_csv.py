@@ -30,14 +30,16 @@ class Radarsat2CSVMetadataNormalizer(GeoSPaaSMetadataNormalizer):
 
     @utils.raises((KeyError, dateutil.parser.ParserError))
     def get_time_coverage_start(self, raw_metadata):
-        return dateutil.parser.parse(raw_metadata['Date'])
+        return utils.parse_datetime(raw_metadata['Date'])
 
     def get_time_coverage_end(self, raw_metadata):
         return self.get_time_coverage_start(raw_metadata) + timedelta(minutes=5)
 
+    @utils.record_independent
     def get_platform(self, raw_metadata):
         return utils.get_gcmd_platform('RADARSAT-2')
 
+    @utils.record_independent
     def get_instrument(self, raw_metadata):
         return utils.get_gcmd_instrument('C-SAR')
 
@@ -49,8 +51,10 @@ class Radarsat2CSVMetadataNormalizer(GeoSPaaSMetadataNormalizer):
                 f"{footprint[4]} {footprint[5]}, {footprint[6]} {footprint[7]}, "
                 f"{footprint[8]} {footprint[9]}))")
 
+    @utils.record_independent
     def get_provider(self, raw_metadata):
         return utils.get_gcmd_provider(['CSA'])
 
+    @utils.record_independent
     def get_dataset_parameters(self, raw_metadata):
         return utils.create_parameter_list('surface_backwards_scattering_coefficient_of_radar_wave')
@@ -3,9 +3,6 @@
 import logging
 import re
 
-import dateutil
-import dateutil.parser
-
 import metanorm.utils as utils
 
 from .base import GeoSPaaSMetadataNormalizer
@@ -32,13 +29,16 @@ class ScihubODataMetadataNormalizer(GeoSPaaSMetadataNormalizer):
         r'(?P<product_id>[A-Z0-9]{4}|_{4})',
     ]))
 
+    url_prefixes = (
+        'https://apihub.copernicus.eu/apihub/odata/v1',
+        'https://scihub.copernicus.eu/apihub/odata/v1',
+        'https://apihub.copernicus.eu/dhus/odata/v1',
+        'https://scihub.copernicus.eu/dhus/odata/v1',
+        'https://colhub.met.no/odata/v1',
+    )
+
     def check(self, raw_metadata):
-        url = raw_metadata.get('url', '')
-        return (url.startswith('https://apihub.copernicus.eu/apihub/odata/v1')
-                or url.startswith('https://scihub.copernicus.eu/apihub/odata/v1')
-                or url.startswith('https://apihub.copernicus.eu/dhus/odata/v1')
-                or url.startswith('https://scihub.copernicus.eu/dhus/odata/v1')
-                or url.startswith('https://colhub.met.no/odata/v1'))
+        return raw_metadata.get('url', '').startswith(self.url_prefixes)
 
     @utils.raises(KeyError)
     def get_entry_title(self, raw_metadata):
@@ -76,12 +76,12 @@ class ScihubODataMetadataNormalizer(GeoSPaaSMetadataNormalizer):
     @utils.raises(KeyError)
     def get_time_coverage_start(self, raw_metadata):
         """Get the start of time coverage from the attributes"""
-        return dateutil.parser.parse(raw_metadata['Sensing start']).replace(microsecond=0)
+        return utils.parse_datetime(raw_metadata['Sensing start']).replace(microsecond=0)
 
     @utils.raises(KeyError)
     def get_time_coverage_end(self, raw_metadata):
         """Get the end of time coverage from the attributes"""
-        return dateutil.parser.parse(raw_metadata['Sensing stop']).replace(microsecond=0)
+        return utils.parse_datetime(raw_metadata['Sensing stop']).replace(microsecond=0)
 
     @utils.raises(KeyError)
     def get_platform(self, raw_metadata):
@@ -103,6 +103,7 @@ class ScihubODataMetadataNormalizer(GeoSPaaSMetadataNormalizer):
         """Returns a WKT string corresponding to the location of the dataset"""
         return raw_metadata['JTS footprint']
 
+    @utils.record_independent
     def get_provider(self, raw_metadata):
         """Returns a GCMD-like provider data structure"""
         return utils.get_gcmd_provider(['ESA/EO'])
@@ -115,4 +116,4 @@ class ScihubODataMetadataNormalizer(GeoSPaaSMetadataNormalizer):
                 'surface_backwards_scattering_coefficient_of_radar_wave'
             ])
         else:
-            return []
+            return ()
@@ -1,22 +1,66 @@
 """Utility functions for metadata normalizing"""
 
+import atexit
+import bisect
+import contextlib
+import contextvars
+import copy
 import importlib
 import functools
+import hashlib
+import os
+import pickle
 import pkgutil
 import re
 import sys
-from collections import OrderedDict
+import threading
+import time
+from collections import Counter, OrderedDict, namedtuple
 from datetime import datetime, timedelta
 
-import pythesint as pti
-import shapely.geometry
-import shapely.ops
-import shapely.wkt
-from dateutil.tz import tzutc
-
 from .errors import MetadataNormalizationError
 
 
+######################## Deferred imports ########################
+# pythesint, shapely, numpy and dateutil take a long time to import.
+# They are imported the first time they are needed, so that importing
+# this module stays cheap.
+
+def _import_pythesint():
+    """Returns the pythesint module"""
+    import pythesint  # pylint: disable=import-outside-toplevel
+    return pythesint
+
+
+def _import_shapely():
+    """Returns the shapely module, with the sub-modules used here
+    imported
+    """
+    # pylint: disable=import-outside-toplevel
+    import shapely
+    import shapely.geometry
+    import shapely.ops
+    import shapely.wkt
+    return shapely
+
+
+def _import_numpy():
+    """Returns the numpy module"""
+    import numpy  # pylint: disable=import-outside-toplevel
+    return numpy
+
+
+def _import_dateutil():
+    """Returns the dateutil module, with the sub-modules used here
+    imported
+    """
+    # pylint: disable=import-outside-toplevel
+    import dateutil
+    import dateutil.parser
+    import dateutil.tz
+    return dateutil
+
+
 ######################## Class manipulation utilities ########################
 
 def get_all_subclasses(base_class):
@@ -48,6 +92,271 @@ def export_subclasses(package__all__, package_name, package_dir, base_class):
         package__all__.append(cls.__name__)
 
 
+######################## Caching utilities ########################
+
+CacheInfo = namedtuple('CacheInfo', ('hits', 'misses', 'maxsize', 'currsize'))
+
+
+class LRUCache():
+    """Thread-safe least recently used cache. When it contains
+    `maxsize` items, adding an item evicts the least recently used
+    one. If `ttl` is not None, items expire `ttl` seconds after they
+    were added
+    """
+
+    def __init__(self, maxsize=1024, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key):
+        """Returns a (found, value) tuple"""
+        with self._lock:
+            try:
+                expiration_time, value = self._items[key]
+            except KeyError:
+                self._misses += 1
+                return (False, None)
+            if expiration_time is not None and expiration_time <= time.monotonic():
+                del self._items[key]
+                self._misses += 1
+                return (False, None)
+            self._items.move_to_end(key)
+            self._hits += 1
+            return (True, value)
+
+    def set(self, key, value):
+        """Adds an item to the cache"""
+        expiration_time = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._items[key] = (expiration_time, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        """Removes all items and resets the statistics"""
+        with self._lock:
+            self._items.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self):
+        """Returns the cache statistics"""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._items))
+
+
+def _make_cache_key(value):
+    """Returns a hashable version of a function argument: lists and
+    tuples are converted to tuples recursively
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(_make_cache_key(item) for item in value)
+    return value
+
+
+_MEMOIZED_FUNCTIONS = []
+
+
+def memoize(maxsize=1024, ttl=None, cached_exceptions=(), copy_result=False):
+    """Decorator which caches the results of a function in an
+    LRUCache, using the arguments as key.
+    The exceptions listed in `cached_exceptions` are cached as well,
+    so that looking up a missing value again raises the same exception
+    without calling the function.
+    If `copy_result` is True, a shallow copy of the cached result is
+    returned, so that the caller can modify it.
+    The decorated function gets `cache`, `cache_info()` and
+    `cache_clear()` attributes.
+    """
+    def decorator(func):
+        cache = LRUCache(maxsize, ttl)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_cache_key((args, sorted(kwargs.items())))
+            try:
+                found, cached_value = cache.get(key)
+            except TypeError:  # unhashable argument
+                return func(*args, **kwargs)
+            if found:
+                error, result = cached_value
+                if error is not None:
+                    error_class, error_args = error
+                    raise error_class(*error_args)
+            else:
+                try:
+                    result = func(*args, **kwargs)
+                except cached_exceptions as raised_error:
+                    cache.set(key, ((raised_error.__class__, raised_error.args), None))
+                    raise
+                cache.set(key, (None, result))
+            return copy.copy(result) if copy_result else result
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        _MEMOIZED_FUNCTIONS.append(wrapper)
+        return wrapper
+    return decorator
+
+
+_RECORD_INDEPENDENT_CACHES = []
+
+
+def create_record_independent_cache():
+    """Returns a new dictionary in which a normalizer class can store
+    the values of its record independent fields. The dictionary is
+    emptied by `clear_vocabulary_caches()`
+    """
+    cache = {}
+    _RECORD_INDEPENDENT_CACHES.append(cache)
+    return cache
+
+
+_RECORD_CACHE = contextvars.ContextVar('metanorm_record_cache', default=None)
+
+
+@contextlib.contextmanager
+def record_context(cache=None):
+    """Context manager inside which the results of the functions
+    decorated with `per_record` are cached. It should be active while
+    a single record is being processed, so that values derived from
+    this record are only computed once. Nested contexts share the
+    cache of the outermost one, unless `cache` is given: the context
+    then uses this dictionary, which makes it possible to resume the
+    processing of a record later.
+    """
+    if cache is None:
+        if _RECORD_CACHE.get() is not None:
+            yield
+            return
+        cache = {}
+    token = _RECORD_CACHE.set(cache)
+    try:
+        yield
+    finally:
+        _RECORD_CACHE.reset(token)
+
+
+def per_record(func):
+    """Decorator which caches the results of a function for the
+    duration of the current `record_context`, using the arguments as
+    key. Outside of a record context, the function is simply called.
+    Exceptions are not cached.
+    """
+    @functools.wraps(func)
+    def wrapper(*args):
+        cache = _RECORD_CACHE.get()
+        if cache is None:
+            return func(*args)
+        key = (func, args)
+        try:
+            return cache[key]
+        except KeyError:
+            result = cache[key] = func(*args)
+            return result
+        except TypeError:  # unhashable argument
+            return func(*args)
+    return wrapper
+
+
+######################## Logging utilities ########################
+
+_WARNING_COLLECTORS = []
+
+
+class WarningCollector():
+    """Aggregates a warning which can be repeated for many records,
+    like a name which could not be normalized. The occurrences are
+    counted per source (for example a normalizer) and name. The first
+    occurrence of a name for a source is logged right away, the
+    following ones are counted and logged in a single summary at most
+    every `summary_interval` seconds, or when `flush()` is called.
+    The counts are reset after each summary, so that they only hold the
+    names seen since the previous one.
+    `message` is a %-format string taking the name as argument.
+    """
+
+    def __init__(self, logger, message, summary_interval=60):
+        self.logger = logger
+        self.message = message
+        self.summary_interval = summary_interval
+        self._counts = Counter()
+        self._last_summary_time = time.monotonic()
+        self._lock = threading.Lock()
+        _WARNING_COLLECTORS.append(self)
+
+    def add(self, source, name):
+        """Records an occurrence of the warning for `name`"""
+        key = (source, name)
+        with self._lock:
+            first_occurrence = key not in self._counts
+            self._counts[key] += 1
+        if first_occurrence:
+            self.logger.warning(f"%s: {self.message}", source, name)
+        self.flush_if_due()
+
+    def flush_if_due(self):
+        """Logs the summary if the previous one is older than
+        `summary_interval` seconds
+        """
+        if time.monotonic() - self._last_summary_time >= self.summary_interval:
+            self.flush()
+
+    def flush(self):
+        """Logs the summary of the occurrences counted since the
+        previous summary, if some names were seen more than once, and
+        resets the counts
+        """
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+            self._last_summary_time = time.monotonic()
+        repeated = sorted((key, count - 1) for key, count in counts.items() if count > 1)
+        if repeated:
+            self.logger.warning(
+                "Repeated warnings since the last summary:\n%s",
+                '\n'.join(f"{source}: {self.message % name} x{count}"
+                          for (source, name), count in repeated))
+
+    def get_counts(self):
+        """Returns a dictionary associating each source with a
+        dictionary of the number of occurrences of each name since the
+        previous summary
+        """
+        counts = {}
+        with self._lock:
+            for (source, name), count in self._counts.items():
+                counts.setdefault(source, {})[name] = count
+        return counts
+
+    def reset(self):
+        """Forgets all the occurrences, without logging them"""
+        with self._lock:
+            self._counts.clear()
+            self._last_summary_time = time.monotonic()
+
+
+def flush_warning_collectors(due_only=False):
+    """Logs the pending summaries of all the warning collectors. It is
+    called by the handlers at the end of each batch, and when the
+    interpreter exits. If `due_only` is True, only the summaries older
+    than their collector's `summary_interval` are logged.
+    """
+    for collector in _WARNING_COLLECTORS:
+        if due_only:
+            collector.flush_if_due()
+        else:
+            collector.flush()
+
+
+atexit.register(flush_warning_collectors)
+
+
 ######################## Pythesint utilities ########################
 
 # Field names commonly used in the 'summary' attribute
@@ -142,19 +451,289 @@ def get_gcmd_instrument(instrument_name, additional_keywords=None):
     return gcmd_instrument
 
 
+class GCMDIndex():
+    """In-memory index of a pythesint vocabulary. It gives the same
+    results as the pythesint `get_<vocabulary>()` and
+    `search_<vocabulary>_list()` functions without going through the
+    whole vocabulary for each lookup:
+      - `get()` uses a hash map from the upper case value of every
+        field to the best matching entry
+      - `search()` uses an inverted index of the 3-character
+        substrings of the fields to find the entries which can
+        contain the keyword, then only checks these entries. This
+        index is built on the first search, so that the indexes of
+        vocabularies which are only used with `get()`, like the CF
+        standard names and their long descriptions, stay small
+    """
+
+    NGRAM_LENGTH = 3
+
+    def __init__(self, entries):
+        self.entries = list(entries)
+        self._upper_values = []
+        self._best_matches = {}
+        self._ngrams = None
+
+        best_match_scores = {}
+        for entry in self.entries:
+            upper_values = [value.upper() for value in entry.values()]
+            self._upper_values.append(upper_values)
+
+            # The pythesint get_ functions prefer the first entry
+            # with the most empty fields after the matching field
+            empty_fields_after = [0] * len(upper_values)
+            empty_fields = 0
+            for position in reversed(range(len(upper_values))):
+                if not upper_values[position]:
+                    empty_fields += 1
+                empty_fields_after[position] = empty_fields
+            seen_values = set()
+            for position, value in enumerate(upper_values):
+                if value in seen_values:
+                    continue
+                seen_values.add(value)
+                score = empty_fields_after[position]
+                if value not in self._best_matches or score > best_match_scores[value]:
+                    self._best_matches[value] = entry
+                    best_match_scores[value] = score
+
+    def build_search_index(self):
+        """Builds the inverted index used by `search()` if it does not
+        exist yet
+        """
+        if self._ngrams is not None:
+            return
+        ngrams = {}
+        for entry_index, upper_values in enumerate(self._upper_values):
+            for value in set(upper_values):
+                for start in range(len(value) - self.NGRAM_LENGTH + 1):
+                    ngrams.setdefault(
+                        value[start:start + self.NGRAM_LENGTH], set()).add(entry_index)
+        self._ngrams = ngrams
+
+    @classmethod
+    def from_vocabulary(cls, vocabulary_name):
+        """Builds the index of the pythesint vocabulary named
+        `vocabulary_name`, for example 'gcmd_platform'
+        """
+        return cls(_import_pythesint().vocabularies[vocabulary_name].get_list())
+
+    def get(self, keyword):
+        """Returns the entry which has a field equal to `keyword`
+        (case insensitive). If several entries match, the most generic
+        one is returned, like pythesint does.
+        Raises an IndexError if no entry matches.
+        """
+        try:
+            return self._best_matches[keyword.upper()]
+        except KeyError:
+            raise IndexError(f"{keyword} is not found") from None
+
+    def search(self, keyword):
+        """Returns the list of entries which have a field containing
+        `keyword` (case insensitive)
+        """
+        self.build_search_index()
+        upper_keyword = keyword.upper()
+        if len(upper_keyword) < self.NGRAM_LENGTH:
+            candidates = range(len(self.entries))
+        else:
+            postings = []
+            for start in range(len(upper_keyword) - self.NGRAM_LENGTH + 1):
+                posting = self._ngrams.get(upper_keyword[start:start + self.NGRAM_LENGTH])
+                if not posting:
+                    return []
+                postings.append(posting)
+            postings.sort(key=len)
+            candidates = sorted(postings[0].intersection(*postings[1:]))
+
+        matches = []
+        seen_entries = set()
+        for entry_index in candidates:
+            if any(upper_keyword in value for value in self._upper_values[entry_index]):
+                entry = self.entries[entry_index]
+                # like pythesint, do not return identical entries twice
+                entry_key = tuple(entry.items())
+                if entry_key not in seen_entries:
+                    seen_entries.add(entry_key)
+                    matches.append(entry)
+        return matches
+
+
+_GCMD_INDEXES = {}
+_GCMD_INDEXES_LOCK = threading.Lock()
+
+
+def get_gcmd_index(vocabulary_name):
+    """Returns the index of a pythesint vocabulary. The index is built
+    on first use then kept for the lifetime of the process
+    """
+    index = _GCMD_INDEXES.get(vocabulary_name)
+    if index is None:
+        with _GCMD_INDEXES_LOCK:
+            index = _GCMD_INDEXES.get(vocabulary_name)
+            if index is None:
+                index = GCMDIndex.from_vocabulary(vocabulary_name)
+                _GCMD_INDEXES[vocabulary_name] = index
+    return index
+
+
+def clear_gcmd_indexes():
+    """Removes the vocabulary indexes, so that they are rebuilt on next
+    use. Should be called after the pythesint vocabularies are updated
+    """
+    with _GCMD_INDEXES_LOCK:
+        _GCMD_INDEXES.clear()
+
+
+def clear_vocabulary_caches():
+    """Removes the vocabulary indexes, the cached results of the
+    vocabulary lookups and the cached values of the record independent
+    fields. Should be called after the pythesint vocabularies are
+    updated, for example using `pythesint.update_all_vocabularies()`
+    """
+    clear_gcmd_indexes()
+    for memoized_function in _MEMOIZED_FUNCTIONS:
+        memoized_function.cache_clear()
+    for record_independent_cache in _RECORD_INDEPENDENT_CACHES:
+        record_independent_cache.clear()
+
+
+# Vocabularies whose indexes are stored in snapshots by default
+SNAPSHOT_VOCABULARIES = (
+    'gcmd_instrument', 'gcmd_platform', 'gcmd_provider', 'cf_standard_name', 'wkv_variable')
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+def _get_vocabulary_path(vocabulary_name):
+    """Returns the path of the file in which pythesint stores a
+    vocabulary
+    """
+    return _import_pythesint().vocabularies[vocabulary_name].get_filepath()
+
+
+def _get_vocabulary_fingerprint(vocabulary_name):
+    """Returns a tuple which changes when the file of a vocabulary is
+    modified, without reading it. Returns None if the file does not
+    exist
+    """
+    try:
+        stat = os.stat(_get_vocabulary_path(vocabulary_name))
+    except FileNotFoundError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def _hash_vocabularies(vocabulary_names):
+    """Returns a hash of the contents of the vocabulary files"""
+    content_hash = hashlib.sha256()
+    for vocabulary_name in sorted(vocabulary_names):
+        content_hash.update(vocabulary_name.encode())
+        with open(_get_vocabulary_path(vocabulary_name), 'rb') as vocabulary_file:
+            for chunk in iter(lambda: vocabulary_file.read(1 << 20), b''):
+                content_hash.update(chunk)
+    return content_hash.hexdigest()
+
+
+def build_vocabulary_snapshot(path, vocabulary_names=SNAPSHOT_VOCABULARIES):
+    """Builds the indexes of the vocabularies and writes them to a
+    snapshot file at `path`. The snapshot is versioned by a hash of the
+    vocabulary files contents. The file is replaced atomically, so
+    processes loading it never see a partial snapshot.
+    Returns the content hash.
+    """
+    indexes = {name: GCMDIndex.from_vocabulary(name) for name in vocabulary_names}
+    for name, index in indexes.items():
+        # only the GCMD vocabularies are searched, see gcmd_search()
+        if name.startswith('gcmd_'):
+            index.build_search_index()
+    snapshot = {
+        'format_version': SNAPSHOT_FORMAT_VERSION,
+        'content_hash': _hash_vocabularies(vocabulary_names),
+        'fingerprints': {name: _get_vocabulary_fingerprint(name) for name in vocabulary_names},
+        'indexes': indexes,
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_path, 'wb') as snapshot_file:
+            pickle.dump(snapshot, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, path)
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+    return snapshot['content_hash']
+
+
+def _is_snapshot_up_to_date(snapshot):
+    """Checks that the vocabulary files did not change since the
+    snapshot was built. The files' sizes and modification times are
+    checked first, the contents are only hashed if they differ.
+    Vocabulary files which do not exist are not checked, the snapshot
+    can then stand in for them.
+    """
+    if snapshot.get('format_version') != SNAPSHOT_FORMAT_VERSION:
+        return False
+    vocabulary_names = [
+        name for name in snapshot['indexes'] if _get_vocabulary_fingerprint(name) is not None
+    ]
+    if all(_get_vocabulary_fingerprint(name) == snapshot['fingerprints'].get(name)
+           for name in vocabulary_names):
+        return True
+    return (len(vocabulary_names) == len(snapshot['indexes'])
+            and _hash_vocabularies(vocabulary_names) == snapshot['content_hash'])
+
+
+def load_vocabulary_snapshot(path):
+    """Loads the vocabulary indexes from a snapshot file built by
+    `build_vocabulary_snapshot()` and makes them available to the
+    vocabulary lookups. Each process loading the snapshot gets its own
+    copy of the indexes.
+    Snapshots are pickle files: only load trusted files.
+    Returns False if the file does not exist, if it cannot be read
+    (empty or corrupt file) or if it is out of date, True otherwise.
+    """
+    try:
+        with open(path, 'rb') as snapshot_file:
+            snapshot = pickle.load(snapshot_file)
+    except FileNotFoundError:
+        return False
+    except (ValueError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return False
+
+    if not _is_snapshot_up_to_date(snapshot):
+        return False
+
+    with _GCMD_INDEXES_LOCK:
+        _GCMD_INDEXES.update(snapshot['indexes'])
+    return True
+
+
+def ensure_vocabulary_snapshot(path, vocabulary_names=SNAPSHOT_VOCABULARIES):
+    """Loads the vocabulary snapshot at `path`, after building it if
+    it does not exist or is out of date
+    """
+    if not load_vocabulary_snapshot(path):
+        build_vocabulary_snapshot(path, vocabulary_names)
+        load_vocabulary_snapshot(path)
+
+
+@memoize(maxsize=4096)
 def gcmd_search(vocabulary_name, keyword, additional_keywords=None):
     """
     Search for GCMD objects using the provided vocabulary name and keywords.
     Returns None if nothing was found.
+    The result is cached and shared between callers, so it is a
+    read-only `FrozenOrderedDict`.
     """
-    pti_search_method = getattr(pti, f"search_gcmd_{vocabulary_name}_list")
-    pti_get_method = getattr(pti, f"get_gcmd_{vocabulary_name}")
+    gcmd_index = get_gcmd_index(f"gcmd_{vocabulary_name}")
 
     translated_keyword = translate_pythesint_keyword(PYTHESINT_KEYWORD_TRANSLATION, keyword)
 
     gcmd_object = None
     # Try to search for the object name
-    matching_objects = pti_search_method(translated_keyword)
+    matching_objects = gcmd_index.search(translated_keyword)
     matching_objects_length = len(matching_objects)
 
     if matching_objects_length == 1:
@@ -171,11 +750,11 @@ def gcmd_search(vocabulary_name, keyword, additional_keywords=None):
         # If the additional keywords did not manage to narrow down the search enough, or if no
         # additional keyword was provided, try the strict `get_` method from pythesint
         try:
-            gcmd_object = pti_get_method(keyword)
+            gcmd_object = gcmd_index.get(keyword)
         except IndexError:
             pass
 
-    return gcmd_object
+    return FrozenOrderedDict(gcmd_object) if gcmd_object else None
 
 
 def restrict_gcmd_search(gcmd_objects, keywords):
@@ -196,6 +775,7 @@ def restrict_gcmd_search(gcmd_objects, keywords):
     return restricted_search
 
 
+@memoize(maxsize=4096, cached_exceptions=IndexError)
 def get_cf_or_wkv_standard_name(keyword):
     """return the values of a dataset parameter in a standard way from the
     standards that are defined in the pti package based on the keyword that has been passed to it.
@@ -206,12 +786,33 @@ def get_cf_or_wkv_standard_name(keyword):
     'description':"X_area_fraction"
 
     as the result_values.
+    The vocabularies are looked up through their `GCMDIndex`.
+    The result is cached and shared between callers, so it is a
+    read-only `FrozenOrderedDict`.
     """
     try:
-        result_values = pti.get_cf_standard_name(keyword)
+        result_values = get_gcmd_index('cf_standard_name').get(keyword)
     except IndexError:
-        result_values = pti.get_wkv_variable(keyword)
-    return result_values
+        result_values = get_gcmd_index('wkv_variable').get(keyword)
+    return FrozenOrderedDict(result_values)
+
+
+def resolve_standard_names(names):
+    """Resolves a batch of CF or well known variable names, for
+    example the names of the variables of many datasets. Each distinct
+    name is looked up once in the hash indexes of the vocabularies,
+    and the results, misses included, are cached across batches.
+    Returns a dictionary associating each distinct name with its
+    pythesint dict, or with None if it is in neither vocabulary.
+    """
+    resolved_names = {}
+    for name in names:
+        if name not in resolved_names:
+            try:
+                resolved_names[name] = get_cf_or_wkv_standard_name(name)
+            except IndexError:
+                resolved_names[name] = None
+    return resolved_names
 
 
 ######################## Time utilities ########################
@@ -225,6 +826,8 @@ def create_datetime(year, month=1, day=1, day_of_year=None, hour=0, minute=0, se
       - year, month, day(, hour, minute, second)
       - year, day_of_year(, hour, minute, second)
     """
+    tzutc = _import_dateutil().tz.tzutc
+
     year = int(year)
     hour = int(hour)
     minute = int(minute)
@@ -239,6 +842,44 @@ def create_datetime(year, month=1, day=1, day_of_year=None, hour=0, minute=0, se
         day = int(day)
         return datetime(year, month, day, hour, minute, second).replace(tzinfo=tzutc())
 
+ISO_DATETIME_MATCHER = re.compile(
+    r'^\s*(\d{4})-(\d{2})-(\d{2})'
+    r'(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d{1,6}))?)?'
+    r'\s*(Z|[+-]\d{2}(?::?\d{2})?)?)?\s*$')
+
+def parse_datetime(string):
+    """Parses a date or datetime string. The common ISO-8601 forms
+    are parsed using a regular expression, other strings are given to
+    dateutil.parser.parse(). The result is the same as what
+    dateutil.parser.parse() would return: naive if the string does not
+    contain a time zone, with a tzutc or tzoffset time zone otherwise.
+    Raises dateutil.parser.ParserError if the string can't be parsed.
+    """
+    dateutil = _import_dateutil()
+
+    match = ISO_DATETIME_MATCHER.match(string) if isinstance(string, str) else None
+    if match:
+        (year, month, day, hour, minute, second, fraction, zone) = match.groups()
+        if zone is None:
+            tzinfo = None
+        elif zone == 'Z':
+            tzinfo = dateutil.tz.tzutc()
+        else:
+            offset = (int(zone[1:3]) * 60 + int(zone[-2:] if len(zone) > 3 else 0)) * 60
+            if zone[0] == '-':
+                offset = -offset
+            tzinfo = dateutil.tz.tzoffset(None, offset) if offset else dateutil.tz.tzutc()
+        try:
+            return datetime(
+                int(year), int(month), int(day),
+                int(hour or 0), int(minute or 0), int(second or 0),
+                int(fraction.ljust(6, '0')) if fraction else 0,
+                tzinfo=tzinfo)
+        except ValueError:
+            pass
+    return dateutil.parser.parse(string)
+
+@per_record
 def find_time_coverage(time_patterns, url):
     """Find the time coverage based on the 'url' raw attribute.
     Returns a 2-tuple containing the start and end time,
@@ -270,12 +911,19 @@ def find_time_coverage(time_patterns, url):
         - "time_coverage_function" is a function which takes the
         datetime object returned by datetime_creation_function
         and returns the time coverage as a 2-tuple
+
+    The patterns are tried in order and the first one which matches
+    anywhere in the URL is used, even if another pattern would match
+    earlier in the URL. Merging the patterns into a single regular
+    expression which keeps this priority requires lookaheads, which
+    are several times slower than searching each pattern with Python's
+    backtracking engine, so the patterns are searched one by one.
     """
     for matcher, get_time, get_coverage in time_patterns:
         match = matcher.search(url)
         if match:
-            file_time = get_time(**match.groupdict())
-            return (get_coverage(file_time)[0], get_coverage(file_time)[1])
+            coverage = get_coverage(get_time(**match.groupdict()))
+            return (coverage[0], coverage[1])
     raise MetadataNormalizationError(f"Could not extract the time coverage from {url}")
 
 ######################## Spatial utilities ########################
@@ -291,102 +939,242 @@ def wkt_polygon_from_wgs84_limits(north, south, east, west):
 
 def translate_west_coordinates(multipolygon):
     """Translate west coordinates from [-180, 0[ to [180, 360[
-    Should be used on a shapely multipolygon
+    Should be used on a shapely multipolygon, or an array of shapely
+    geometries
     """
+    shapely = _import_shapely()
 
-    def translate_point(point):
-        return (point[0] + 360, point[1]) if point[0] < 0 else point
+    def translate_coordinates(coordinates):
+        longitudes = coordinates[:, 0]
+        longitudes[longitudes < 0] += 360
+        return coordinates
 
-    def translate_ring(ring):
-        return shapely.geometry.LinearRing(translate_point(point) for point in ring.coords)
+    return shapely.transform(multipolygon, translate_coordinates)
 
-    new_polygons = []
-    for polygon in multipolygon.geoms:
 
-        exterior_ring = translate_ring(polygon.exterior)
+def _restore_west_coordinates_parts(polygons):
+    """Translate west coordinates back from [180, 360[ to [-180, 0[
+    in an array of polygons split along the IDL.
+    Each polygon is on the east or west side of the IDL. Points on the
+    IDL which have a longitude of 180 are translated to -180 if their
+    polygon is on the west side of the IDL.
+    """
+    shapely = _import_shapely()
+    numpy = _import_numpy()
 
-        new_interior_rings = []
-        for ring in polygon.interiors:
-            new_interior_rings.append(translate_ring(ring))
+    coordinates, polygon_indexes = shapely.get_coordinates(polygons, return_index=True)
+    longitudes = coordinates[:, 0]
 
-        new_polygons.append(shapely.geometry.Polygon(exterior_ring, new_interior_rings))
+    # Determine which polygons are on the east side of the IDL using
+    # the first point of each polygon which is not on the IDL.
+    # We deal with translated coordinates, so west coordinates are in
+    # [180, 360[
+    off_idl = longitudes != 180
+    is_east = numpy.ones(len(polygons), dtype=bool)
+    off_idl_polygons, first_points = numpy.unique(polygon_indexes[off_idl], return_index=True)
+    is_east[off_idl_polygons] = longitudes[off_idl][first_points] < 180
 
-    return shapely.geometry.MultiPolygon(new_polygons)
+    to_restore = (longitudes > 180) | ((longitudes == 180) & ~is_east[polygon_indexes])
+    restored_longitudes = numpy.where(to_restore, longitudes - 360, longitudes)
+    return shapely.transform(
+        polygons,
+        lambda coords: numpy.column_stack((restored_longitudes, coords[:, 1])))
 
 
 def restore_west_coordinates(multipolygon):
     """Translate west coordinates back from [180, 360[ to [-180, 0[
     Should be used on a shapely multipolygon split along the IDL
     """
+    shapely = _import_shapely()
+    return shapely.multipolygons(
+        _restore_west_coordinates_parts(shapely.get_parts(multipolygon)))
 
-    def restore_point(point, is_east):
-        """Restores a point's longitude to the [-180, 0[ range. If the
-        current polygon is on the west side of the IDL, points located
-        on the IDL which have a longitude of 180 are translated to
-        -180.
-        """
-        if point[0] > 180 or (point[0] == 180 and not is_east):
-            lon = point[0] - 360
-        else:
-            lon = point[0]
-        return (lon, point[1])
-
-    def restore_ring(ring):
-        return shapely.geometry.LinearRing(restore_point(point, is_east) for point in ring.coords)
-
-    new_polygons = []
-    for polygon in multipolygon.geoms:
-        # Determine if this polygon is on the east or west side of the
-        # IDL. It has been split already, so it is either east or west.
-        # We find the first point which is not on the IDL and check
-        # whether it is east or west.
-        for point in polygon.exterior.coords:
-            if point[0] == 180:
-                continue
-            else:
-                # we deal with translated coordinates, so west
-                # coordinates are in [180, 360[
-                is_east = point[0] < 180
-                break
 
-        exterior_ring = restore_ring(polygon.exterior)
-        interior_rings = []
-        for ring in polygon.interiors:
-            interior_rings.append(restore_ring(ring))
-        new_polygons.append(shapely.geometry.Polygon(exterior_ring, interior_rings))
+@functools.lru_cache(maxsize=None)
+def _get_idl_geometries():
+    """Returns the world wide coverage polygon and the line along
+    which geometries are split. They are only built once.
+    """
+    shapely = _import_shapely()
 
-    return shapely.geometry.MultiPolygon(new_polygons)
+    world_polygon = shapely.wkt.loads(WORLD_WIDE_COVERAGE_WKT)
+    shapely.prepare(world_polygon)
+    return world_polygon, shapely.geometry.LineString(((180, 90), (180, -90)))
 
 
-def split_multipolygon_along_idl(multipolygon):
+def split_multipolygons_along_idl(multipolygons):
     """Split multipolygons which cross the international dateline to
-    avoid undesired side effects
+    avoid undesired side effects.
+    Takes a sequence of multipolygons and returns a list containing the
+    split multipolygons in the same order.
     """
-    # if the multipolygon has global coverage, return it as is
-    if shapely.wkt.loads(WORLD_WIDE_COVERAGE_WKT).difference(multipolygon).is_empty:
-        return multipolygon
+    shapely = _import_shapely()
+    numpy = _import_numpy()
+
+    world_polygon, line = _get_idl_geometries()
+    multipolygons = numpy.asarray(multipolygons, dtype=object)
+
+    # the multipolygons which have global coverage are returned as is.
+    # A multipolygon whose bounds do not cover the world can't have
+    # global coverage, so the costly difference is only computed for
+    # the others
+    bounds = shapely.bounds(multipolygons).reshape(-1, 4)
+    maybe_global = ((bounds[:, 0] <= -180) & (bounds[:, 1] <= -90) &
+                    (bounds[:, 2] >= 180) & (bounds[:, 3] >= 90))
+    is_global = numpy.zeros(len(multipolygons), dtype=bool)
+    is_global[maybe_global] = shapely.is_empty(
+        shapely.difference(world_polygon, multipolygons[maybe_global]))
+    to_split = numpy.flatnonzero(~is_global)
 
     # translate the longitude of west points from  the range [-180, 0[
-    # to [180, 360[. This makes it easy to split the multipolygon along
-    # the IDL
-    translated_geometry = translate_west_coordinates(multipolygon)
+    # to [180, 360[. This makes it easy to split the multipolygons
+    # along the IDL
+    translated_geometries = translate_west_coordinates(multipolygons[to_split])
+
+    # split the multipolygons along the IDL
+    split_parts = [
+        shapely.get_parts(shapely.ops.split(geometry, line))
+        for geometry in translated_geometries
+    ]
+
+    # restore the longitude of west points to [-180, 0[, all the parts
+    # at once
+    parts_counts = [len(parts) for parts in split_parts]
+    restored_parts = _restore_west_coordinates_parts(
+        numpy.concatenate(split_parts) if split_parts else numpy.empty(0, dtype=object))
+
+    results = list(multipolygons)
+    for index, parts in zip(to_split, numpy.split(restored_parts,
+                                                  numpy.cumsum(parts_counts)[:-1])):
+        results[index] = shapely.multipolygons(parts)
+    return results
 
-    # split the multipolygon along the IDL
-    line = shapely.geometry.LineString(((180, 90), (180, -90)))
-    split_geometry = shapely.ops.split(translated_geometry, line)
 
-    # restore the longitude of west points to [-180, 0[ and return
-    # the result
-    return restore_west_coordinates(split_geometry)
+def split_multipolygon_along_idl(multipolygon):
+    """Split a multipolygon which crosses the international dateline to
+    avoid undesired side effects
+    """
+    return split_multipolygons_along_idl((multipolygon,))[0]
 
 
 ######################## Other utilities ########################
 
+class PrefixTable():
+    """Associates string prefixes with values.
+    The prefixes are kept sorted, so finding the prefixes of a string
+    takes a binary search followed by a walk up the chain of nested
+    prefixes, instead of one `startswith()` call per prefix.
+    """
+
+    def __init__(self, items=()):
+        self._values = {}
+        self._prefixes = []
+        self._parents = None
+        for prefix, value in items:
+            self.add(prefix, value)
+
+    def add(self, prefix, value):
+        """Associate `value` with `prefix`. Several values can be
+        associated with the same prefix
+        """
+        if prefix not in self._values:
+            self._values[prefix] = []
+            bisect.insort(self._prefixes, prefix)
+            self._parents = None
+        self._values[prefix].append(value)
+
+    def _build_parents(self):
+        """For each prefix, find the index of the longest other prefix
+        it starts with (or -1 if there is none)
+        """
+        parents = []
+        ancestors = []
+        for index, prefix in enumerate(self._prefixes):
+            while ancestors and not prefix.startswith(self._prefixes[ancestors[-1]]):
+                ancestors.pop()
+            parents.append(ancestors[-1] if ancestors else -1)
+            ancestors.append(index)
+        self._parents = parents
+
+    def find_all(self, string):
+        """Returns the values associated with all the prefixes of
+        `string`, starting with the longest prefix
+        """
+        if self._parents is None:
+            self._build_parents()
+        values = []
+        # any prefix of `string` is also a prefix of the greatest
+        # prefix which sorts before `string`
+        index = bisect.bisect_right(self._prefixes, string) - 1
+        while index >= 0:
+            prefix = self._prefixes[index]
+            if string.startswith(prefix):
+                values.extend(self._values[prefix])
+            index = self._parents[index]
+        return values
+
+    def find(self, string, default=None):
+        """Returns the first value associated with the longest prefix
+        of `string`, or `default` if there is none
+        """
+        values = self.find_all(string)
+        return values[0] if values else default
+
+    def __len__(self):
+        return len(self._prefixes)
+
+
+class SubstringTable():
+    """Associates substrings with values, for tables which would
+    otherwise be written as a chain of `if substring in string` tests.
+    The substrings are tested in the order in which they were added.
+    The tables used by the normalizers hold a handful of substrings,
+    for which the `in` operator, implemented in C, is faster than
+    walking the string with a multi-pattern automaton in Python.
+    """
+
+    def __init__(self, items=()):
+        self._items = []
+        for substring, value in items:
+            self.add(substring, value)
+
+    def add(self, substring, value):
+        """Associate `value` with `substring`"""
+        self._items.append((substring, value))
+
+    def find_all(self, string):
+        """Returns the values associated with all the substrings of
+        `string`, in the order in which they were added
+        """
+        return [value for substring, value in self._items if substring in string]
+
+    def find(self, string, default=None):
+        """Returns the value associated with the first added substring
+        of `string`, or `default` if there is none
+        """
+        for substring, value in self._items:
+            if substring in string:
+                return value
+        return default
+
+    def __len__(self):
+        return len(self._items)
+
+
 UNKNOWN = 'Unknown'
 NC_H5_FILENAME_MATCHER = re.compile(r"([^/]+)\.(nc|h5)(\.gz)?$")
 WORLD_WIDE_COVERAGE_WKT = 'POLYGON((-180 -90, -180 90, 180 90, 180 -90, -180 -90))'
 
 
+@per_record
+def regex_search(matcher, string):
+    """Returns the result of `matcher.search(string)`. The result is
+    cached for the current record context, so several getters can look
+    for the same pattern in a record's URL for the cost of one search
+    """
+    return matcher.search(string)
+
+
 def dict_to_string(dictionary):
     """Returns a string representation of the dictionary argument.
     The following dictionary:
@@ -400,6 +1188,15 @@ def dict_to_string(dictionary):
     return string.rstrip(';')
 
 
+def record_independent(method):
+    """Decorator which marks a getter method as returning the same
+    value whatever the raw metadata. The normalizers can then compute
+    the value once and reuse it for all records
+    """
+    method.record_independent = True
+    return method
+
+
 def raises(exceptions):
     """Decorator for methods which get an attribute from metadata.
     Makes it possible to declare which exception(s) are thrown when the
@@ -407,7 +1204,8 @@ def raises(exceptions):
     `exceptions` can be an exception class or a tuple of exception
     classes. If any of these exceptions is raised by the method,
     a MetadataNormalizationError with a (hopefully) clear error message
-    is raised from this exception.
+    is raised from this exception. The message is only formatted if
+    the error is converted to a string.
     """
     def decorator(func):
         @functools.wraps(func)
@@ -416,13 +1214,49 @@ def raises(exceptions):
                 return func(self, raw_metadata)
             except exceptions as error:
                 raise MetadataNormalizationError(
-                    f"{func.__name__} was unable to process the following metadata: {raw_metadata}"
-                ) from error
+                    raw_metadata=raw_metadata, getter_name=func.__name__) from error
         return wrapper
     return decorator
 
 
-def create_parameter_list(parameters):
-    """Converts a list of standard names into a list of Pythesint dicts
+class FrozenOrderedDict(OrderedDict):
+    """OrderedDict which cannot be modified after its creation.
+    Unlike a MappingProxyType, it can be pickled, so it can be sent
+    back from the worker processes of the parallel handlers.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        for key, value in OrderedDict(*args, **kwargs).items():
+            OrderedDict.__setitem__(self, key, value)
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(f"'{self.__class__.__name__}' object is read-only")
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = move_to_end = _read_only
+
+    def __reduce__(self):
+        return (self.__class__, (list(self.items()),))
+
+
+@memoize(maxsize=1024)
+def _resolve_parameter_list(parameters):
+    """Returns a tuple of read-only Pythesint dicts for a tuple of
+    standard names. The result is shared by all the callers
+    """
+    return tuple(
+        FrozenOrderedDict(get_cf_or_wkv_standard_name(cf_parameter))
+        for cf_parameter in parameters)
+
+
+def create_parameter_list(parameters, copy_result=False):
+    """Converts a list of standard names into a tuple of Pythesint
+    dicts. The tuple and the dicts are cached and shared between
+    callers, so they are read-only. If `copy_result` is True, a list
+    of modifiable copies of the dicts is returned instead
     """
-    return [get_cf_or_wkv_standard_name(cf_parameter) for cf_parameter in parameters]
+    resolved_parameters = _resolve_parameter_list(tuple(parameters))
+    if copy_result:
+        return [OrderedDict(parameter) for parameter in resolved_parameters]
+    return resolved_parameters
@@ -20,5 +20,5 @@ setuptools.setup(
         "Operating System :: POSIX :: Linux",
     ],
     python_requires='>=3.7',
-    install_requires=['shapely>=1.6.0'],
+    install_requires=['numpy', 'shapely>=2.0.0'],
 )
@@ -2,6 +2,7 @@
 #pylint: disable=protected-access
 
 import unittest
+import unittest.mock as mock
 
 import metanorm.normalizers as normalizers
 
@@ -14,6 +15,15 @@ class MetadataNormalizerTestCase(unittest.TestCase):
         """check() should always return False on base classes"""
         self.assertFalse(normalizers.MetadataNormalizer().check({}))
 
+    def test_probe(self):
+        """probe() should return the result of check() if it is
+        truthy, None otherwise
+        """
+        normalizer = normalizers.MetadataNormalizer()
+        self.assertIsNone(normalizer.probe({}))
+        with mock.patch.object(normalizer, 'check', return_value=True):
+            self.assertIs(normalizer.probe({}), True)
+
     def test_abstract_normalize(self):
         """normalize() should raise a NotImplementedError"""
         with self.assertRaises(NotImplementedError):
@@ -6,6 +6,7 @@ import unittest.mock as mock
 from datetime import datetime, timezone
 
 import metanorm.normalizers as normalizers
+import metanorm.utils as utils
 from metanorm.errors import MetadataNormalizationError
 
 
@@ -47,6 +48,13 @@ class CMEMSMetadataNormalizerTestCase(unittest.TestCase):
         self.assertFalse(self.normalizer.check({'url': ''}))
         self.assertFalse(self.normalizer.check({'url': 'ftp://foo'}))
 
+    def test_url_prefixes(self):
+        """url_prefixes should be built from url_prefix"""
+        self.assertTupleEqual(self.normalizer.url_prefixes, ())
+        self.assertTupleEqual(
+            normalizers.geospaas.CMEMS001024MetadataNormalizer().url_prefixes,
+            ('ftp://nrt.cmems-du.eu/Core/GLOBAL_ANALYSIS_FORECAST_PHY_001_024',))
+
     def test_entry_id(self):
         """Test extracting the entry_id from a URL"""
         self.assertEqual(self.normalizer.get_entry_id({'url': 'ftp://foo/bar/baz123.nc'}), 'baz123')
@@ -91,6 +99,42 @@ class CMEMSMetadataNormalizerTestCase(unittest.TestCase):
             self.assertEqual(self.normalizer.get_time_coverage_end(raw_metadata), 'end')
             mock_find_time_coverage.assert_called_with(self.normalizer.time_patterns, url)
 
+    def test_product_attributes(self):
+        """The getters should use the attributes describing the
+        product
+        """
+        class TestNormalizer(normalizers.geospaas.CMEMSMetadataNormalizer):
+            """Test product"""
+            entry_title = 'title'
+            summary = {'description': 'foo', 'product': 'bar'}
+            instrument = 'instrument'
+            location_geometry = 'POINT(1 2)'
+            dataset_parameters = ('baz',)
+
+        normalizer = TestNormalizer()
+        with mock.patch('metanorm.utils.get_gcmd_platform') as mock_get_platform, \
+                mock.patch('metanorm.utils.get_gcmd_instrument') as mock_get_instrument, \
+                mock.patch('metanorm.utils.get_gcmd_provider') as mock_get_provider, \
+                mock.patch('metanorm.utils.create_parameter_list') as mock_create_parameters:
+            self.assertEqual(normalizer.get_entry_title({}), 'title')
+            self.assertEqual(normalizer.get_summary({}), 'Description: foo;Product: bar')
+            self.assertEqual(normalizer.get_platform({}), mock_get_platform.return_value)
+            self.assertEqual(normalizer.get_instrument({}), mock_get_instrument.return_value)
+            self.assertEqual(normalizer.get_provider({}), mock_get_provider.return_value)
+            self.assertEqual(normalizer.get_location_geometry({}), 'POINT(1 2)')
+            self.assertEqual(normalizer.get_dataset_parameters({}),
+                             mock_create_parameters.return_value)
+        mock_get_platform.assert_called_once_with('OPERATIONAL MODELS')
+        mock_get_instrument.assert_called_once_with('instrument')
+        mock_get_provider.assert_called_once_with(['CMEMS'])
+        mock_create_parameters.assert_called_once_with(('baz',))
+
+    def test_undefined_product_attributes(self):
+        """The base class does not describe any product"""
+        with self.assertRaises(NotImplementedError):
+            self.normalizer.get_entry_title({})
+        self.assertEqual(self.normalizer.get_summary({}), utils.UNKNOWN)
+
     def test_time_coverage_start_missing_attribute(self):
         """An exception must be raised if the attribute is missing"""
         with self.assertRaises(MetadataNormalizationError):
@@ -572,6 +616,16 @@ class CMEMS006013MetadataNormalizerTestCase(GCMDTestsMixin, unittest.TestCase):
             self.normalizer.get_location_geometry({}),
             'POLYGON((-17.29 45.98, -17.29 30.18, 36.30 30.18, 36.30 45.98, -17.29 45.98))')
 
+    def test_dataset_parameters(self):
+        """Test getting the dataset parameters"""
+        attributes = {
+            'url': 'ftp://nrt.cmems-du.eu/Core/MEDSEA_ANALYSISFORECAST_PHY_006_013/med-cmcc-sal'
+        }
+        with mock.patch('metanorm.utils.create_parameter_list') as mock_get_gcmd_method:
+            self.assertEqual(
+                self.normalizer.get_dataset_parameters(attributes),
+                mock_get_gcmd_method.return_value)
+
     def test_dataset_parameters_cur(self):
         """Should return the proper dataset parameters"""
         attributes = {
@@ -703,7 +757,7 @@ class CMEMS006013MetadataNormalizerTestCase(GCMDTestsMixin, unittest.TestCase):
         """Should return an empty list if the URL starts with an
         unknown prefix
         """
-        self.assertListEqual(self.normalizer.get_dataset_parameters({'url': 'https://foo'}), [])
+        self.assertTupleEqual(self.normalizer.get_dataset_parameters({'url': 'https://foo'}), ())
 
     def test_dataset_parameters_missing_attribute(self):
         """An exception must be raised if the attribute is missing"""
@@ -850,6 +904,17 @@ class CMEMS005001MetadataNormalizerTestCase(GCMDTestsMixin, unittest.TestCase):
             self.normalizer.get_location_geometry({}),
             'POLYGON((-19 56, 5 56, 5 26, -19 26, -19 56))')
 
+    def test_dataset_parameters(self):
+        """Test getting the dataset parameters"""
+        attributes = {
+            'url': ('ftp://nrt.cmems-du.eu/Core/IBI_ANALYSISFORECAST_PHY_005_001/'
+                    'cmems_mod_ibi_phy_anfc_0.027deg-3D_P1D-m/')
+        }
+        with mock.patch('metanorm.utils.create_parameter_list') as mock_get_gcmd_method:
+            self.assertEqual(
+                self.normalizer.get_dataset_parameters(attributes),
+                mock_get_gcmd_method.return_value)
+
     def test_dataset_parameters_15min(self):
         """Should return the proper dataset parameters"""
         attributes = {
@@ -962,7 +1027,7 @@ class CMEMS005001MetadataNormalizerTestCase(GCMDTestsMixin, unittest.TestCase):
         """Should return an empty list if the URL starts with an
         unknown prefix
         """
-        self.assertListEqual(self.normalizer.get_dataset_parameters({'url': 'https://foo'}), [])
+        self.assertTupleEqual(self.normalizer.get_dataset_parameters({'url': 'https://foo'}), ())
 
     def test_dataset_parameters_missing_attribute(self):
         """An exception must be raised if the attribute is missing"""
@@ -1153,9 +1218,21 @@ class CMEMS002001aMetadataNormalizerTestCase(GCMDTestsMixin, unittest.TestCase):
             self.normalizer.get_location_geometry({}),
             'POLYGON((-180 62, -180 90, 180 90, 180 62, -180 62))')
 
+    def test_dataset_parameters(self):
+        """Test getting the dataset parameters"""
+        attributes = {
+            'url': ('ftp://nrt.cmems-du.eu/Core/ARCTIC_ANALYSIS_FORECAST_PHYS_002_001_a/'
+                    'dataset-topaz4-arc-myoceanv2-be/'
+                    '20180104_dm-metno-MODEL-topaz4-ARC-b20180108-fv02.0.nc')
+        }
+        with mock.patch('metanorm.utils.create_parameter_list') as mock_get_gcmd_method:
+            self.assertEqual(
+                self.normalizer.get_dataset_parameters(attributes),
+                mock_get_gcmd_method.return_value)
+
     def test_unknown_parameters(self):
         """In case of unknown parameters, return an empty list"""
-        self.assertEqual(self.normalizer.get_dataset_parameters({'url': 'https://foo'}), [])
+        self.assertEqual(self.normalizer.get_dataset_parameters({'url': 'https://foo'}), ())
 
 
 class CMEMS002001MetadataNormalizerTestCase(GCMDTestsMixin, unittest.TestCase):
@@ -1297,7 +1374,7 @@ class CMEMS002001MetadataNormalizerTestCase(GCMDTestsMixin, unittest.TestCase):
                     )
                 )
             with self.subTest('unknown'):
-                self.assertEqual(self.normalizer.get_dataset_parameters({'url': 'https://foo'}), [])
+                self.assertEqual(self.normalizer.get_dataset_parameters({'url': 'https://foo'}), ())
 
 
 class CMEMS002004MetadataNormalizerTestCase(GCMDTestsMixin, unittest.TestCase):
@@ -1452,7 +1529,7 @@ class CMEMS002004MetadataNormalizerTestCase(GCMDTestsMixin, unittest.TestCase):
                     )
                 )
             with self.subTest('unknown'):
-                self.assertEqual(self.normalizer.get_dataset_parameters({'url': 'https://foo'}), [])
+                self.assertEqual(self.normalizer.get_dataset_parameters({'url': 'https://foo'}), ())
 
 
 class CMEMS001027MetadataNormalizerTestCase(GCMDTestsMixin, unittest.TestCase):
@@ -14,6 +14,8 @@ class GeoSPaaSMetadataNormalizerTestCase(unittest.TestCase):
 
     def setUp(self):
         self.normalizer = normalizers.geospaas.GeoSPaaSMetadataNormalizer()
+        self.normalizer.unresolved_parameters.reset()
+        self.addCleanup(self.normalizer.unresolved_parameters.reset)
 
     def test_check(self):
         """check() should always return False"""
@@ -111,6 +113,19 @@ class GeoSPaaSMetadataNormalizerTestCase(unittest.TestCase):
                 self.normalizer.get_dataset_parameters({'raw_dataset_parameters': ['baz', 'qux']}),
                 ['foo', 'bar'])
 
+    def test_get_dataset_parameters_duplicates(self):
+        """Each distinct parameter name should be resolved once, the
+        order of the raw parameters being kept
+        """
+        with mock.patch('metanorm.utils.get_cf_or_wkv_standard_name') as mock_utils_get:
+            mock_utils_get.side_effect = ('foo', 'bar')
+            self.assertTupleEqual(
+                self.normalizer.get_dataset_parameters({
+                    'raw_dataset_parameters': ['baz', 'qux', 'baz']
+                }),
+                ('foo', 'bar', 'foo'))
+        self.assertEqual(mock_utils_get.call_count, 2)
+
     def test_get_dataset_parameters_pti_error(self):
         """get_dataset_parameters() should log a warning and continue
         processing if no parameter is found using pythesint
@@ -124,11 +139,24 @@ class GeoSPaaSMetadataNormalizerTestCase(unittest.TestCase):
                     }),
                     ['bar'])
 
+    def test_get_dataset_parameters_unresolved_count(self):
+        """The parameters which could not be normalized should be
+        counted, and only the first occurrence should be logged
+        """
+        with mock.patch('metanorm.utils.get_cf_or_wkv_standard_name', side_effect=IndexError):
+            with self.assertLogs(normalizers.geospaas.base.logger, level=logging.WARNING) as logs:
+                for _ in range(3):
+                    self.normalizer.get_dataset_parameters({'raw_dataset_parameters': ['baz']})
+        self.assertEqual(len(logs.records), 1)
+        self.assertDictEqual(
+            self.normalizer.unresolved_parameters.get_counts(),
+            {'GeoSPaaSMetadataNormalizer': {'baz': 3}})
+
     def test_get_dataset_parameters_no_raw_parameters(self):
-        """get_dataset_parameters() should return an empty string when
+        """get_dataset_parameters() should return an empty tuple when
         'raw_dataset_parameters' is not present in the raw metadata
         """
-        self.assertListEqual(self.normalizer.get_dataset_parameters({}), [])
+        self.assertTupleEqual(self.normalizer.get_dataset_parameters({}), ())
 
     def test_normalize(self):
         """Test that the normalize method returns the right attributes
@@ -208,3 +236,179 @@ class GeoSPaaSMetadataNormalizerTestCase(unittest.TestCase):
                 'dataset_parameters': 'dataset_parameters'
             }
         )
+
+    def test_normalize_fields(self):
+        """Only the requested fields should be normalized"""
+        with mock.patch.object(self.normalizer, 'get_entry_id', return_value='id'), \
+                mock.patch.object(self.normalizer, 'get_platform') as mock_get_platform:
+            self.assertDictEqual(
+                self.normalizer.normalize({}, fields=('entry_id', 'summary')),
+                {'entry_id': 'id', 'summary': utils.UNKNOWN})
+            mock_get_platform.assert_not_called()
+
+    def test_normalize_unknown_fields(self):
+        """A ValueError should be raised if unknown fields are
+        requested
+        """
+        with self.assertRaises(ValueError):
+            self.normalizer.normalize({}, fields=('entry_id', 'foo'))
+        with self.assertRaises(ValueError):
+            self.normalizer.normalize({}, lazy=True, fields=('foo',))
+
+    def test_get_field_record_independent(self):
+        """The getters marked as record independent should be called
+        only once per class
+        """
+
+        class TestNormalizer(normalizers.geospaas.GeoSPaaSMetadataNormalizer):
+            """Normalizer with a record independent getter"""
+            calls = 0
+
+            @utils.record_independent
+            def get_entry_title(self, raw_metadata):
+                TestNormalizer.calls += 1
+                return 'entry_title'
+
+        normalizer = TestNormalizer()
+        self.assertEqual(normalizer.get_field('entry_title', {'a': 1}), 'entry_title')
+        self.assertEqual(normalizer.get_field('entry_title', {'b': 2}), 'entry_title')
+        self.assertEqual(TestNormalizer().get_field('entry_title', {}), 'entry_title')
+        self.assertEqual(TestNormalizer.calls, 1)
+
+        class TestSubNormalizer(TestNormalizer):
+            """The values should not be shared with child classes"""
+
+        self.assertEqual(TestSubNormalizer().get_field('entry_title', {}), 'entry_title')
+        self.assertEqual(TestNormalizer.calls, 2)
+
+    def test_get_field_record_dependent(self):
+        """The getters which are not marked as record independent
+        should be called for each record
+        """
+        normalizer = normalizers.geospaas.GeoSPaaSMetadataNormalizer()
+        with mock.patch.object(normalizer, 'get_entry_id', side_effect=('foo', 'bar')):
+            self.assertEqual(normalizer.get_field('entry_id', {}), 'foo')
+            self.assertEqual(normalizer.get_field('entry_id', {}), 'bar')
+
+    def test_get_field_record_independent_error(self):
+        """Errors raised by record independent getters should not be
+        cached
+        """
+
+        class TestNormalizer(normalizers.geospaas.GeoSPaaSMetadataNormalizer):
+            """Normalizer with a failing record independent getter"""
+            results = [errors.MetadataNormalizationError('error'), 'entry_title']
+
+            @utils.record_independent
+            def get_entry_title(self, raw_metadata):
+                result = TestNormalizer.results.pop(0)
+                if isinstance(result, Exception):
+                    raise result
+                return result
+
+        normalizer = TestNormalizer()
+        with self.assertRaises(errors.MetadataNormalizationError):
+            normalizer.get_field('entry_title', {})
+        self.assertEqual(normalizer.get_field('entry_title', {}), 'entry_title')
+        self.assertEqual(normalizer.get_field('entry_title', {}), 'entry_title')
+
+    def test_get_field_record_independent_cleared(self):
+        """The values of the record independent fields should be
+        computed again after the vocabulary caches are cleared
+        """
+        normalizer = normalizers.geospaas.NOAAHYCOMMetadataNormalizer()
+        self.addCleanup(utils.clear_vocabulary_caches)
+        utils.clear_vocabulary_caches()
+        with mock.patch('metanorm.utils.get_gcmd_platform', return_value='old_platform'):
+            self.assertEqual(normalizer.get_field('platform', {}), 'old_platform')
+        with mock.patch('metanorm.utils.get_gcmd_platform', return_value='new_platform'):
+            self.assertEqual(normalizer.get_field('platform', {}), 'old_platform')
+            utils.clear_vocabulary_caches()
+            self.assertEqual(normalizer.get_field('platform', {}), 'new_platform')
+
+
+class LazyNormalizedMetadataTestCase(unittest.TestCase):
+    """Tests for LazyNormalizedMetadata"""
+
+    class TestNormalizer(normalizers.geospaas.GeoSPaaSMetadataNormalizer):
+        """Normalizer which records the computed fields"""
+
+        def __init__(self):
+            self.calls = []
+
+        def get_field(self, field_name, raw_metadata):
+            self.calls.append(field_name)
+            return f"{field_name}_{raw_metadata['id']}"
+
+    def setUp(self):
+        self.normalizer = self.TestNormalizer()
+        self.metadata = self.normalizer.normalize({'id': 1}, lazy=True)
+
+    def test_normalize_lazy(self):
+        """normalize(lazy=True) should return a LazyNormalizedMetadata
+        without calling any getter
+        """
+        self.assertIsInstance(self.metadata, normalizers.geospaas.base.LazyNormalizedMetadata)
+        self.assertListEqual(self.normalizer.calls, [])
+
+    def test_get_field(self):
+        """Fields should be computed on first access only"""
+        self.assertEqual(self.metadata['entry_id'], 'entry_id_1')
+        self.assertEqual(self.metadata['entry_id'], 'entry_id_1')
+        self.assertEqual(self.metadata.get('platform'), 'platform_1')
+        self.assertListEqual(self.normalizer.calls, ['entry_id', 'platform'])
+
+    def test_unknown_field(self):
+        """Unknown fields should raise a KeyError"""
+        with self.assertRaises(KeyError):
+            self.metadata['foo']  # pylint: disable=pointless-statement
+        self.assertNotIn('foo', self.metadata)
+        self.assertIn('entry_id', self.metadata)
+        self.assertListEqual(self.normalizer.calls, [])
+
+    def test_mapping(self):
+        """The mapping should contain the normalized fields"""
+        self.assertEqual(len(self.metadata), 12)
+        self.assertTupleEqual(tuple(self.metadata), self.normalizer.NORMALIZED_FIELDS)
+        self.assertListEqual(self.normalizer.calls, [])
+
+    def test_materialize(self):
+        """materialize() should return the same dictionary as
+        normalize()
+        """
+        self.assertEqual(self.metadata['summary'], 'summary_1')
+        self.assertDictEqual(self.metadata.materialize(), self.normalizer.normalize({'id': 1}))
+
+    def test_fields(self):
+        """The mapping should only contain the requested fields"""
+        metadata = self.normalizer.normalize({'id': 1}, lazy=True, fields=('entry_id', 'summary'))
+        self.assertDictEqual(metadata.materialize(),
+                             {'entry_id': 'entry_id_1', 'summary': 'summary_1'})
+        with self.assertRaises(KeyError):
+            metadata['platform']  # pylint: disable=pointless-statement
+
+    def test_record_context(self):
+        """The values derived from the record should be shared by the
+        fields, even when the fields are accessed in another record
+        context
+        """
+        normalizer = normalizers.geospaas.GeoSPaaSMetadataNormalizer()
+        derive = mock.Mock(return_value='value')
+        per_record_derive = utils.per_record(derive)
+        metadata = normalizer.normalize({}, lazy=True)
+        with mock.patch.object(normalizer, 'get_entry_id', lambda r: per_record_derive(1)), \
+                mock.patch.object(normalizer, 'get_entry_title', lambda r: per_record_derive(1)):
+            with utils.record_context():
+                per_record_derive(1)
+                self.assertEqual(metadata['entry_id'], 'value')
+            self.assertEqual(metadata['entry_title'], 'value')
+        self.assertEqual(derive.call_count, 2)
+
+    def test_error(self):
+        """Errors should be raised on access and not cached"""
+        normalizer = normalizers.geospaas.GeoSPaaSMetadataNormalizer()
+        metadata = normalizer.normalize({}, lazy=True)
+        with self.assertRaises(NotImplementedError):
+            metadata['entry_id']  # pylint: disable=pointless-statement
+        with mock.patch.object(normalizer, 'get_entry_id', return_value='foo'):
+            self.assertEqual(metadata['entry_id'], 'foo')
@@ -5,6 +5,7 @@ import unittest.mock as mock
 from datetime import datetime, timezone
 
 import metanorm.normalizers as normalizers
+import metanorm.utils as utils
 from metanorm.errors import MetadataNormalizationError
 
 
@@ -23,6 +24,33 @@ class NextsimMetadataNormalizerTests(unittest.TestCase):
         self.assertFalse(self.normalizer.check({'url': ''}))
         self.assertFalse(self.normalizer.check({'url': '/foo/bar/baz.nc'}))
 
+    def test_probe(self):
+        """probe() should return the entry ID match, or None without
+        raising any exception
+        """
+        match = self.normalizer.probe({
+            'url': '/foo/bar/20210823_hr-nersc-MODEL-nextsimf-ARC-b20210817-fv00.0.nc'})
+        self.assertEqual(match.group(1), '20210823_hr-nersc-MODEL-nextsimf-ARC-b20210817-fv00.0')
+        with mock.patch.object(self.normalizer, 'get_entry_id') as mock_get_entry_id:
+            for raw_metadata in ({}, {'url': None}, {'url': '/foo/bar/baz.nc'}):
+                with self.subTest(raw_metadata=raw_metadata):
+                    self.assertIsNone(self.normalizer.probe(raw_metadata))
+        mock_get_entry_id.assert_not_called()
+
+    def test_probe_match_reused(self):
+        """The match found by probe() should be reused by
+        get_entry_id() in the same record context
+        """
+        raw_metadata = {
+            'url': '/foo/bar/20210823_hr-nersc-MODEL-nextsimf-ARC-b20210817-fv00.0.nc'}
+        with mock.patch.object(self.normalizer, 'entry_id_matcher',
+                               wraps=self.normalizer.entry_id_matcher) as mock_matcher, \
+                utils.record_context():
+            self.normalizer.probe(raw_metadata)
+            self.assertEqual(self.normalizer.get_entry_id(raw_metadata),
+                             '20210823_hr-nersc-MODEL-nextsimf-ARC-b20210817-fv00.0')
+        mock_matcher.search.assert_called_once()
+
     def test_get_entry_title(self):
         """Test getting the title"""
         self.assertEqual(self.normalizer.get_entry_title({'title': 'foo'}), 'foo')
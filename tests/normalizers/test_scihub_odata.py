@@ -236,4 +236,4 @@ class ScihubODataMetadataNormalizerTestCase(unittest.TestCase):
 
     def test_unknown_dataset_parameters(self):
         """An empty list should be returned if no parameter is found"""
-        self.assertListEqual(self.normalizer.get_dataset_parameters({'Identifier': 'foo'}), [])
+        self.assertTupleEqual(self.normalizer.get_dataset_parameters({'Identifier': 'foo'}), ())
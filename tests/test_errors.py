@@ -0,0 +1,60 @@
+"""Tests for the exception classes"""
+
+import pickle
+import unittest
+import unittest.mock as mock
+
+import metanorm.errors as errors
+
+
+class MetadataNormalizationErrorTestCase(unittest.TestCase):
+    """Tests for MetadataNormalizationError"""
+
+    def test_message(self):
+        """The error should still work like a regular exception"""
+        error = errors.MetadataNormalizationError('foo')
+        self.assertEqual(str(error), 'foo')
+        self.assertTupleEqual(error.args, ('foo',))
+        self.assertEqual(str(errors.MetadataNormalizationError()), '')
+
+    def test_lazy_message(self):
+        """The message should only be built when the error is converted
+        to a string
+        """
+        raw_metadata = mock.MagicMock()
+        raw_metadata.__repr__ = mock.Mock(return_value="{'foo': 'bar'}")
+        error = errors.MetadataNormalizationError(raw_metadata=raw_metadata, getter_name='get_foo')
+        raw_metadata.__repr__.assert_not_called()
+        self.assertEqual(
+            str(error), "get_foo was unable to process the following metadata: {'foo': 'bar'}")
+        self.assertIs(error.raw_metadata, raw_metadata)
+        self.assertEqual(error.getter_name, 'get_foo')
+
+    def test_truncated_message(self):
+        """The representation of the raw metadata should be truncated
+        to max_metadata_length characters
+        """
+        error = errors.MetadataNormalizationError(
+            raw_metadata={'foo': 'bar'}, getter_name='get_foo', max_metadata_length=5)
+        self.assertEqual(str(error),
+                         "get_foo was unable to process the following metadata: {'foo...")
+
+        with mock.patch.object(errors.MetadataNormalizationError, 'max_metadata_length', 3):
+            self.assertEqual(
+                str(errors.MetadataNormalizationError(raw_metadata={'a': 1}, getter_name='get_a')),
+                "get_a was unable to process the following metadata: {'a...")
+            self.assertEqual(
+                str(errors.MetadataNormalizationError(raw_metadata={}, getter_name='get_a')),
+                "get_a was unable to process the following metadata: {}")
+
+    def test_pickle(self):
+        """The error should be picklable, with or without message"""
+        for error in (errors.MetadataNormalizationError('foo'),
+                      errors.MetadataNormalizationError(
+                          raw_metadata={'foo': 'bar'}, getter_name='get_foo',
+                          max_metadata_length=10)):
+            with self.subTest(error=error):
+                unpickled_error = pickle.loads(pickle.dumps(error))
+                self.assertIsInstance(unpickled_error, errors.MetadataNormalizationError)
+                self.assertEqual(str(unpickled_error), str(error))
+                self.assertEqual(unpickled_error.raw_metadata, error.raw_metadata)
@@ -1,6 +1,9 @@
 """Tests for the metadata handler"""
 #pylint: disable=protected-access
 
+import asyncio
+import json
+import time
 import unittest
 import unittest.mock as mock
 
@@ -23,10 +26,10 @@ class MetadataHandlerTestCase(unittest.TestCase):
             """Get the 'bar' attribute from raw metadata"""
             raise NotImplementedError
 
-        def normalize(self, raw_metadata):
+        def normalize(self, raw_metadata, fields=None):
             return {
-                'foo': self.get_foo(raw_metadata),
-                'bar': self.get_bar(raw_metadata)
+                field: getattr(self, f"get_{field}")(raw_metadata)
+                for field in (fields or ('foo', 'bar'))
             }
 
     class TestNormalizer1(TestBaseNormalizer):
@@ -95,9 +98,557 @@ class MetadataHandlerTestCase(unittest.TestCase):
             {'foo': 'value3', 'bar': 'value4, value5'}
         )
 
+    def test_find_normalizer_probe(self):
+        """The normalizer should be chosen using probe()"""
+        with mock.patch.object(self.TestNormalizer1, 'probe', return_value=None):
+            with self.assertRaises(errors.NoNormalizerFound):
+                self.handler.get_parameters({'foo': 'value1', 'bar': 'value2'})
+        with mock.patch.object(self.TestNormalizer2, 'probe', return_value=object()):
+            self.assertIsInstance(
+                self.handler._find_normalizer({}), self.TestNormalizer2)
+
+    def test_deterministic_order(self):
+        """The normalizers should be sorted by class name"""
+        self.assertListEqual(
+            [n.__class__ for n in self.handler.normalizers],
+            [self.TestNormalizer1, self.TestNormalizer2, self.TestNormalizer3])
+        self.assertListEqual(self.handler._unindexed_normalizers, self.handler.normalizers)
+
+    def test_reorder(self):
+        """The normalizers should be periodically sorted by decreasing
+        number of hits
+        """
+        raw_metadata = {'baz': 'value3', 'qux': 'value4', 'quux': 'value5'}
+        with mock.patch.object(self.handler, 'reorder_interval', 3):
+            self.handler._find_normalizer(raw_metadata)
+            self.handler._find_normalizer(raw_metadata)
+            self.assertIsInstance(self.handler._unindexed_normalizers[0], self.TestNormalizer1)
+            self.handler._find_normalizer({'foo': 'value1', 'bar': 'value2'})
+        self.assertListEqual(
+            [n.__class__ for n in self.handler._unindexed_normalizers],
+            [self.TestNormalizer3, self.TestNormalizer1, self.TestNormalizer2])
+        self.assertDictEqual(
+            dict(self.handler._hits),
+            {handlers.get_normalizer_key(self.handler._unindexed_normalizers[0]): 2,
+             handlers.get_normalizer_key(self.handler._unindexed_normalizers[1]): 1})
+
+    def test_dispatch_state(self):
+        """The dispatch state should be serializable and restorable"""
+        for _ in range(3):
+            self.handler._find_normalizer({'baz': 'value3', 'qux': 'value4', 'quux': 'value5'})
+        self.handler.reorder()
+        state = json.loads(json.dumps(self.handler.get_dispatch_state()))
+
+        new_handler = handlers.MetadataHandler(self.TestBaseNormalizer)
+        new_handler.set_dispatch_state(state)
+        self.assertDictEqual(new_handler.get_dispatch_state(), state)
+        self.assertEqual(state['lookups'], 3)
+        self.assertIsInstance(new_handler._unindexed_normalizers[0], self.TestNormalizer3)
+
+    def test_set_dispatch_state_unknown_normalizers(self):
+        """Normalizers which are not in the state should be placed
+        last
+        """
+        key3 = handlers.get_normalizer_key(self.TestNormalizer3())
+        self.handler.set_dispatch_state({'lookups': 0, 'hits': {}, 'order': [key3]})
+        self.assertListEqual(
+            [n.__class__ for n in self.handler._unindexed_normalizers],
+            [self.TestNormalizer3, self.TestNormalizer1, self.TestNormalizer2])
+
+    def test_get_record_signature(self):
+        """Records from the same directory or with the same attributes
+        should have the same signature
+        """
+        self.assertTupleEqual(
+            self.handler.get_record_signature({'url': 'ftp://host/a/b/c/file.nc', 'foo': 1}),
+            ('ftp:', '', 'host', 'a', 'b'))
+        self.assertTupleEqual(
+            self.handler.get_record_signature({'url': 'https://host/a/file.nc'}),
+            ('https:', '', 'host', 'a'))
+        self.assertEqual(
+            self.handler.get_record_signature({'foo': 1, 'bar': 2}),
+            self.handler.get_record_signature({'bar': 3, 'foo': 4}))
+        self.assertNotEqual(
+            self.handler.get_record_signature({'foo': 1, 'bar': 2}),
+            self.handler.get_record_signature({'foo': 1}))
+
+    def test_dispatch_memo(self):
+        """The normalizer found for a signature should be probed first
+        for the following records with the same signature
+        """
+        self.handler._find_normalizer({'baz': 'value1', 'qux': 'value2', 'quux': 'value3'})
+        with mock.patch.object(self.TestNormalizer1, 'probe') as mock_probe1, \
+                mock.patch.object(self.TestNormalizer3, 'probe',
+                                  return_value=True) as mock_probe3:
+            self.assertIsInstance(
+                self.handler._find_normalizer({'baz': 'value4', 'qux': 'value5', 'quux': 6}),
+                self.TestNormalizer3)
+        mock_probe1.assert_not_called()
+        mock_probe3.assert_called_once()
+
+    def test_dispatch_memo_mismatch(self):
+        """If the remembered normalizer does not match, the candidates
+        should be scanned and the memo updated
+        """
+        signature = self.handler.get_record_signature({'foo': 1, 'bar': 2})
+        self.handler._dispatch_memo.set(signature, self.handler.normalizers[2])
+        self.assertIsInstance(
+            self.handler._find_normalizer({'foo': 1, 'bar': 2}), self.TestNormalizer1)
+        self.assertIsInstance(self.handler._dispatch_memo.get(signature)[1], self.TestNormalizer1)
+
+    def test_get_parameters_fields(self):
+        """Only the requested fields should be normalized"""
+        with mock.patch.object(self.TestNormalizer1, 'get_bar') as mock_get_bar:
+            self.assertDictEqual(
+                self.handler.get_parameters({'foo': 'value1', 'bar': 'value2'}, fields=('foo',)),
+                {'foo': 'value1'})
+        mock_get_bar.assert_not_called()
+
+    def test_get_parameters_no_fields(self):
+        """The fields argument should not be passed to the normalizer
+        when no projection is requested
+        """
+        raw_metadata = {'foo': 'value1', 'bar': 'value2'}
+        with mock.patch.object(self.TestNormalizer1, 'normalize', autospec=True) as mock_normalize:
+            self.handler.get_parameters(raw_metadata)
+            list(self.handler.get_parameters_many([raw_metadata]))
+        mock_normalize.assert_has_calls([
+            mock.call(mock.ANY, raw_metadata), mock.call(mock.ANY, raw_metadata)])
+
     def test_get_parameters_not_found(self):
         """get_parameters() should raise an exception if not normalizer
         was found for the given metadata
         """
         with self.assertRaises(errors.NoNormalizerFound):
             self.handler.get_parameters({'something': 'something'})
+
+    def test_get_parameters_many(self):
+        """get_parameters_many() should lazily yield the normalized
+        metadata in the same order as the input
+        """
+        raw_metadata = iter([
+            {'foo': 'value1', 'bar': 'value2'},
+            {'baz': 'value3', 'qux': 'value4', 'quux': 'value5'},
+            {'foo': 'value6', 'bar': 'value7'},
+        ])
+        results = self.handler.get_parameters_many(raw_metadata)
+        self.assertDictEqual(next(results), {'foo': 'value1', 'bar': 'value2'})
+        # only the first record has been consumed
+        self.assertDictEqual(
+            next(raw_metadata),
+            {'baz': 'value3', 'qux': 'value4', 'quux': 'value5'})
+        self.assertListEqual(list(results), [{'foo': 'value6', 'bar': 'value7'}])
+
+    def test_get_parameters_many_previous_normalizer_first(self):
+        """The normalizer used for the previous record should be
+        checked first
+        """
+        raw_metadata = [{'foo': 'value1', 'bar': 'value2'}, {'foo': 'value3', 'bar': 'value4'}]
+        with mock.patch.object(self.handler, '_find_normalizer',
+                               wraps=self.handler._find_normalizer) as mock_find_normalizer:
+            self.assertListEqual(
+                list(self.handler.get_parameters_many(raw_metadata)),
+                raw_metadata)
+        mock_find_normalizer.assert_called_once_with(raw_metadata[0])
+
+    def test_get_parameters_many_errors(self):
+        """Errors should be yielded in place of the normalized
+        metadata
+        """
+        results = list(self.handler.get_parameters_many([
+            {'something': 'something'},
+            {'foo': 'value1', 'bar': 'value2'},
+        ]))
+        self.assertIsInstance(results[0], errors.NoNormalizerFound)
+        self.assertDictEqual(results[1], {'foo': 'value1', 'bar': 'value2'})
+
+    def test_get_parameters_many_raise_errors(self):
+        """Errors should be raised if return_exceptions is False"""
+        results = self.handler.get_parameters_many(
+            [{'something': 'something'}], return_exceptions=False)
+        with self.assertRaises(errors.NoNormalizerFound):
+            next(results)
+
+    def test_get_parameters_many_fields(self):
+        """Only the requested fields should be normalized"""
+        self.assertListEqual(
+            list(self.handler.get_parameters_many(
+                [{'foo': 'value1', 'bar': 'value2'}, {'baz': 'value3', 'qux': 1, 'quux': 2}],
+                fields=('bar',))),
+            [{'bar': 'value2'}, {'bar': '1, 2'}])
+
+    def test_get_parameters_many_flush_warnings(self):
+        """The aggregated warnings should be flushed at the end of the
+        batch, including when it is interrupted by an error
+        """
+        with mock.patch('metanorm.utils.flush_warning_collectors') as mock_flush:
+            results = self.handler.get_parameters_many([{'foo': 'value1', 'bar': 'value2'}])
+            next(results)
+            mock_flush.assert_not_called()
+            self.assertListEqual(list(results), [])
+            mock_flush.assert_called_once_with()
+
+            mock_flush.reset_mock()
+            with self.assertRaises(errors.NoNormalizerFound):
+                list(self.handler.get_parameters_many(
+                    [{'something': 'something'}], return_exceptions=False))
+            mock_flush.assert_called_once_with()
+
+    def test_get_parameters_flush_due_warnings(self):
+        """The aggregated warnings whose summary is due should be
+        flushed after each record normalized by get_parameters()
+        """
+        with mock.patch('metanorm.utils.flush_warning_collectors') as mock_flush:
+            self.handler.get_parameters({'foo': 'value1', 'bar': 'value2'})
+            mock_flush.assert_called_once_with(due_only=True)
+
+            mock_flush.reset_mock()
+            with self.assertRaises(errors.NoNormalizerFound):
+                self.handler.get_parameters({'something': 'something'})
+            mock_flush.assert_called_once_with(due_only=True)
+
+
+class MetadataHandlerURLIndexTestCase(unittest.TestCase):
+    """Test the dispatching of raw metadata based on URL prefixes"""
+
+    class TestBaseNormalizer(normalizers.MetadataNormalizer):
+        """Base class for test normalizers"""
+
+        def check(self, raw_metadata):
+            return raw_metadata.get('url', '').startswith(self.url_prefixes)
+
+        def normalize(self, raw_metadata):
+            return {'normalizer': self.__class__.__name__}
+
+    class FooNormalizer(TestBaseNormalizer):
+        """Test normalizer with one prefix"""
+        url_prefixes = ('ftp://foo/',)
+
+    class FooBarNormalizer(TestBaseNormalizer):
+        """Test normalizer with a prefix nested in FooNormalizer's
+        prefix
+        """
+        url_prefixes = ('ftp://foo/bar/',)
+
+    class BazNormalizer(TestBaseNormalizer):
+        """Test normalizer with several prefixes"""
+        url_prefixes = ('https://baz/', 'https://qux/')
+
+    class UnindexedNormalizer(TestBaseNormalizer):
+        """Test normalizer which does not declare any prefix"""
+
+        def check(self, raw_metadata):
+            return raw_metadata.get('corge') == 'grault'
+
+    def setUp(self):
+        self.handler = handlers.MetadataHandler(self.TestBaseNormalizer)
+
+    def test_get_candidates(self):
+        """The normalizers with a matching prefix should come first,
+        longest prefix first, followed by the unindexed normalizers
+        """
+        self.assertListEqual(
+            [n.__class__ for n in self.handler._get_candidates({'url': 'ftp://foo/bar/baz.nc'})],
+            [self.FooBarNormalizer, self.FooNormalizer, self.UnindexedNormalizer])
+        self.assertListEqual(
+            [n.__class__ for n in self.handler._get_candidates({'url': 'https://qux/quux'})],
+            [self.BazNormalizer, self.UnindexedNormalizer])
+        self.assertListEqual(
+            [n.__class__ for n in self.handler._get_candidates({'foo': 'bar'})],
+            [self.UnindexedNormalizer])
+
+    def test_get_parameters(self):
+        """Test that the metadata is normalized using the right
+        normalizers
+        """
+        self.assertDictEqual(
+            self.handler.get_parameters({'url': 'ftp://foo/bar/baz.nc'}),
+            {'normalizer': 'FooBarNormalizer'})
+        self.assertDictEqual(
+            self.handler.get_parameters({'url': 'ftp://foo/baz.nc'}),
+            {'normalizer': 'FooNormalizer'})
+        self.assertDictEqual(
+            self.handler.get_parameters({'url': 'https://baz/qux'}),
+            {'normalizer': 'BazNormalizer'})
+        self.assertDictEqual(
+            self.handler.get_parameters({'url': 'https://quux', 'corge': 'grault'}),
+            {'normalizer': 'UnindexedNormalizer'})
+
+    def test_get_parameters_not_found(self):
+        """get_parameters() should raise an exception if no prefix
+        matches and no unindexed normalizer can be used
+        """
+        with self.assertRaises(errors.NoNormalizerFound):
+            self.handler.get_parameters({'url': 'https://quux'})
+
+
+class LazyNormalizerTestCase(unittest.TestCase):
+    """Test the LazyNormalizer class"""
+
+    def setUp(self):
+        self.lazy_normalizer = handlers.LazyNormalizer({
+            'module': 'tests.test_handler',
+            'name': 'MetadataHandlerTestCase',
+            'bases': (),
+            'url_prefixes': ('ftp://foo/',)
+        })
+
+    def test_url_prefixes(self):
+        """The URL prefixes should be available without importing the
+        module
+        """
+        with mock.patch('importlib.import_module') as mock_import_module:
+            self.assertTupleEqual(self.lazy_normalizer.url_prefixes, ('ftp://foo/',))
+        mock_import_module.assert_not_called()
+
+    def test_load(self):
+        """The normalizer should be instantiated once, when it is
+        first used
+        """
+        with mock.patch('importlib.import_module') as mock_import_module:
+            self.lazy_normalizer.check({})
+            self.lazy_normalizer.probe({})
+            self.lazy_normalizer.normalize({})
+        mock_import_module.assert_called_once_with('tests.test_handler')
+        normalizer_class = mock_import_module.return_value.MetadataHandlerTestCase
+        normalizer_class.assert_called_once_with()
+        normalizer_class.return_value.check.assert_called_once_with({})
+        normalizer_class.return_value.probe.assert_called_once_with({})
+        normalizer_class.return_value.normalize.assert_called_once_with({})
+
+    def test_normalize_arguments(self):
+        """The arguments of normalize() should be passed on to the
+        actual normalizer
+        """
+        lazy_normalizer = handlers.LazyNormalizer({
+            'module': 'metanorm.normalizers.geospaas.noaa_rtofs',
+            'name': 'NOAARTOFSMetadataNormalizer',
+            'bases': (),
+            'url_prefixes': ('ftp://ftpprd.ncep.noaa.gov/pub/data/nccf/com/rtofs/prod',)
+        })
+        url = ('ftp://ftpprd.ncep.noaa.gov/pub/data/nccf/com/rtofs/prod/rtofs.20210519/'
+               'rtofs_glo_2ds_n000_prog.nc')
+        self.assertDictEqual(
+            lazy_normalizer.normalize({'url': url}, fields=('entry_id',)),
+            {'entry_id': '20210519/rtofs_glo_2ds_n000_prog'})
+        self.assertEqual(
+            lazy_normalizer.normalize({'url': url}, lazy=True)['entry_id'],
+            '20210519/rtofs_glo_2ds_n000_prog')
+
+    def test_get_normalizer_key(self):
+        """The key of a lazy normalizer should be the key of the class
+        it stands for
+        """
+        self.assertEqual(handlers.get_normalizer_key(self.lazy_normalizer),
+                         'tests.test_handler.MetadataHandlerTestCase')
+
+    def test_find_normalizer(self):
+        """The handler should return the actual normalizer"""
+        handler = handlers.MetadataHandler(MetadataHandlerTestCase.TestBaseNormalizer)
+        normalizer = mock.Mock()
+        self.lazy_normalizer._normalizer = normalizer
+        handler._unindexed_normalizers = [self.lazy_normalizer]
+        self.assertIs(handler._find_normalizer({}), normalizer)
+
+
+class ParallelMetadataHandlerTestCase(unittest.TestCase):
+    """Test the ParallelMetadataHandler class"""
+
+    def setUp(self):
+        self.handler = handlers.ParallelMetadataHandler(
+            MetadataHandlerTestCase.TestBaseNormalizer, workers=2, chunksize=2)
+        self.addCleanup(self.handler.close)
+
+    def test_get_parameters(self):
+        """Test normalizing one record in a worker process"""
+        self.assertDictEqual(
+            self.handler.get_parameters({'foo': 'value1', 'bar': 'value2'}),
+            {'foo': 'value1', 'bar': 'value2'})
+
+    def test_get_parameters_not_found(self):
+        """The errors raised in the worker processes should be raised
+        """
+        with self.assertRaises(errors.NoNormalizerFound):
+            self.handler.get_parameters({'something': 'something'})
+
+    def test_get_parameters_many(self):
+        """The results should be yielded in the same order as the
+        input
+        """
+        raw_metadata = [{'foo': i, 'bar': i} for i in range(11)]
+        raw_metadata.insert(5, {'something': 'something'})
+        results = list(self.handler.get_parameters_many(iter(raw_metadata)))
+        self.assertEqual(len(results), 12)
+        self.assertIsInstance(results[5], errors.NoNormalizerFound)
+        del results[5], raw_metadata[5]
+        self.assertListEqual(results, raw_metadata)
+
+    def test_get_parameters_many_raise_errors(self):
+        """Errors should be raised if return_exceptions is False"""
+        with self.assertRaises(errors.NoNormalizerFound):
+            list(self.handler.get_parameters_many(
+                [{'foo': 1, 'bar': 2}, {'something': 'something'}], return_exceptions=False))
+
+    def test_get_parameters_many_early_close(self):
+        """The pending chunks should be cancelled when the generator is
+        closed before the end
+        """
+        futures = [mock.Mock(**{'result.return_value': [{'foo': i}] * 2}) for i in range(10)]
+        with mock.patch.object(self.handler, '_get_executor') as mock_get_executor:
+            mock_get_executor.return_value.submit.side_effect = futures
+            results = self.handler.get_parameters_many([{'foo': i} for i in range(20)])
+            self.assertDictEqual(next(results), {'foo': 0})
+            results.close()
+        # 2 chunks per worker are submitted before the first result
+        self.assertEqual(mock_get_executor.return_value.submit.call_count, 4)
+        futures[0].cancel.assert_not_called()
+        for future in futures[1:4]:
+            future.cancel.assert_called_once_with()
+
+    def test_fields(self):
+        """The fields should be passed to the workers"""
+        self.assertDictEqual(
+            self.handler.get_parameters({'foo': 'value1', 'bar': 'value2'}, fields=('foo',)),
+            {'foo': 'value1'})
+        self.assertListEqual(
+            list(self.handler.get_parameters_many(
+                [{'foo': i, 'bar': i} for i in range(3)], fields=('bar',))),
+            [{'bar': i} for i in range(3)])
+
+    def test_context_manager(self):
+        """The worker processes should be shut down when exiting the
+        context
+        """
+        with handlers.ParallelMetadataHandler(workers=1) as handler:
+            handler._get_executor()
+            self.assertIsNotNone(handler._executor)
+        self.assertIsNone(handler._executor)
+
+    def test_vocabulary_snapshot(self):
+        """The vocabulary snapshot should be built when the pool is
+        created, and loaded by the workers
+        """
+        handler = handlers.ParallelMetadataHandler(workers=1, vocabulary_snapshot='/snapshot')
+        with mock.patch('metanorm.utils.ensure_vocabulary_snapshot') as mock_ensure, \
+                mock.patch('concurrent.futures.ProcessPoolExecutor') as mock_executor:
+            handler._get_executor()
+        mock_ensure.assert_called_once_with('/snapshot')
+        self.assertTupleEqual(mock_executor.call_args[1]['initargs'], (None, '/snapshot'))
+
+        with mock.patch('metanorm.utils.load_vocabulary_snapshot') as mock_load, \
+                mock.patch('metanorm.handlers.MetadataHandler'):
+            handlers._init_worker(None, '/snapshot')
+        mock_load.assert_called_once_with('/snapshot')
+
+
+class AsyncMetadataHandlerTestCase(unittest.TestCase):
+    """Test the AsyncMetadataHandler class"""
+
+    def setUp(self):
+        self.handler = handlers.AsyncMetadataHandler(
+            MetadataHandlerTestCase.TestBaseNormalizer, max_concurrency=2)
+        self.addCleanup(self.handler.close)
+
+    def test_get_parameters(self):
+        """Test normalizing one record"""
+        self.assertDictEqual(
+            asyncio.run(self.handler.get_parameters({'foo': 'value1', 'bar': 'value2'})),
+            {'foo': 'value1', 'bar': 'value2'})
+
+    def test_get_parameters_not_found(self):
+        """Errors should be raised"""
+        with self.assertRaises(errors.NoNormalizerFound):
+            asyncio.run(self.handler.get_parameters({'something': 'something'}))
+
+    def test_get_parameters_fields(self):
+        """Only the requested fields should be normalized"""
+        self.assertDictEqual(
+            asyncio.run(self.handler.get_parameters(
+                {'foo': 'value1', 'bar': 'value2'}, fields=('bar',))),
+            {'bar': 'value2'})
+
+    def test_get_parameters_many(self):
+        """The results should be yielded in the same order as the
+        input, which can be an asynchronous iterable
+        """
+        raw_metadata = [{'foo': i, 'bar': i} for i in range(5)]
+
+        async def produce():
+            for item in raw_metadata:
+                yield item
+            yield {'something': 'something'}
+
+        async def consume():
+            return [result async for result in self.handler.get_parameters_many(produce())]
+
+        results = asyncio.run(consume())
+        self.assertListEqual(results[:-1], raw_metadata)
+        self.assertIsInstance(results[-1], errors.NoNormalizerFound)
+
+    def test_get_parameters_many_backpressure(self):
+        """No more than max_concurrency records should be taken from
+        the input before a result is yielded
+        """
+        raw_metadata = iter([{'foo': i, 'bar': i} for i in range(5)])
+
+        async def consume_one():
+            results = self.handler.get_parameters_many(raw_metadata)
+            result = await results.__anext__()
+            await results.aclose()
+            return result
+
+        self.assertDictEqual(asyncio.run(consume_one()), {'foo': 0, 'bar': 0})
+        self.assertDictEqual(next(raw_metadata), {'foo': 2, 'bar': 2})
+
+    def test_get_parameters_many_raise_errors(self):
+        """Errors should be raised if return_exceptions is False"""
+        async def consume():
+            return [result async for result in self.handler.get_parameters_many(
+                [{'something': 'something'}, {'foo': 1, 'bar': 2}], return_exceptions=False)]
+
+        with self.assertRaises(errors.NoNormalizerFound):
+            asyncio.run(consume())
+
+    def test_concurrent_reorder(self):
+        """Reordering the normalizers while other threads look for a
+        normalizer should not make these lookups fail
+        """
+        # without dispatch memo, every lookup goes through the
+        # unindexed normalizers
+        with mock.patch.object(handlers.MetadataHandler, 'dispatch_memo_size', 0):
+            handler = handlers.AsyncMetadataHandler(
+                MetadataHandlerTestCase.TestBaseNormalizer, max_concurrency=4)
+        self.addCleanup(handler.close)
+        handler.handler.reorder_interval = 7
+        raw_metadata = [
+            {'foo': i, 'bar': i} if i % 3 else {'baz': i, 'qux': i, 'quux': i}
+            for i in range(2000)
+        ]
+
+        def slow_get_normalizer_key(normalizer):
+            """Lets the other threads run while the normalizers are
+            being sorted
+            """
+            time.sleep(0.0001)
+            return get_normalizer_key(normalizer)
+
+        async def consume():
+            return [result async for result in handler.get_parameters_many(raw_metadata)]
+
+        get_normalizer_key = handlers.get_normalizer_key
+        with mock.patch('metanorm.handlers.get_normalizer_key', slow_get_normalizer_key):
+            results = asyncio.run(consume())
+        self.assertListEqual([result for result in results if isinstance(result, Exception)], [])
+        self.assertEqual(sum(handler.handler.get_dispatch_state()['hits'].values()), 2000)
+        self.assertEqual(handler.handler.get_dispatch_state()['lookups'], 2000)
+
+    def test_provided_executor(self):
+        """A provided executor should be used and not be shut down by
+        the handler
+        """
+        executor = mock.Mock()
+        handler = handlers.AsyncMetadataHandler(
+            MetadataHandlerTestCase.TestBaseNormalizer, executor=executor)
+        self.assertIs(handler._get_executor(), executor)
+        handler.close()
+        executor.shutdown.assert_not_called()
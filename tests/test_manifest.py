@@ -0,0 +1,141 @@
+"""Tests for the normalizers manifest"""
+
+import subprocess
+import sys
+import unittest
+import unittest.mock as mock
+
+import metanorm.manifest as manifest
+import metanorm.normalizers as normalizers
+
+
+class ManifestTestCase(unittest.TestCase):
+    """Tests for the manifest functions"""
+
+    ENTRIES = (
+        {'module': 'package.base', 'name': 'Base', 'bases': (), 'url_prefixes': ()},
+        {'module': 'package.sub.a', 'name': 'A', 'bases': ('package.sub.base.SubBase',),
+         'url_prefixes': ('ftp://a/',)},
+        {'module': 'package.sub.base', 'name': 'SubBase', 'bases': ('package.base.Base',),
+         'url_prefixes': ()},
+        {'module': 'package.b', 'name': 'B', 'bases': ('package.base.Base',),
+         'url_prefixes': ()},
+    )
+
+    class Base():
+        """Stands for package.base.Base"""
+    Base.__module__ = 'package.base'
+    Base.__qualname__ = 'Base'
+
+    def test_manifest_up_to_date(self):
+        """The manifest should match the normalizer classes. If this
+        fails, run `python -m metanorm.manifest`
+        """
+        self.assertTupleEqual(manifest.get_manifest(), manifest.generate_manifest())
+
+    def test_manifest_contents(self):
+        """Check an entry of the actual manifest"""
+        self.assertIn(
+            {
+                'module': 'metanorm.normalizers.geospaas.noaa_hycom',
+                'name': 'NOAAHYCOMMetadataNormalizer',
+                'bases': ('metanorm.normalizers.geospaas.base.GeoSPaaSMetadataNormalizer',),
+                'url_prefixes': (
+                    'ftp://ftp.opc.ncep.noaa.gov/grids/operational/GLOBALHYCOM/Navy',),
+            },
+            manifest.get_manifest())
+
+    def test_get_subclass_entries(self):
+        """get_subclass_entries() should return all the direct and
+        indirect subclasses of the base class, in the manifest order
+        """
+        with mock.patch('metanorm.manifest.get_manifest', return_value=self.ENTRIES):
+            self.assertListEqual(
+                manifest.get_subclass_entries(self.Base),
+                [self.ENTRIES[1], self.ENTRIES[2], self.ENTRIES[3]])
+
+    def test_get_manifest_missing(self):
+        """If the manifest module does not exist, the manifest should
+        be generated
+        """
+        with mock.patch('metanorm.manifest.generate_manifest') as mock_generate, \
+                mock.patch('importlib.import_module', side_effect=ImportError):
+            self.assertEqual(manifest.get_manifest(), mock_generate.return_value)
+
+    def test_lazy_export(self):
+        """lazy_export() should fill __all__ and return a function which
+        imports the classes on demand
+        """
+        package__all__ = []
+        with mock.patch('metanorm.manifest.get_manifest', return_value=self.ENTRIES):
+            package_getattr = manifest.lazy_export(package__all__, 'package.sub', self.Base)
+        self.assertListEqual(package__all__, ['Base', 'A', 'SubBase'])
+
+        with mock.patch.dict('sys.modules', {'package.sub': mock.Mock()}), \
+                mock.patch('importlib.import_module') as mock_import_module:
+            self.assertEqual(package_getattr('A'), mock_import_module.return_value.A)
+        mock_import_module.assert_called_once_with('package.sub.a')
+
+    def test_lazy_export_submodule(self):
+        """Sub-packages should be imported on demand"""
+        package_getattr = manifest.lazy_export([], 'metanorm.normalizers',
+                                               normalizers.MetadataNormalizer)
+        self.assertIs(package_getattr('geospaas'), normalizers.geospaas)
+
+    def test_lazy_export_unknown_attribute(self):
+        """An AttributeError should be raised for unknown names"""
+        package_getattr = manifest.lazy_export([], 'metanorm.normalizers',
+                                               normalizers.MetadataNormalizer)
+        for name in ('foo', '__foo__'):
+            with self.subTest(name=name):
+                with self.assertRaises(AttributeError):
+                    package_getattr(name)
+
+
+class LazyImportTestCase(unittest.TestCase):
+    """Check in new interpreters that the normalizer modules are only
+    imported when needed
+    """
+
+    @staticmethod
+    def run_python(code):
+        """Runs `code` in a new interpreter and returns the names of the
+        imported metanorm.normalizers modules
+        """
+        process = subprocess.run(
+            [sys.executable, '-c',
+             code + "\nimport sys\n"
+             "print(' '.join(m for m in sys.modules if m.startswith('metanorm.normalizers')))"],
+            stdout=subprocess.PIPE, check=True, universal_newlines=True)
+        return set(process.stdout.split())
+
+    def test_import_normalizers(self):
+        """Importing the normalizers package should not import the
+        normalizer modules
+        """
+        self.assertSetEqual(
+            self.run_python('import metanorm.normalizers'),
+            {'metanorm.normalizers', 'metanorm.normalizers._manifest',
+             'metanorm.normalizers.base'})
+
+    def test_access_normalizer(self):
+        """Accessing a normalizer class should only import its module"""
+        imported_modules = self.run_python(
+            'import metanorm.normalizers as normalizers\n'
+            'normalizers.geospaas.NOAAHYCOMMetadataNormalizer')
+        self.assertIn('metanorm.normalizers.geospaas.noaa_hycom', imported_modules)
+        self.assertNotIn('metanorm.normalizers.geospaas.cmems', imported_modules)
+
+    def test_handler_dispatch(self):
+        """The handler should only import the modules of the candidate
+        normalizers
+        """
+        imported_modules = self.run_python(
+            'import metanorm.handlers as handlers\n'
+            'handler = handlers.MetadataHandler()\n'
+            "handler._find_normalizer({'url': "
+            "'ftp://ftp.opc.ncep.noaa.gov/grids/operational/GLOBALHYCOM/Navy/"
+            "hycom_glb_regp01_2021010200_t000.nc.gz'})")
+        self.assertIn('metanorm.normalizers.geospaas.noaa_hycom', imported_modules)
+        self.assertNotIn('metanorm.normalizers.geospaas.cmems', imported_modules)
+        self.assertNotIn('metanorm.normalizers.geospaas.creodias', imported_modules)
@@ -1,12 +1,25 @@
 """Tests for the utils module"""
+import copy
+import json
+import logging
+import os
+import os.path
+import pickle
 import re
+import subprocess
+import sys
+import tempfile
+import time
 import unittest
 import unittest.mock as mock
 from collections import OrderedDict
 from datetime import datetime
 
 from dateutil.relativedelta import relativedelta
-from dateutil.tz import tzutc
+import dateutil.parser
+import numpy
+from dateutil.tz import tzoffset, tzutc
+import pythesint.vocabulary
 import shapely.geometry
 
 import metanorm.errors as errors
@@ -84,6 +97,42 @@ class TimeTestCase(unittest.TestCase):
             utils.find_time_coverage(time_patterns, 'ftp://foo/dataset_202002.nc'),
             (datetime(2020, 2, 1, tzinfo=tzutc()), datetime(2020, 3, 1, tzinfo=tzutc())))
 
+    def test_find_time_coverage_patterns_priority(self):
+        """The first pattern which matches should be used, even if
+        another one matches earlier in the URL
+        """
+        time_patterns = (
+            (
+                re.compile(rf"_{utils.YEARMONTHDAY_REGEX}\.nc$"),
+                utils.create_datetime,
+                lambda time: (time, time + relativedelta(days=1))
+            ),
+            (
+                re.compile(rf"/{utils.YEARMONTH_REGEX}/"),
+                utils.create_datetime,
+                lambda time: (time, time + relativedelta(months=1))
+            )
+        )
+        self.assertTupleEqual(
+            utils.find_time_coverage(time_patterns, 'ftp://foo/202002/dataset_20200205.nc'),
+            (datetime(2020, 2, 5, tzinfo=tzutc()), datetime(2020, 2, 6, tzinfo=tzutc())))
+        self.assertTupleEqual(
+            utils.find_time_coverage(time_patterns, 'ftp://foo/202002/dataset.nc'),
+            (datetime(2020, 2, 1, tzinfo=tzutc()), datetime(2020, 3, 1, tzinfo=tzutc())))
+
+    def test_find_time_coverage_single_call(self):
+        """find_time_coverage() should match the URL and compute the
+        coverage only once per record
+        """
+        get_coverage = mock.Mock(return_value=(1, 2))
+        get_time = mock.Mock(return_value=0)
+        time_patterns = ((re.compile(r'dataset_(?P<year>\d{4})\.nc$'), get_time, get_coverage),)
+        with utils.record_context():
+            self.assertEqual(utils.find_time_coverage(time_patterns, 'dataset_2020.nc')[0], 1)
+            self.assertEqual(utils.find_time_coverage(time_patterns, 'dataset_2020.nc')[1], 2)
+        get_time.assert_called_once_with(year='2020')
+        get_coverage.assert_called_once_with(0)
+
     def test_find_time_coverage_not_found(self):
         """A MetadataNormalizationError must be raised when no time
         coverage can be extracted
@@ -92,9 +141,52 @@ class TimeTestCase(unittest.TestCase):
         with self.assertRaises(errors.MetadataNormalizationError):
             utils.find_time_coverage(time_patterns, 'bar')
 
+    def test_parse_datetime_iso(self):
+        """parse_datetime() should parse the common ISO-8601 forms
+        without using dateutil
+        """
+        expected = {
+            '2020-07-12': datetime(2020, 7, 12),
+            '2020-07-12 10:11': datetime(2020, 7, 12, 10, 11),
+            '2020-07-12T10:11:12.5': datetime(2020, 7, 12, 10, 11, 12, 500000),
+            '2020-07-12T10:11:12Z': datetime(2020, 7, 12, 10, 11, 12, tzinfo=tzutc()),
+            '2020-07-12T10:11:12+00:00': datetime(2020, 7, 12, 10, 11, 12, tzinfo=tzutc()),
+            '2020-07-12T10:11:12.123456+02:00':
+                datetime(2020, 7, 12, 10, 11, 12, 123456, tzinfo=tzoffset(None, 7200)),
+            '2020-07-12T10:11:12-0330':
+                datetime(2020, 7, 12, 10, 11, 12, tzinfo=tzoffset(None, -12600)),
+        }
+        with mock.patch('dateutil.parser.parse') as mock_parse:
+            for string, result in expected.items():
+                with self.subTest(string=string):
+                    parsed = utils.parse_datetime(string)
+                    self.assertEqual(parsed, result)
+                    self.assertEqual(parsed.tzinfo, result.tzinfo)
+        mock_parse.assert_not_called()
+
+    def test_parse_datetime_fallback(self):
+        """parse_datetime() should use dateutil for the strings which
+        are not handled by the fast path
+        """
+        for string in ('Jul 12 2020 10:11', '2020-07-12T10:11:12.1234567Z', '20200712T101112'):
+            with self.subTest(string=string):
+                self.assertEqual(utils.parse_datetime(string), dateutil.parser.parse(string))
+
+    def test_parse_datetime_error(self):
+        """parse_datetime() should raise the same errors as dateutil"""
+        for string in ('2020-02-30', 'foo'):
+            with self.subTest(string=string):
+                with self.assertRaises(dateutil.parser.ParserError):
+                    utils.parse_datetime(string)
+
 
 class UtilsTestCase(unittest.TestCase):
     """Test case for utils functions"""
+
+    def setUp(self):
+        utils.clear_vocabulary_caches()
+        self.addCleanup(utils.clear_vocabulary_caches)
+
     def test_dict_to_string(self):
         """dict_to_string() should return the proper representation"""
         self.assertEqual(
@@ -210,6 +302,19 @@ class UtilsTestCase(unittest.TestCase):
         with mock.patch("pythesint.json_vocabulary.JSONVocabulary.get_list", return_value=[]):
             self.assertIsNone(utils.gcmd_search('instrument', 'bar', ['qux']))
 
+    def test_gcmd_search_read_only(self):
+        """The results of the GCMD searches are shared between callers,
+        so they should be read-only copies of the vocabulary entries
+        """
+        entry = {'foo': 'bar', 'baz': 'qux'}
+        with mock.patch("pythesint.json_vocabulary.JSONVocabulary.get_list",
+                        return_value=[entry]):
+            result = utils.gcmd_search('instrument', 'bar')
+        self.assertIsInstance(result, utils.FrozenOrderedDict)
+        with self.assertRaises(TypeError):
+            result['foo'] = 'quux'
+        self.assertEqual(entry['foo'], 'bar')
+
     def test_restrict_gcmd_search(self):
         """Test restricting the results of a GCMD search using
         additional keywords. The keyword which restricts the search
@@ -223,26 +328,72 @@ class UtilsTestCase(unittest.TestCase):
             utils.restrict_gcmd_search(search_results, ['qux', 'grault']),
             [{'foo': 'bar', 'baz': 'qux', 'corge': 'grault'}])
 
+    STANDARD_NAME_INDEXES = {
+        'cf_standard_name': utils.GCMDIndex([{'standard_name': 'foo', 'description': 'cf'}]),
+        'wkv_variable': utils.GCMDIndex([{'standard_name': 'bar', 'description': 'wkv'}]),
+    }
+
     def test_get_cf_standard_name(self):
         """Test getting a standardized dataset parameter from the CF
         vocabulary
         """
-        placeholder = {'foo': 'bar'}
-        with mock.patch('pythesint.get_cf_standard_name', return_value=placeholder):
+        with mock.patch('metanorm.utils.get_gcmd_index',
+                        side_effect=self.STANDARD_NAME_INDEXES.get) as mock_get_index:
             self.assertEqual(
-                utils.get_cf_or_wkv_standard_name('baz'),
-                placeholder)
+                utils.get_cf_or_wkv_standard_name('foo'),
+                {'standard_name': 'foo', 'description': 'cf'})
+        mock_get_index.assert_called_once_with('cf_standard_name')
 
     def test_get_wkv_standard_name(self):
         """Test getting a standardized dataset parameter from the well
         known vocabularies
         """
-        placeholder = {'foo': 'bar'}
-        with mock.patch('pythesint.get_cf_standard_name', side_effect=IndexError), \
-                mock.patch('pythesint.get_wkv_variable', return_value=placeholder):
+        with mock.patch('metanorm.utils.get_gcmd_index',
+                        side_effect=self.STANDARD_NAME_INDEXES.get):
             self.assertEqual(
-                utils.get_cf_or_wkv_standard_name('baz'),
-                placeholder)
+                utils.get_cf_or_wkv_standard_name('bar'),
+                {'standard_name': 'bar', 'description': 'wkv'})
+
+    def test_get_standard_name_not_found(self):
+        """An IndexError should be raised if the name is in neither
+        vocabulary
+        """
+        with mock.patch('metanorm.utils.get_gcmd_index',
+                        side_effect=self.STANDARD_NAME_INDEXES.get):
+            with self.assertRaises(IndexError):
+                utils.get_cf_or_wkv_standard_name('baz')
+
+    def test_get_standard_name_read_only(self):
+        """The cached standard names are shared between callers, so
+        they should be read-only copies of the vocabulary entries
+        """
+        with mock.patch('metanorm.utils.get_gcmd_index',
+                        side_effect=self.STANDARD_NAME_INDEXES.get):
+            result = utils.get_cf_or_wkv_standard_name('foo')
+        self.assertIsInstance(result, utils.FrozenOrderedDict)
+        with self.assertRaises(TypeError):
+            result['description'] = 'bar'
+        self.assertEqual(self.STANDARD_NAME_INDEXES['cf_standard_name'].get('foo'),
+                         {'standard_name': 'foo', 'description': 'cf'})
+
+    def test_resolve_standard_names(self):
+        """resolve_standard_names() should look up each distinct name
+        once and associate the unknown names with None
+        """
+        with mock.patch('metanorm.utils.get_gcmd_index',
+                        side_effect=self.STANDARD_NAME_INDEXES.get) as mock_get_index:
+            self.assertDictEqual(
+                utils.resolve_standard_names(['foo', 'baz', 'bar', 'foo', 'baz']),
+                {
+                    'foo': {'standard_name': 'foo', 'description': 'cf'},
+                    'bar': {'standard_name': 'bar', 'description': 'wkv'},
+                    'baz': None,
+                })
+            # foo: cf, bar: cf + wkv, baz: cf + wkv
+            self.assertEqual(mock_get_index.call_count, 5)
+            # the results, including the misses, are cached
+            utils.resolve_standard_names(['baz', 'bar'])
+            self.assertEqual(mock_get_index.call_count, 5)
 
     def test_raises_decorator(self):
         """Test that the `raises()` decorator raises a
@@ -258,6 +409,9 @@ class UtilsTestCase(unittest.TestCase):
         with self.assertRaises(errors.MetadataNormalizationError) as raised:
             get_foo(mock.Mock(), {})
         self.assertIsInstance(raised.exception.__cause__, KeyError)
+        self.assertEqual(raised.exception.getter_name, 'get_foo')
+        self.assertEqual(str(raised.exception),
+                         'get_foo was unable to process the following metadata: {}')
 
     def test_raises_decorator_with_tuple(self):
         """Test that the `raises()` decorator raises a
@@ -362,6 +516,32 @@ class UtilsTestCase(unittest.TestCase):
             utils.split_multipolygon_along_idl(multipolygon),
             multipolygon)
 
+    def test_split_multipolygons_along_idl(self):
+        """Test splitting a batch of multipolygons along the IDL"""
+        crossing = shapely.geometry.MultiPolygon([
+            ([(-170, 80), (-170, 90), (170, 90), (170, 80), (-170, 80)], [])
+        ])
+        not_crossing = shapely.geometry.MultiPolygon([
+            ([(10, 80), (10, 90), (20, 80), (10, 80)], [])
+        ])
+        world = shapely.geometry.MultiPolygon([
+            ([(-180, 90), (-180, -90), (180, -90), (180, 90), (-180, 90)], [])
+        ])
+        self.assertListEqual(
+            utils.split_multipolygons_along_idl([crossing, world, not_crossing]),
+            [
+                shapely.geometry.MultiPolygon([
+                    ([(-180, 90), (-170, 90), (-170, 80), (-180, 80), (-180, 90)], []),
+                    ([(180, 80), (170, 80), (170, 90), (180, 90), (180, 80)], []),
+                ]),
+                world,
+                not_crossing,
+            ])
+
+    def test_split_multipolygons_along_idl_empty(self):
+        """An empty batch should give an empty result"""
+        self.assertListEqual(utils.split_multipolygons_along_idl([]), [])
+
     def test_create_parameter_list(self):
         """Test creating a parameter list from a list of names"""
         def get_cf_or_wkv_standard_name_side_effect(name):
@@ -370,11 +550,624 @@ class UtilsTestCase(unittest.TestCase):
 
         with mock.patch('metanorm.utils.get_cf_or_wkv_standard_name',
                         side_effect=get_cf_or_wkv_standard_name_side_effect):
-            self.assertListEqual(
+            self.assertTupleEqual(
                 utils.create_parameter_list(('foo', 'bar')),
-                [{'long_name': 'foo'}, {'long_name': 'bar'}]
+                ({'long_name': 'foo'}, {'long_name': 'bar'})
             )
 
+    def test_create_parameter_list_shared(self):
+        """The same read-only parameter list should be returned for
+        the same names, whatever the type of the sequence of names
+        """
+        with mock.patch('metanorm.utils.get_cf_or_wkv_standard_name',
+                        return_value={'standard_name': 'foo'}) as mock_get_standard_name:
+            parameters = utils.create_parameter_list(('foo',))
+            self.assertIs(utils.create_parameter_list(['foo']), parameters)
+        mock_get_standard_name.assert_called_once_with('foo')
+        self.assertIsInstance(parameters[0], utils.FrozenOrderedDict)
+        with self.assertRaises(TypeError):
+            parameters[0]['standard_name'] = 'bar'
+
+    def test_create_parameter_list_copy(self):
+        """If copy_result is True, a list of modifiable copies should
+        be returned
+        """
+        with mock.patch('metanorm.utils.get_cf_or_wkv_standard_name',
+                        return_value={'standard_name': 'foo'}):
+            parameters = utils.create_parameter_list(('foo',), copy_result=True)
+            parameters[0]['standard_name'] = 'bar'
+            parameters.append({})
+            self.assertTupleEqual(
+                utils.create_parameter_list(('foo',)), ({'standard_name': 'foo'},))
+
+    def test_frozen_ordered_dict(self):
+        """A FrozenOrderedDict should keep the order of its items,
+        refuse modifications, and survive pickling and copying
+        """
+        frozen = utils.FrozenOrderedDict([('b', 1), ('a', 2)], c=3)
+        self.assertListEqual(list(frozen.items()), [('b', 1), ('a', 2), ('c', 3)])
+        for modify in (lambda d: d.__setitem__('a', 0), lambda d: d.__delitem__('a'),
+                       lambda d: d.update(a=0), lambda d: d.pop('a'), lambda d: d.popitem(),
+                       lambda d: d.setdefault('d', 0), lambda d: d.move_to_end('a'),
+                       lambda d: d.clear()):
+            with self.assertRaises(TypeError):
+                modify(frozen)
+        for copied in (pickle.loads(pickle.dumps(frozen)), copy.copy(frozen),
+                       copy.deepcopy(frozen)):
+            self.assertIsInstance(copied, utils.FrozenOrderedDict)
+            self.assertEqual(copied, frozen)
+
+
+class CacheTestCase(unittest.TestCase):
+    """Tests for the caching utilities"""
+
+    def test_lru_cache_eviction(self):
+        """The least recently used item should be evicted when the
+        cache is full
+        """
+        cache = utils.LRUCache(maxsize=2)
+        cache.set('foo', 1)
+        cache.set('bar', 2)
+        self.assertTupleEqual(cache.get('foo'), (True, 1))
+        cache.set('baz', 3)
+        self.assertTupleEqual(cache.get('bar'), (False, None))
+        self.assertTupleEqual(cache.get('foo'), (True, 1))
+        self.assertTupleEqual(cache.get('baz'), (True, 3))
+        self.assertEqual(cache.info(), utils.CacheInfo(hits=3, misses=1, maxsize=2, currsize=2))
+
+    def test_lru_cache_ttl(self):
+        """Items should expire after `ttl` seconds"""
+        cache = utils.LRUCache(ttl=10)
+        with mock.patch('time.monotonic', return_value=100):
+            cache.set('foo', 1)
+        with mock.patch('time.monotonic', return_value=109):
+            self.assertTupleEqual(cache.get('foo'), (True, 1))
+        with mock.patch('time.monotonic', return_value=110):
+            self.assertTupleEqual(cache.get('foo'), (False, None))
+        self.assertEqual(cache.info().currsize, 0)
+
+    def test_lru_cache_clear(self):
+        """clear() should remove all items and reset the statistics"""
+        cache = utils.LRUCache()
+        cache.set('foo', 1)
+        cache.get('foo')
+        cache.clear()
+        self.assertEqual(cache.info(), utils.CacheInfo(hits=0, misses=0, maxsize=1024, currsize=0))
+
+    def test_memoize(self):
+        """The results should be cached depending on the arguments,
+        lists being considered equal to tuples
+        """
+        mock_function = mock.Mock(side_effect=lambda *args, **kwargs: len(args) + len(kwargs))
+        memoized = utils.memoize()(mock_function)
+        self.assertEqual(memoized('foo', ['bar', 'baz']), 2)
+        self.assertEqual(memoized('foo', ('bar', 'baz')), 2)
+        self.assertEqual(memoized('foo', bar='baz'), 2)
+        self.assertEqual(memoized('foo', bar='baz'), 2)
+        self.assertEqual(mock_function.call_count, 2)
+        self.assertEqual(memoized.cache_info().hits, 2)
+
+        memoized.cache_clear()
+        memoized('foo', ['bar', 'baz'])
+        self.assertEqual(mock_function.call_count, 3)
+
+    def test_memoize_unhashable_argument(self):
+        """Calls with unhashable arguments should not be cached"""
+        mock_function = mock.Mock(return_value='foo')
+        memoized = utils.memoize()(mock_function)
+        self.assertEqual(memoized({'bar': 'baz'}), 'foo')
+        self.assertEqual(memoized({'bar': 'baz'}), 'foo')
+        self.assertEqual(mock_function.call_count, 2)
+
+    def test_memoize_cached_exceptions(self):
+        """Exceptions listed in `cached_exceptions` should be cached,
+        the others should not
+        """
+        mock_function = mock.Mock(side_effect=(IndexError('foo'), ValueError, ValueError))
+        memoized = utils.memoize(cached_exceptions=IndexError)(mock_function)
+        for _ in range(2):
+            with self.assertRaises(IndexError) as raised:
+                memoized('foo')
+            self.assertTupleEqual(raised.exception.args, ('foo',))
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                memoized('bar')
+        self.assertEqual(mock_function.call_count, 3)
+
+    def test_memoize_copy_result(self):
+        """A copy of the cached result should be returned if
+        `copy_result` is True
+        """
+        memoized = utils.memoize(copy_result=True)(lambda name: [name])
+        result = memoized('foo')
+        result.append('bar')
+        self.assertListEqual(memoized('foo'), ['foo'])
+
+    def test_clear_vocabulary_caches(self):
+        """clear_vocabulary_caches() should clear the vocabulary
+        indexes and the memoized vocabulary functions
+        """
+        with mock.patch('metanorm.utils.clear_gcmd_indexes') as mock_clear_indexes, \
+                mock.patch.object(utils.gcmd_search, 'cache_clear') as mock_cache_clear:
+            utils.clear_vocabulary_caches()
+        mock_clear_indexes.assert_called_once_with()
+        mock_cache_clear.assert_called_once_with()
+
+
+class RecordContextTestCase(unittest.TestCase):
+    """Tests for the per-record cache"""
+
+    def setUp(self):
+        self.function = mock.Mock(side_effect=lambda *args: object())
+        self.cached_function = utils.per_record(self.function)
+
+    def test_cached_in_context(self):
+        """The results should be cached inside a record context"""
+        with utils.record_context():
+            result = self.cached_function('foo')
+            self.assertIs(self.cached_function('foo'), result)
+            self.assertIsNot(self.cached_function('bar'), result)
+        self.assertEqual(self.function.call_count, 2)
+
+    def test_not_cached_outside_context(self):
+        """The function should be called every time outside of a
+        record context
+        """
+        self.cached_function('foo')
+        self.cached_function('foo')
+        self.assertEqual(self.function.call_count, 2)
+
+    def test_cache_reset_between_contexts(self):
+        """Each record context should have its own cache"""
+        with utils.record_context():
+            self.cached_function('foo')
+        with utils.record_context():
+            self.cached_function('foo')
+        self.assertEqual(self.function.call_count, 2)
+
+    def test_nested_contexts(self):
+        """Nested contexts should share the outermost cache"""
+        with utils.record_context():
+            result = self.cached_function('foo')
+            with utils.record_context():
+                self.assertIs(self.cached_function('foo'), result)
+        self.function.assert_called_once_with('foo')
+
+    def test_unhashable_arguments(self):
+        """Functions called with unhashable arguments should not be
+        cached
+        """
+        with utils.record_context():
+            self.cached_function(['foo'])
+            self.cached_function(['foo'])
+        self.assertEqual(self.function.call_count, 2)
+
+    def test_exceptions_not_cached(self):
+        """Exceptions should not be cached"""
+        self.function.side_effect = (ValueError, 'foo')
+        with utils.record_context():
+            with self.assertRaises(ValueError):
+                self.cached_function('foo')
+            self.assertEqual(self.cached_function('foo'), 'foo')
+
+    def test_regex_search(self):
+        """regex_search() should search the pattern once per record"""
+        matcher = mock.Mock()
+        with utils.record_context():
+            utils.regex_search(matcher, 'foo')
+            utils.regex_search(matcher, 'foo')
+        matcher.search.assert_called_once_with('foo')
+
+
+class GCMDIndexTestCase(unittest.TestCase):
+    """Tests for the GCMDIndex class"""
+
+    ENTRIES = [
+        OrderedDict([('Category', 'Earth Observation Satellites'), ('Series_Entity', ''),
+                     ('Short_Name', ''), ('Long_Name', '')]),
+        OrderedDict([('Category', 'Earth Observation Satellites'), ('Series_Entity', 'Sentinel-1'),
+                     ('Short_Name', 'Sentinel-1A'), ('Long_Name', '')]),
+        OrderedDict([('Category', 'Earth Observation Satellites'), ('Series_Entity', 'Sentinel-1'),
+                     ('Short_Name', 'Sentinel-1B'), ('Long_Name', '')]),
+        OrderedDict([('Category', 'Earth Observation Satellites'), ('Series_Entity', 'Sentinel-1'),
+                     ('Short_Name', ''), ('Long_Name', '')]),
+        OrderedDict([('Category', 'In Situ Ocean-based Platforms'), ('Series_Entity', ''),
+                     ('Short_Name', 'SHIPS'), ('Long_Name', '')]),
+        OrderedDict([('Category', 'In Situ Ocean-based Platforms'), ('Series_Entity', ''),
+                     ('Short_Name', 'SHIPS'), ('Long_Name', '')]),
+    ]
+
+    def setUp(self):
+        self.index = utils.GCMDIndex(self.ENTRIES)
+        # reference implementation
+        self.vocabulary = pythesint.vocabulary.Vocabulary('test')
+        self.vocabulary.get_list = lambda: self.ENTRIES
+
+    def test_get(self):
+        """get() should return the same entry as pythesint"""
+        for keyword in ('Earth Observation Satellites', 'sentinel-1', 'Sentinel-1B', 'ships'):
+            with self.subTest(keyword=keyword):
+                self.assertIs(self.index.get(keyword), self.vocabulary.find_keyword(keyword))
+
+    def test_search_index_built_on_demand(self):
+        """The search index should only be built by the first search"""
+        self.assertIsNone(self.index._ngrams)
+        self.index.search('sentinel')
+        ngrams = self.index._ngrams
+        self.assertIsNotNone(ngrams)
+        self.index.search('ships')
+        self.assertIs(self.index._ngrams, ngrams)
+
+    def test_get_not_found(self):
+        """get() should raise an IndexError when nothing matches"""
+        with self.assertRaises(IndexError):
+            self.index.get('Sentinel')
+
+    def test_search(self):
+        """search() should return the same entries as pythesint"""
+        for keyword in ('sentinel', 'Sentinel-1A', 'SATELLITES', 'ships', 'IN', '', 'foo'):
+            with self.subTest(keyword=keyword):
+                self.assertListEqual(self.index.search(keyword), self.vocabulary.search(keyword))
+
+    def test_from_vocabulary(self):
+        """The index should be built from the pythesint vocabulary"""
+        with mock.patch("pythesint.json_vocabulary.JSONVocabulary.get_list",
+                        return_value=self.ENTRIES):
+            index = utils.GCMDIndex.from_vocabulary('gcmd_platform')
+        self.assertListEqual(index.entries, self.ENTRIES)
+
+    def test_get_gcmd_index(self):
+        """get_gcmd_index() should build an index once and keep it
+        until clear_gcmd_indexes() is called
+        """
+        utils.clear_gcmd_indexes()
+        self.addCleanup(utils.clear_gcmd_indexes)
+        with mock.patch('metanorm.utils.GCMDIndex.from_vocabulary') as mock_from_vocabulary:
+            self.assertIs(
+                utils.get_gcmd_index('gcmd_platform'),
+                utils.get_gcmd_index('gcmd_platform'))
+            mock_from_vocabulary.assert_called_once_with('gcmd_platform')
+            utils.clear_gcmd_indexes()
+            utils.get_gcmd_index('gcmd_platform')
+            self.assertEqual(mock_from_vocabulary.call_count, 2)
+
+
+class VocabularySnapshotTestCase(unittest.TestCase):
+    """Tests for the vocabulary snapshot functions"""
+
+    STANDARD_NAMES = {
+        'cf_standard_name': [
+            {'standard_name': 'sea_ice_area_fraction', 'canonical_units': '1', 'description': ''},
+        ],
+        'wkv_variable': [
+            {'standard_name': 'surface_backwards_scattering_coefficient_of_radar_wave',
+             'canonical_units': 'm/m', 'description': ''},
+        ],
+    }
+
+    def setUp(self):
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.directory = temporary_directory.name
+        self.snapshot_path = os.path.join(self.directory, 'snapshot.pickle')
+
+        self.vocabulary_paths = {}
+        for name in ('gcmd_platform', 'gcmd_instrument', 'gcmd_provider'):
+            self.vocabulary_paths[name] = os.path.join(self.directory, f"{name}_list.json")
+            self.write_vocabulary(name, GCMDIndexTestCase.ENTRIES)
+        for name in ('cf_standard_name', 'wkv_variable'):
+            self.vocabulary_paths[name] = os.path.join(self.directory, f"{name}_list.json")
+            self.write_vocabulary(name, self.STANDARD_NAMES[name])
+
+        get_filepath_patcher = mock.patch(
+            'pythesint.json_vocabulary.JSONVocabulary.get_filepath', autospec=True,
+            side_effect=lambda vocabulary: self.vocabulary_paths[vocabulary.name])
+        get_list_patcher = mock.patch(
+            'pythesint.json_vocabulary.JSONVocabulary.get_list', autospec=True,
+            side_effect=lambda vocabulary: self.read_vocabulary(vocabulary.name))
+        self.mock_get_list = get_list_patcher.start()
+        get_filepath_patcher.start()
+        self.addCleanup(mock.patch.stopall)
+
+        utils.clear_gcmd_indexes()
+        self.addCleanup(utils.clear_gcmd_indexes)
+
+    def write_vocabulary(self, name, entries):
+        """Writes a vocabulary file"""
+        with open(self.vocabulary_paths[name], 'w') as vocabulary_file:
+            json.dump(entries, vocabulary_file)
+
+    def read_vocabulary(self, name):
+        """Reads a vocabulary file"""
+        with open(self.vocabulary_paths[name]) as vocabulary_file:
+            return json.load(vocabulary_file, object_pairs_hook=OrderedDict)
+
+    def build_snapshot(self):
+        """Builds a snapshot of the test vocabularies"""
+        return utils.build_vocabulary_snapshot(
+            self.snapshot_path, ('gcmd_platform', 'gcmd_instrument'))
+
+    def test_build_and_load(self):
+        """The indexes loaded from a snapshot should be used without
+        reading the vocabularies
+        """
+        self.build_snapshot()
+        utils.clear_gcmd_indexes()
+        self.mock_get_list.reset_mock()
+
+        self.assertTrue(utils.load_vocabulary_snapshot(self.snapshot_path))
+        self.assertListEqual(
+            utils.get_gcmd_index('gcmd_platform').entries, GCMDIndexTestCase.ENTRIES)
+        self.assertEqual(
+            utils.get_gcmd_index('gcmd_instrument').get('sentinel-1'),
+            GCMDIndexTestCase.ENTRIES[3])
+        self.mock_get_list.assert_not_called()
+
+    def test_standard_names_from_snapshot(self):
+        """The CF and well known variables vocabularies should be part
+        of the default snapshot, so that the dataset parameters are
+        looked up without reading them
+        """
+        utils.build_vocabulary_snapshot(self.snapshot_path)
+        utils.clear_vocabulary_caches()
+        self.addCleanup(utils.clear_vocabulary_caches)
+        self.mock_get_list.reset_mock()
+
+        self.assertTrue(utils.load_vocabulary_snapshot(self.snapshot_path))
+        with mock.patch('pythesint.get_cf_standard_name_list') as mock_get_cf_list:
+            self.assertEqual(
+                utils.get_cf_or_wkv_standard_name('sea_ice_area_fraction'),
+                self.STANDARD_NAMES['cf_standard_name'][0])
+            self.assertEqual(
+                utils.get_cf_or_wkv_standard_name(
+                    'surface_backwards_scattering_coefficient_of_radar_wave'),
+                self.STANDARD_NAMES['wkv_variable'][0])
+        mock_get_cf_list.assert_not_called()
+        self.mock_get_list.assert_not_called()
+
+    def test_content_hash(self):
+        """The snapshot version should only depend on the contents of
+        the vocabularies
+        """
+        content_hash = self.build_snapshot()
+        self.assertEqual(self.build_snapshot(), content_hash)
+        self.write_vocabulary('gcmd_platform', GCMDIndexTestCase.ENTRIES[:2])
+        self.assertNotEqual(self.build_snapshot(), content_hash)
+
+    def test_load_missing_snapshot(self):
+        """Loading a snapshot which does not exist should return False
+        """
+        self.assertFalse(utils.load_vocabulary_snapshot(self.snapshot_path))
+
+    def test_load_unreadable_snapshot(self):
+        """Loading an empty or truncated snapshot should return False,
+        so that ensure_vocabulary_snapshot() builds it again
+        """
+        self.build_snapshot()
+        with open(self.snapshot_path, 'rb') as snapshot_file:
+            snapshot_contents = snapshot_file.read()
+        for name, contents in (('empty', b''), ('truncated', snapshot_contents[:100])):
+            with self.subTest(name):
+                with open(self.snapshot_path, 'wb') as snapshot_file:
+                    snapshot_file.write(contents)
+                self.assertFalse(utils.load_vocabulary_snapshot(self.snapshot_path))
+
+        with mock.patch('metanorm.utils.build_vocabulary_snapshot',
+                        side_effect=utils.build_vocabulary_snapshot) as mock_build:
+            utils.ensure_vocabulary_snapshot(self.snapshot_path, ('gcmd_platform',))
+        mock_build.assert_called_once()
+        self.assertTrue(utils.load_vocabulary_snapshot(self.snapshot_path))
+
+    def test_load_outdated_snapshot(self):
+        """A snapshot should not be loaded if the vocabularies changed
+        since it was built
+        """
+        self.build_snapshot()
+        self.write_vocabulary('gcmd_platform', GCMDIndexTestCase.ENTRIES[:2])
+        with mock.patch('metanorm.utils._GCMD_INDEXES', {}) as indexes:
+            self.assertFalse(utils.load_vocabulary_snapshot(self.snapshot_path))
+        self.assertDictEqual(indexes, {})
+
+    def test_load_touched_vocabulary(self):
+        """A snapshot should still be loaded if a vocabulary file was
+        rewritten with the same contents
+        """
+        self.build_snapshot()
+        stat = os.stat(self.vocabulary_paths['gcmd_platform'])
+        os.utime(self.vocabulary_paths['gcmd_platform'],
+                 ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with mock.patch('metanorm.utils._hash_vocabularies',
+                        side_effect=utils._hash_vocabularies) as mock_hash:
+            self.assertTrue(utils.load_vocabulary_snapshot(self.snapshot_path))
+        mock_hash.assert_called_once()
+
+    def test_load_missing_vocabulary(self):
+        """A snapshot should stand in for vocabulary files which do not
+        exist
+        """
+        self.build_snapshot()
+        os.remove(self.vocabulary_paths['gcmd_platform'])
+        self.assertTrue(utils.load_vocabulary_snapshot(self.snapshot_path))
+
+    def test_ensure_vocabulary_snapshot(self):
+        """ensure_vocabulary_snapshot() should only build the snapshot
+        if it cannot be loaded
+        """
+        with mock.patch('metanorm.utils.build_vocabulary_snapshot',
+                        side_effect=utils.build_vocabulary_snapshot) as mock_build:
+            utils.ensure_vocabulary_snapshot(self.snapshot_path, ('gcmd_platform',))
+            utils.ensure_vocabulary_snapshot(self.snapshot_path, ('gcmd_platform',))
+        mock_build.assert_called_once()
+        self.assertTrue(os.path.exists(self.snapshot_path))
+
+
+class PrefixTableTestCase(unittest.TestCase):
+    """Tests for the PrefixTable class"""
+
+    def setUp(self):
+        self.table = utils.PrefixTable((
+            ('ftp://foo/', 1),
+            ('ftp://foo/bar/', 2),
+            ('ftp://foo/bar/', 3),
+            ('ftp://foo/baz/', 4),
+            ('https://qux/', 5),
+        ))
+
+    def test_find_all(self):
+        """find_all() should return the values of all the prefixes of
+        a string, longest prefix first
+        """
+        self.assertListEqual(self.table.find_all('ftp://foo/bar/quux.nc'), [2, 3, 1])
+        self.assertListEqual(self.table.find_all('ftp://foo/baz/quux.nc'), [4, 1])
+        self.assertListEqual(self.table.find_all('ftp://foo/bax/quux.nc'), [1])
+        self.assertListEqual(self.table.find_all('https://qux/'), [5])
+        self.assertListEqual(self.table.find_all('https://quux/'), [])
+        self.assertListEqual(self.table.find_all(''), [])
+
+    def test_find(self):
+        """find() should return the first value of the longest prefix,
+        or the default value
+        """
+        self.assertEqual(self.table.find('ftp://foo/bar/quux.nc'), 2)
+        self.assertEqual(self.table.find('ftp://foo/quux.nc'), 1)
+        self.assertIsNone(self.table.find('ftp://bar'))
+        self.assertEqual(self.table.find('ftp://bar', 'default'), 'default')
+
+    def test_add_after_lookup(self):
+        """Prefixes added after a lookup should be taken into account"""
+        self.assertListEqual(self.table.find_all('ftp://foo/bar/quux.nc'), [2, 3, 1])
+        self.table.add('ftp://', 6)
+        self.table.add('ftp://foo/bar/quux', 7)
+        self.assertListEqual(self.table.find_all('ftp://foo/bar/quux.nc'), [7, 2, 3, 1, 6])
+        self.assertEqual(len(self.table), 6)
+
+
+class SubstringTableTestCase(unittest.TestCase):
+    """Tests for the SubstringTable class"""
+
+    def setUp(self):
+        self.table = utils.SubstringTable((
+            ('_east', 1),
+            ('_west', 2),
+            ('US_', 3),
+        ))
+
+    def test_find_all(self):
+        """find_all() should return the values of all the substrings
+        of a string, in the order in which they were added
+        """
+        self.assertListEqual(self.table.find_all('ftp://foo/bar_US_west.nc'), [2, 3])
+        self.assertListEqual(self.table.find_all('ftp://foo/bar_alaska.nc'), [])
+
+    def test_find(self):
+        """find() should return the value of the first added
+        substring, or the default value
+        """
+        self.assertEqual(self.table.find('ftp://foo/bar_US_east.nc'), 1)
+        self.assertEqual(self.table.find('ftp://foo/US_bar.nc'), 3)
+        self.assertIsNone(self.table.find('ftp://foo/bar_alaska.nc'))
+        self.assertEqual(self.table.find('ftp://foo/bar_alaska.nc', 'default'), 'default')
+
+    def test_add(self):
+        """Substrings added later should be tested last"""
+        self.table.add('foo', 4)
+        self.assertEqual(self.table.find('ftp://foo/bar.nc'), 4)
+        self.assertEqual(self.table.find('ftp://foo/bar_US_west.nc'), 2)
+        self.assertEqual(len(self.table), 4)
+
+
+class WarningCollectorTestCase(unittest.TestCase):
+    """Tests for the WarningCollector class"""
+
+    def setUp(self):
+        self.logger = logging.getLogger('metanorm.tests.warnings')
+        self.collector = utils.WarningCollector(self.logger, "'%s' is unknown", summary_interval=60)
+        self.addCleanup(utils._WARNING_COLLECTORS.remove, self.collector)
+
+    def test_first_occurrence_logged(self):
+        """Only the first occurrence of a name for a source should be
+        logged right away
+        """
+        with self.assertLogs(self.logger, level=logging.WARNING) as logs:
+            self.collector.add('A', 'foo')
+            self.collector.add('A', 'foo')
+            self.collector.add('B', 'foo')
+            self.collector.add('A', 'bar')
+        self.assertListEqual(
+            [record.getMessage() for record in logs.records],
+            ["A: 'foo' is unknown", "B: 'foo' is unknown", "A: 'bar' is unknown"])
+
+    def test_flush(self):
+        """flush() should log one summary of the occurrences counted
+        since the previous summary
+        """
+        for _ in range(3):
+            self.collector.add('A', 'foo')
+        with self.assertLogs(self.logger, level=logging.WARNING) as logs:
+            self.collector.flush()
+        self.assertListEqual(
+            [record.getMessage() for record in logs.records],
+            ["Repeated warnings since the last summary:\nA: 'foo' is unknown x2"])
+        with mock.patch.object(self.logger, 'warning') as mock_warning:
+            self.collector.flush()
+        mock_warning.assert_not_called()
+
+    def test_periodic_summary(self):
+        """A summary should be logged when an occurrence is added more
+        than summary_interval seconds after the previous summary
+        """
+        self.collector.add('A', 'foo')
+        with mock.patch('time.monotonic', return_value=time.monotonic() + 61), \
+                self.assertLogs(self.logger, level=logging.WARNING) as logs:
+            self.collector.add('A', 'foo')
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("A: 'foo' is unknown x1", logs.records[0].getMessage())
+
+    def test_get_counts(self):
+        """get_counts() should return the number of occurrences per
+        source and name since the last summary, reset() should forget
+        them
+        """
+        for source, name in (('A', 'foo'), ('A', 'foo'), ('A', 'bar'), ('B', 'foo')):
+            self.collector.add(source, name)
+        self.assertDictEqual(
+            self.collector.get_counts(),
+            {'A': {'foo': 2, 'bar': 1}, 'B': {'foo': 1}})
+        self.collector.reset()
+        self.assertDictEqual(self.collector.get_counts(), {})
+
+    def test_counts_reset_after_summary(self):
+        """The counts should be reset by each summary, so that the
+        first occurrence of a name is logged again afterwards
+        """
+        self.collector.add('A', 'foo')
+        self.collector.flush()
+        self.assertDictEqual(self.collector.get_counts(), {})
+        with self.assertLogs(self.logger, level=logging.WARNING) as logs:
+            self.collector.add('A', 'foo')
+        self.assertListEqual(
+            [record.getMessage() for record in logs.records], ["A: 'foo' is unknown"])
+
+    def test_flush_warning_collectors(self):
+        """flush_warning_collectors() should flush all the collectors"""
+        with mock.patch.object(self.collector, 'flush') as mock_flush:
+            utils.flush_warning_collectors()
+        mock_flush.assert_called_once_with()
+
+    def test_flush_due_warning_collectors(self):
+        """flush_warning_collectors(due_only=True) should only flush
+        the collectors whose summary is due
+        """
+        self.collector.add('A', 'foo')
+        self.collector.add('A', 'foo')
+        with mock.patch.object(self.logger, 'warning') as mock_warning:
+            utils.flush_warning_collectors(due_only=True)
+        mock_warning.assert_not_called()
+        with mock.patch('time.monotonic', return_value=time.monotonic() + 61), \
+                self.assertLogs(self.logger, level=logging.WARNING) as logs:
+            utils.flush_warning_collectors(due_only=True)
+        self.assertIn("A: 'foo' is unknown x1", logs.records[0].getMessage())
+
 
 class SubclassesTestCase(unittest.TestCase):
     """Tests for utility functions dealing with subclasses"""
@@ -419,3 +1212,41 @@ class SubclassesTestCase(unittest.TestCase):
             package__all__ = []
             utils.export_subclasses(package__all__, 'package', '/foo/package', self.Base)
         self.assertCountEqual(package__all__, ['Base', 'A', 'B', 'C', 'D'])
+
+
+class ImportTestCase(unittest.TestCase):
+    """Check that importing metanorm does not import heavy
+    dependencies
+    """
+
+    HEAVY_MODULES = ('pythesint', 'shapely', 'numpy', 'dateutil')
+
+    @staticmethod
+    def import_module(module_name):
+        """Imports a module in a new interpreter and returns the
+        imported modules
+        """
+        process = subprocess.run(
+            [sys.executable, '-c', f"import sys, {module_name}; print(' '.join(sys.modules))"],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True,
+            universal_newlines=True)
+        return set(process.stdout.split())
+
+    def test_heavy_modules_not_imported(self):
+        """The heavy dependencies should be imported when they are
+        needed, not when metanorm is imported
+        """
+        for module_name in ('metanorm.utils', 'metanorm.normalizers',
+                            'metanorm.normalizers.geospaas', 'metanorm.handlers'):
+            with self.subTest(module_name=module_name):
+                imported_modules = self.import_module(module_name)
+                self.assertFalse(
+                    {name.split('.')[0] for name in imported_modules}.intersection(
+                        self.HEAVY_MODULES))
+
+    def test_deferred_imports(self):
+        """The accessor functions should return the modules"""
+        self.assertIs(utils._import_pythesint(), pythesint)
+        self.assertIs(utils._import_shapely(), shapely)
+        self.assertIs(utils._import_numpy(), numpy)
+        self.assertIs(utils._import_dateutil(), dateutil)